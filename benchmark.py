@@ -0,0 +1,623 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function
+
+import argparse
+import collections
+import glob
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import ply.lex as lex
+
+from compiler import compile_python, compile_source, expand_inputs, get_parser
+from lya_optimizer import optimize
+import lya_io
+import lya_ast
+import lya_tables
+from interpreter import Interpreter
+from StringIO import StringIO
+from lya_lex import LyaLexer
+from lya_parser import LyaParser
+
+
+# loop-heavy program used to measure the interpreter
+LOOP_PROGRAM = """
+dcl i, s, c int;
+s = 0;
+c = 0;
+do
+  for i = 1 to %d;
+    s = s + i * 2 - i %% 5;
+    if s > i then
+      c += 1;
+    fi;
+od;
+print(s, c);
+"""
+
+# fills an array with values that are not small cached integers
+ARRAY_PROGRAM = """
+dcl a array[1:%d] int;
+dcl i, s int;
+s = 0;
+do
+  for i = 1 to %d;
+    a[i] = i * 1000;
+od;
+do
+  for i = 1 to %d;
+    s = s + a[i];
+od;
+print(s);
+"""
+
+# calls a recursive procedure from a loop
+CALL_PROGRAM = """
+f: proc (n int) returns (int);
+  if n < 2 then result 1; else result n * f(n - 1); fi;
+end;
+dcl i, s int = 0;
+do
+  for i = 1 to %d;
+    s += f(10) / 1000;
+od;
+print(s);
+"""
+
+# opcodes that used to be executed through eval()
+BINARY_OPERATORS = [
+    ('add', '+'), ('sub', '-'), ('mul', '*'), ('div', '/'), ('mod', '%'),
+    ('les', '<'), ('leq', '<='), ('grt', '>'), ('gre', '>='),
+    ('equ', '=='), ('neq', '!='), ('and', 'and'), ('or', 'or'),
+]
+
+
+class CountingInterpreter(Interpreter):
+    def __init__(self, *args, **kwargs):
+        super(CountingInterpreter, self).__init__(*args, **kwargs)
+        self.executed = 0
+
+    def exec_op(self, row):
+        self.executed += 1
+        super(CountingInterpreter, self).exec_op(row)
+
+
+class ProfilingInterpreter(CountingInterpreter):
+    # counts the sequences of two and three instructions executed
+    def __init__(self, *args, **kwargs):
+        super(ProfilingInterpreter, self).__init__(*args, **kwargs)
+        self.pairs = collections.Counter()
+        self.triples = collections.Counter()
+        self._last = ('', '')
+
+    def exec_op(self, row):
+        self.pairs[self._last[1], row[0]] += 1
+        self.triples[self._last + (row[0],)] += 1
+        self._last = (self._last[1], row[0])
+        super(ProfilingInterpreter, self).exec_op(row)
+
+
+class StepCountingInterpreter(Interpreter):
+    # counts the instructions executed by the dispatch and the registers engines
+    def __init__(self, *args, **kwargs):
+        super(StepCountingInterpreter, self).__init__(*args, **kwargs)
+        self.executed = 0
+
+    def _run_dispatch(self):
+        code = self._code
+        while self._running:
+            handler, row = code[self._pc]
+            handler(row)
+            self._pc += 1
+            self.executed += 1
+
+    def _run_registers(self):
+        code = self._registers
+        while self._running:
+            handler, row = code[self._pc]
+            handler(row)
+            self._pc += 1
+            self.executed += 1
+
+
+def compile_to_file(source, output, binary=False):
+    compile_source(source).save(output, binary)
+
+
+def run_program(file_name, engine='dispatch', interpreter_class=Interpreter, memory='list'):
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        i = interpreter_class(False, engine=engine, memory=memory)
+        i.load_file(file_name)
+        i.run()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    return i
+
+
+def bench_operators(repeat):
+    print("{:<6}{:>16}{:>16}{:>10}".format("op", "eval (ops/s)", "native (ops/s)", "speedup"))
+    for name, symbol in BINARY_OPERATORS:
+        # the result goes to M[0] so the operands stay the same between runs
+        setup = "M = [0, 7, 3]; sp = 2"
+        before = "M[sp - 2] = eval('{} %s {}'.format(M[sp - 1], M[sp]))" % symbol
+        after = "M[sp - 2] = M[sp - 1] %s M[sp]" % symbol
+        t_before = min(timeit.repeat(before, setup, number=repeat, repeat=3))
+        t_after = min(timeit.repeat(after, setup, number=repeat, repeat=3))
+        print("{:<6}{:>16.0f}{:>16.0f}{:>9.1f}x".format(name, repeat / t_before, repeat / t_after,
+                                                        t_before / t_after))
+
+
+def bench_interpreter(iterations):
+    fd, file_name = tempfile.mkstemp(suffix=".lya.o")
+    os.close(fd)
+    try:
+        compile_to_file(LOOP_PROGRAM % iterations, file_name)
+        executed = run_program(file_name, 'classic', CountingInterpreter).executed
+        print("loop of {} iterations: {} instructions".format(iterations, executed))
+        for engine in Interpreter.ENGINES:
+            elapsed = min(timeit.repeat(lambda: run_program(file_name, engine), number=1, repeat=3))
+            print("{:<10}{:>8.3f}s{:>12.0f} instructions/s".format(engine, elapsed, executed / elapsed))
+        # the same program compiled into Python code, in LVM instructions/s
+        program = compile_python(LOOP_PROGRAM % iterations)
+        elapsed = min(timeit.repeat(lambda: program.run(stdout=StringIO()), number=1, repeat=3))
+        print("{:<10}{:>8.3f}s{:>12.0f} instructions/s".format("python", elapsed, executed / elapsed))
+    finally:
+        os.remove(file_name)
+
+
+def bench_engines(folder, repeat=100):
+    # numbers for the programs that read
+    stdin = "5 3 7 2 9 1 4 5 6 7 8 9 1 2\n" * 5
+    print("{:<40}".format("run time of " + folder) +
+          "".join("{:>12}".format(e) for e in Interpreter.ENGINES + ("python",)) + "{:>12}".format("blocks x"))
+    # speedups of the blocks engine against the dispatch engine
+    speedups = []
+    # the other examples do not stop with this input
+    for f in sorted(glob.glob(os.path.join(folder, "email*.lya"))):
+        try:
+            program = compile_source(open(f).read(), optimized=True)
+        except Exception as e:
+            print("{:<40}{:>12}".format(f, type(e).__name__))
+            continue
+        times = []
+        for engine in Interpreter.ENGINES:
+            i = Interpreter(False, engine=engine, files=[], stdout=StringIO())
+            i.load_code(program.H, program.text)
+
+            def run():
+                i._input = lya_io.open_input(StringIO(stdin), i._output)
+                i.run()
+            try:
+                times.append(min(timeit.repeat(run, number=repeat, repeat=3)) / repeat)
+            except Exception as e:
+                times.append(type(e).__name__)
+        try:
+            python = compile_python(open(f).read())
+            times.append(min(timeit.repeat(lambda: python.run(StringIO(stdin), StringIO()),
+                                           number=repeat, repeat=3)) / repeat)
+        except Exception as e:
+            times.append(type(e).__name__)
+        dispatch, blocks = times[Interpreter.ENGINES.index('dispatch')], times[Interpreter.ENGINES.index('blocks')]
+        if isinstance(dispatch, float) and isinstance(blocks, float):
+            speedups.append(dispatch / blocks)
+            speedup = "{:>11.2f}x".format(speedups[-1])
+        else:
+            speedup = "{:>12}".format("-")
+        print("{:<40}".format(f) + "".join("{:>10.1f}us".format(1e6 * t) if isinstance(t, float) else
+                                           "{:>12}".format(t) for t in times) + speedup)
+    if speedups:
+        # geometric mean
+        mean = math.exp(sum(map(math.log, speedups)) / len(speedups))
+        print("{:<40}{:>11.2f}x".format("blocks against dispatch", mean))
+
+
+def bench_registers(folder, iterations, repeat=20):
+    stdin = "5 3 7 2 9 1 4 5 6 7 8 9 1 2\n" * 5
+    print("{:<32}{:>10}{:>10}{:>12}{:>12}{:>9}".format("instructions and run time", "stack", "register",
+                                                     "dispatch", "registers", "speedup"))
+    programs = [("loop of %d" % iterations, LOOP_PROGRAM % iterations),
+                ("array of %d" % iterations, ARRAY_PROGRAM % (iterations, iterations, iterations))]
+    # the other examples do not stop with this input
+    programs += [(f, open(f).read()) for f in sorted(glob.glob(os.path.join(folder, "email*.lya")))]
+    for name, source in programs:
+        for optimized in (False, True):
+            program = compile_source(source, optimized=optimized)
+            executed = []
+            times = []
+            for engine in ('dispatch', 'registers'):
+                i = StepCountingInterpreter(False, engine=engine, files=[], stdout=StringIO())
+                i.load_code(program.H, program.text)
+
+                def run():
+                    i._input = lya_io.open_input(StringIO(stdin), i._output)
+                    i.executed = 0
+                    i.run()
+                try:
+                    run()
+                except Exception as e:
+                    break
+                executed.append(i.executed)
+                times.append(min(timeit.repeat(run, number=repeat, repeat=3)) / repeat)
+            if len(times) < 2:
+                print("{:<32}{:>10}".format(name, type(e).__name__))
+                break
+            print("{:<32}{:>10}{:>10}{:>10.1f}us{:>10.1f}us{:>8.1f}x".format(
+                name + (" -O" if optimized else ""), executed[0], executed[1],
+                1e6 * times[0], 1e6 * times[1], times[0] / times[1]))
+
+
+# prints a number and a string at each turn
+OUTPUT_PROGRAM = """
+dcl i int;
+do
+  for i = 1 to %d;
+    print(i, "is the number of this line, printed with a long string after it\\n");
+od;
+"""
+
+
+def bench_output(iterations):
+    program = compile_source(OUTPUT_PROGRAM % iterations)
+    print("{} lines of output".format(2 * iterations))
+    for title, sink in (("StringIO", StringIO), ("file", lambda: open(os.devnull, 'w'))):
+        for output_buffer in (0, Interpreter.OUTPUT_BUFFER):
+            def run():
+                stdout = sink()
+                program.run(stdout=stdout, output_buffer=output_buffer)
+                stdout.close()
+            elapsed = min(timeit.repeat(run, number=1, repeat=3))
+            print("{:<10}{:<16}{:>8.3f}s".format(title, "unbuffered" if output_buffer == 0 else
+                                                 "buffer of {}".format(output_buffer), elapsed))
+
+
+# sums the values of its input
+INPUT_PROGRAM = """
+dcl i, n, sum int = 0;
+do
+  for i = 1 to %d;
+    read(n);
+    sum += n;
+od;
+print(sum);
+"""
+
+
+def bench_input(values):
+    print("{:<10}{:>14}{:>14}{:>14}".format("values", "one line", "ten per line", "per value"))
+    for n in (values // 100, values // 10, values):
+        program = compile_source(INPUT_PROGRAM % n)
+        times = []
+        for line in (n, 10):
+            stdin = "\n".join(" ".join("7" for k in range(line)) for j in range(n // line)) + "\n"
+            times.append(min(timeit.repeat(lambda: program.run(StringIO(stdin), StringIO()),
+                                           number=1, repeat=3)))
+        print("{:<10}{:>13.3f}s{:>13.3f}s{:>12.2f}us".format(n, times[0], times[1], 1e6 * times[0] / n))
+
+
+def bench_profile(iterations, repeat=3):
+    print("{:<24}{:>12}{:>12}{:>10}".format("program", "dispatch", "profile", "overhead"))
+    for name, source in (("loop of %d" % iterations, LOOP_PROGRAM % iterations),
+                         ("array of %d" % iterations, ARRAY_PROGRAM % (iterations, iterations, iterations)),
+                         ("calls of %d" % (iterations // 10), CALL_PROGRAM % (iterations // 10))):
+        program = compile_source(source)
+        times = []
+        for profile in (False, True):
+            i = Interpreter(False, files=[], stdout=StringIO(), profile=profile)
+            i.load_code(program.H, program.text)
+            times.append(min(timeit.repeat(i.run, number=1, repeat=repeat)))
+        print("{:<24}{:>11.3f}s{:>11.3f}s{:>9.2f}x".format(name, times[0], times[1], times[1] / times[0]))
+
+
+def bench_parser(statements):
+    parser = get_parser()
+    # the same parser on the generic loop of yacc.LRParser
+    generic = LyaParser()
+    generic.parser = lya_tables.load_yacc(generic)
+    print("{:<12}{:>10}{:>16}{:>10}{:>9}".format("statements", "parse", "per statement", "yacc", ""))
+    for n in (statements // 20, statements // 2, statements * 5):
+        source = "dcl x int = 0;\n" + "x = x + 1;\n" * n + "print(x);\n"
+        repeat = 1 if n > statements else 3
+        elapsed = min(timeit.repeat(lambda: parser.parseInput(source), number=1, repeat=repeat))
+        yacc = min(timeit.repeat(lambda: generic.parseInput(source), number=1, repeat=repeat))
+        print("{:<12}{:>9.3f}s{:>14.1f}us{:>9.3f}s{:>8.2f}x".format(n, elapsed, 1e6 * elapsed / n, yacc,
+                                                                    yacc / elapsed))
+
+
+def ast_footprint(node, eager=False):
+    """Bytes taken by the nodes of an AST, their dicts and the strings they
+    refer to, with eager=True as if every node kept its location string."""
+    total = 0
+    seen = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        total += sys.getsizeof(node)
+        if isinstance(node, list):
+            stack.extend(node)
+        elif hasattr(node, '__dict__'):
+            total += sys.getsizeof(node.__dict__)
+            stack.extend(node.__dict__.values())
+            if eager and isinstance(node, lya_ast.AST):
+                total += sys.getsizeof(node.location)
+    return total
+
+
+def bench_tracking(statements):
+    source = "dcl x int = 0;\n" + "x = x + 1;\n" * statements + "print(x);\n"
+    parser = LyaParser()
+    generic = lya_tables.load_yacc(parser)
+    runs = (("lya_lalr", parser.parser, False), ("lya_lalr tracking", parser.parser, True),
+            ("yacc", generic, False), ("yacc tracking", generic, True))
+    print("{} statements".format(statements))
+    for name, lr, tracking in runs:
+        def parse():
+            parser.lexer.lineno = 1
+            return lr.parse(source, lexer=parser.lexer, tracking=tracking)
+        elapsed = min(timeit.repeat(parse, number=1, repeat=3))
+        print("{:<18}{:>9.3f}s".format(name, elapsed))
+    program = get_parser().parseInput(source)
+    for name, eager in (("eager location", True), ("lazy location", False)):
+        print("{:<18}{:>10} bytes of AST".format(name, ast_footprint(program, eager)))
+
+
+def bench_startup(repeat=10):
+    # a new interpreter for each run, as from the shell
+    compiler = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compiler.py")
+    fd, file_name = tempfile.mkstemp(suffix=".lya")
+    os.write(fd, "dcl x int;\n")
+    os.close(fd)
+    try:
+        with open(os.devnull, 'w') as devnull:
+            for title, command in (("python -c pass", [sys.executable, "-c", "pass"]),
+                                   ("compiler.py -lexer", [sys.executable, compiler, "-lexer", file_name])):
+                elapsed = timeit.repeat(lambda: subprocess.check_call(command, stdout=devnull),
+                                        number=1, repeat=repeat)
+                print("{:<24}{:>10.1f}ms{:>10.1f}ms min".format(title, 1e3 * sum(elapsed) / repeat,
+                                                                1e3 * min(elapsed)))
+    finally:
+        os.remove(file_name)
+
+
+def bench_load(statements):
+    source = "dcl x int = 0;\n" + "x = x + 1;\n" * statements + "print(x);\n"
+    files = []
+    try:
+        for binary in (False, True):
+            fd, file_name = tempfile.mkstemp(suffix=".lya.o")
+            os.close(fd)
+            files.append(file_name)
+            compile_to_file(source, file_name, binary)
+            i = Interpreter(False)
+            elapsed = min(timeit.repeat(lambda: i.load_file(file_name), number=1, repeat=3))
+            print("{:<10}{:>10} bytes{:>10.3f}s to load {} instructions".format(
+                "bytecode" if binary else "text", os.path.getsize(file_name), elapsed, len(i._text)))
+    finally:
+        for file_name in files:
+            os.remove(file_name)
+
+
+def bench_lexer(folder):
+    files = sorted(glob.glob(os.path.join(folder, "*.lya")) + glob.glob(os.path.join(folder, "*", "*.lya")))
+    sources = [open(f).read() for f in files]
+
+    def rebuild():
+        # what -lexer used to do: a new lexer built for every input
+        for source in sources:
+            lexer = LyaLexer()
+            lexer.lexer = lex.lex(optimize=1, module=lexer)
+            lexer.lexer.input(source)
+            while lexer.lexer.token():
+                pass
+
+    def reuse():
+        lexer = LyaLexer(ply=True)
+        for source in sources:
+            lexer.to_token(source)
+
+    print("-lexer over {} files of {}".format(len(files), folder))
+    for name, f in (("rebuild", rebuild), ("reuse", reuse)):
+        elapsed = min(timeit.repeat(f, number=1, repeat=5))
+        print("{:<10}{:>8.4f}s{:>10.3f}ms per file".format(name, elapsed, 1000 * elapsed / len(files)))
+
+    # the token stream the parser reads, of all the files in one input
+    source = "\n".join(sources) * 20
+    for name, ply in (("ply.lex", True), ("Scanner", False)):
+        lexer = LyaLexer(ply=ply).lexer
+
+        def scan():
+            lexer.lineno = 1
+            lexer.input(source)
+            count = 0
+            while lexer.token():
+                count += 1
+            return count
+
+        tokens = scan()
+        elapsed = min(timeit.repeat(scan, number=1, repeat=5))
+        print("{:<10}{:>8.4f}s{:>12.0f} tokens/s".format(name, elapsed, tokens / elapsed))
+    lexer = LyaLexer(ply=True)
+    for name, f in (("lex.lex()", lambda: lex.lex(optimize=1, module=lexer)), ("LyaLexer()", lambda: LyaLexer())):
+        elapsed = min(timeit.repeat(f, number=100, repeat=3)) / 100
+        print("{:<12}{:>8.3f}ms to build a lexer".format(name, 1000 * elapsed))
+
+
+def memory_footprint(i):
+    """Bytes taken by the cells of the memory and by the objects they refer to."""
+    if i._T is not None:
+        return sys.getsizeof(i._M) + sys.getsizeof(i._T)
+    objects = dict((id(v), v) for v in i._M)
+    return sys.getsizeof(i._M) + sum(sys.getsizeof(v) for v in objects.values())
+
+
+def bench_memory(size):
+    fd, file_name = tempfile.mkstemp(suffix=".lya.o")
+    os.close(fd)
+    try:
+        compile_to_file(ARRAY_PROGRAM % (size, size, size), file_name)
+        print("array of {} integers".format(size))
+        for memory in Interpreter.MEMORIES:
+            elapsed = min(timeit.repeat(lambda: run_program(file_name, memory=memory), number=1, repeat=3))
+            i = run_program(file_name, memory=memory)
+            print("{:<8}{:>8.3f}s{:>12} bytes for {} cells".format(memory, elapsed, memory_footprint(i), len(i._M)))
+    finally:
+        os.remove(file_name)
+
+
+def bench_peephole(folder):
+    print("{:<64}{:>8}{:>8}{:>8}".format("file", "before", "-O", "saved"))
+    before_total = after_total = 0
+    for f in expand_inputs([folder]):
+        source = open(f).read()
+        try:
+            stdout = sys.stdout
+            # the parser prints the syntax errors
+            sys.stdout = open(os.devnull, 'w')
+            try:
+                before = len(compile_source(source).text)
+                after = len(compile_source(source, optimized=True).text)
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+        except Exception as e:
+            print("{:<64}{:>8}".format(f, type(e).__name__))
+            continue
+        before_total += before
+        after_total += after
+        print("{:<64}{:>8}{:>8}{:>7.1f}%".format(f, before, after, 100.0 * (before - after) / before))
+    print("{:<64}{:>8}{:>8}{:>7.1f}%".format("total", before_total, after_total,
+                                             100.0 * (before_total - after_total) / before_total))
+
+
+def bench_pairs(folder, top=15):
+    pairs = collections.Counter()
+    triples = collections.Counter()
+    executed = {'-O': 0, 'fused': 0}
+    for f in expand_inputs([folder]):
+        source = open(f).read()
+        # programs that read from the input can not run unattended
+        if "read" in source:
+            continue
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            program = compile_source(source, optimized=True)
+            for name, text in (('-O', optimize(compile_source(source).text)), ('fused', program.text)):
+                i = ProfilingInterpreter(False, engine='classic', files=[])
+                i.load_code(program.H, text)
+                i.run()
+                executed[name] += i.executed
+                if name == '-O':
+                    pairs.update(i.pairs)
+                    triples.update(i.triples)
+        except Exception:
+            continue
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+    for title, counter in (("pairs", pairs), ("triples", triples)):
+        print("most executed {} over {}".format(title, folder))
+        for sequence, count in counter.most_common(top):
+            if '' not in sequence:
+                print("{:<24}{:>10}".format(" ".join(sequence), count))
+    print("instructions executed: {} with -O, {} with superinstructions ({:.1f}% fewer)".format(
+        executed['-O'], executed['fused'], 100.0 * (executed['-O'] - executed['fused']) / executed['-O']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the lya compiler and interpreter.')
+    parser.add_argument('-operators', dest='operators', action='store_const',
+                        const=True, default=False,
+                        help='compare eval() against native operators')
+    parser.add_argument('-interpreter', dest='interpreter', action='store_const',
+                        const=True, default=False,
+                        help='measure interpreter instructions per second')
+    parser.add_argument('-engines', dest='engines', action='store_const',
+                        const=True, default=False,
+                        help='compare the run time of the examples in every engine')
+    parser.add_argument('-registers', dest='registers', action='store_const',
+                        const=True, default=False,
+                        help='compare the instructions executed and the run time of the stack and register code')
+    parser.add_argument('-output', dest='output', action='store_const',
+                        const=True, default=False,
+                        help='compare the buffered and the unbuffered program output')
+    parser.add_argument('-input', dest='input', action='store_const',
+                        const=True, default=False,
+                        help='time programs reading many values')
+    parser.add_argument('-profile', dest='profile', action='store_const',
+                        const=True, default=False,
+                        help='measure the overhead of the profiling interpreter')
+    parser.add_argument('-parser', dest='parser', action='store_const',
+                        const=True, default=False,
+                        help='time the parser on programs of n / 20, n / 2 and 5 n statements, against yacc.LRParser')
+    parser.add_argument('-tracking', dest='tracking', action='store_const',
+                        const=True, default=False,
+                        help='time lya_lalr and yacc with and without tracking and measure the AST of n statements')
+    parser.add_argument('-startup', dest='startup', action='store_const',
+                        const=True, default=False,
+                        help='time compiler.py -lexer on a one-line file in a new process')
+    parser.add_argument('-load', dest='load', action='store_const',
+                        const=True, default=False,
+                        help='compare the load time of text and bytecode programs')
+    parser.add_argument('-lexer', dest='lexer', action='store_const',
+                        const=True, default=False,
+                        help='compare rebuilding and reusing the lexer over the examples')
+    parser.add_argument('-memory', dest='memory', action='store_const',
+                        const=True, default=False,
+                        help='compare the list and the typed memory')
+    parser.add_argument('-peephole', dest='peephole', action='store_const',
+                        const=True, default=False,
+                        help='count the instructions removed by -O in the examples')
+    parser.add_argument('-pairs', dest='pairs', action='store_const',
+                        const=True, default=False,
+                        help='profile the instruction pairs and triples executed by the examples')
+    parser.add_argument('-examples', dest='examples', type=str, default='examples',
+                        help='folder of the programs used by -engines, -registers, -lexer, -peephole and -pairs')
+    parser.add_argument('-n', dest='n', type=int, default=20000,
+                        help='size of the generated workloads')
+    args = parser.parse_args()
+
+    if args.operators:
+        bench_operators(args.n)
+    if args.interpreter:
+        bench_interpreter(args.n)
+    if args.engines:
+        bench_engines(args.examples)
+    if args.registers:
+        bench_registers(args.examples, args.n // 10)
+    if args.output:
+        bench_output(args.n)
+    if args.input:
+        bench_input(args.n)
+    if args.profile:
+        bench_profile(args.n)
+    if args.parser:
+        bench_parser(args.n)
+    if args.tracking:
+        bench_tracking(args.n)
+    if args.startup:
+        bench_startup()
+    if args.load:
+        bench_load(args.n)
+    if args.lexer:
+        bench_lexer(args.examples)
+    if args.memory:
+        bench_memory(args.n)
+    if args.peephole:
+        bench_peephole(args.examples)
+    if args.pairs:
+        bench_pairs(args.examples)
+
+if __name__ == "__main__":
+    main()
@@ -4,26 +4,210 @@
 from __future__ import print_function
 
 import argparse
+import glob
+import multiprocessing
+import os
 import sys
+import threading
+import time
 
-from lya_ast import AST, reset
+from lya_ast import AST, Context
 from lya_lex import LyaLexer
 from lya_parser import LyaParser
-from lya_errors import FileNotFoundError
+from lya_errors import CompilerException, FileNotFoundError
+from lya_cache import CompileCache
+from lya_optimizer import fuse, optimize
+from lya_codeprinter import CodePrinter, ListCodePrinter
+from lya_pygen import PythonProgram, generate
+from interpreter import Interpreter
 
 
-class LyaCompiler:
-    lexer = LyaLexer()
-    parser = LyaParser()
+class CompiledProgram(object):
+    """A compiled lya program: the string pool H and the list of instructions."""
+    def __init__(self, H, text):
+        self.H = H
+        self.text = text
+
+    def run(self, stdin=None, stdout=None, engine='dispatch',
+            memory_size=Interpreter.MEMORY_SIZE, memory_limit=Interpreter.MEMORY_LIMIT, memory='list',
+            output_buffer=Interpreter.OUTPUT_BUFFER):
+        i = Interpreter(False, engine=engine, files=[], stdin=stdin, stdout=stdout,
+                        memory_size=memory_size, memory_limit=memory_limit, memory=memory,
+                        output_buffer=output_buffer)
+        i.load_code(self.H, self.text)
+        i.run()
+
+    def save(self, file_name, binary=True):
+        printer = ListCodePrinter(binary=binary)
+        printer.H = self.H
+        printer.text = self.text
+        printer.save(file_name)
+
+
+# PLY lexers and parsers keep the state of the input being read, so every
+# thread builds its own once and reuses it
+_local = threading.local()
+_build_lock = threading.Lock()
+
+
+def get_lexer():
+    lexer = getattr(_local, 'lexer', None)
+    if lexer is None:
+        # PLY may write its table modules while building
+        with _build_lock:
+            lexer = _local.lexer = LyaLexer()
+    return lexer
+
+
+def get_parser():
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        with _build_lock:
+            parser = _local.parser = LyaParser()
+    return parser
+
+
+def generate_code(source, printer):
+    result = get_parser().parseInput(source)
+    ast = AST(result)
+    ctx = Context(printer)
+    # check semantic errors
+    ast.program.visit_node(ctx)
+    # generate code
+    ast.program.generate_code1(ctx)
+    return printer
+
+
+def compile_source(source, cache=None, optimized=False):
+    """Compiles lya source code in memory, without arguments parsing or temporary files.
+    With a CompileCache unchanged sources are not compiled again, optimized
+    applies the peephole optimizer and the superinstructions to the generated code."""
+    options = "-O" if optimized else ""
+    if cache is not None:
+        program = cache.get(source, options)
+        if program is not None:
+            return CompiledProgram(*program)
+    try:
+        printer = generate_code(source, ListCodePrinter())
+    except CompilerException as e:
+        # a hit would not print the syntax errors again
+        if cache is not None and not get_parser().reported():
+            cache.put_error(source, e, options)
+        raise
+    text = fuse(optimize(printer.text)) if optimized else printer.text
+    if cache is not None and not get_parser().reported():
+        cache.put(source, printer.H, text, options)
+    return CompiledProgram(printer.H, text)
+
+
+def compile_python(source):
+    """Compiles lya source code into a PythonProgram, Python code that runs
+    without the LVM (see lya_pygen)."""
+    result = get_parser().parseInput(source)
+    ast = AST(result)
+    # check semantic errors
+    ast.program.visit_node(Context())
+    return PythonProgram(generate(ast.program))
+
+
+def run_source(source, stdin=None, stdout=None, engine='dispatch'):
+    compile_source(source).run(stdin, stdout, engine)
+
+
+def expand_inputs(paths):
+    """Expands directories (every .lya file inside them) and glob patterns."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in sorted(os.walk(path)):
+                dirs.sort()
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(".lya"))
+        elif glob.has_magic(path):
+            files.extend(sorted(glob.glob(path)))
+        else:
+            files.append(path)
+    return files
+
+
+def _warm_worker():
+    # builds the lexer and parser of the worker process before the first file
+    get_lexer()
+    get_parser()
 
-    def __init__(self):
+
+def _compile_file(job):
+    source_file, output_file, binary, cache_dir, optimized = job
+    start = time.time()
+    cache = CompileCache(cache_dir) if cache_dir is not False else None
+    try:
+        with open(source_file, "r") as f:
+            source = f.read()
+        program = compile_source(source, cache, optimized)
+        program.save(output_file, binary)
+        return source_file, time.time() - start, None, len(program.text), cache is not None and cache.hits > 0
+    except Exception as e:
+        return (source_file, time.time() - start, "{0}: {1}".format(type(e).__name__, e), 0,
+                cache is not None and cache.hits > 0)
+
+
+def compile_batch(files, output_dir=None, binary=True, jobs=None, timeout=None, cache_dir=None,
+                  optimized=False):
+    """Compiles many files in a pool of processes, each one writing <file>.o
+    (inside output_dir if given). Returns a list of
+    (file, seconds, error message or None, number of instructions, cache hit).
+
+    cache_dir is the directory of the CompileCache (None for the default one),
+    False disables the cache.
+
+    A file that takes more than timeout seconds is reported as an error, the
+    pool is then replaced so the files queued behind it still get compiled.
+    With jobs == 1 everything runs in this process and timeout is ignored.
+    """
+    work = []
+    for f in files:
+        output_file = f + ".o"
+        if output_dir:
+            output_file = os.path.join(output_dir, os.path.basename(f) + ".o")
+        work.append((f, output_file, binary, cache_dir, optimized))
+
+    if jobs == 1:
+        return [_compile_file(job) for job in work]
+    results = []
+    while work:
+        pool = multiprocessing.Pool(jobs, initializer=_warm_worker)
+        pending = [pool.apply_async(_compile_file, (job,)) for job in work]
+        done = 0
+        timed_out = False
+        try:
+            for job, result in zip(work, pending):
+                done += 1
+                try:
+                    results.append(result.get(timeout))
+                except multiprocessing.TimeoutError:
+                    results.append((job[0], timeout, "TimeoutError: took more than {0}s".format(timeout), 0, False))
+                    timed_out = True
+                    break
+        finally:
+            if timed_out:
+                pool.terminate()
+            else:
+                pool.close()
+            pool.join()
+        work = work[done:]
+    return results
+
+
+class LyaCompiler:
+    def __init__(self, argv=None):
         self.args = None
-        self._parse_args()
+        self.lexer = get_lexer()
+        self.parser = get_parser()
+        self._parse_args(argv)
 
-    def _parse_args(self):
+    def _parse_args(self, argv=None):
         parser = argparse.ArgumentParser(description='Compile a lya source code.')
-        parser.add_argument('files', metavar='files', type=str, nargs=1,
-                            help='the source code')
+        parser.add_argument('files', metavar='files', type=str, nargs='+',
+                            help='the source code, directories or glob patterns')
         parser.add_argument('-lexer', dest='lexer', action='store_const',
                             const=True, default=False,
                             help='select to run the lexer')
@@ -39,12 +223,51 @@ class LyaCompiler:
         parser.add_argument('-run', dest='run', action='store_const',
                             const=True, default=False,
                             help='')
+        parser.add_argument('-engine', dest='engine', choices=Interpreter.ENGINES,
+                            default='dispatch', help='select the execution engine used by -run')
+        parser.add_argument('-backend', dest='backend', choices=('lvm', 'python'), default='lvm',
+                            help='select what -run executes: the LVM code or Python code compiled with compile()')
+        parser.add_argument('-memory', dest='memory', choices=Interpreter.MEMORIES,
+                            default='list', help='select how the memory cells are stored by -run')
+        parser.add_argument('-memory-size', dest='memory_size', type=int, default=Interpreter.MEMORY_SIZE,
+                            help='initial number of memory cells used by -run')
+        parser.add_argument('-memory-limit', dest='memory_limit', type=int, default=Interpreter.MEMORY_LIMIT,
+                            help='maximum number of memory cells used by -run')
+        parser.add_argument('-text', dest='text', action='store_const',
+                            const=True, default=False,
+                            help='write the output file as a text dump instead of bytecode')
+        parser.add_argument('-batch', dest='batch', action='store_const',
+                            const=True, default=False,
+                            help='compile every file in parallel, -o is the output directory')
+        parser.add_argument('-jobs', dest='jobs', type=int, default=None,
+                            help='number of processes used by -batch (default: number of cpus)')
+        parser.add_argument('-timeout', dest='timeout', type=float, default=60,
+                            help='seconds each file may take with -batch')
+        parser.add_argument('-O', dest='optimized', action='store_const',
+                            const=True, default=False,
+                            help='apply the peephole optimizer and the superinstructions to the generated code')
+        parser.add_argument('-no-cache', dest='no_cache', action='store_const',
+                            const=True, default=False,
+                            help='always compile, without reading or writing the compilation cache')
+        parser.add_argument('-cache-dir', dest='cache_dir', type=str, default=None,
+                            help='directory of the compilation cache (default: $LYA_CACHE_DIR or ~/.cache/lya)')
         parser.add_argument('-o', dest='output', type=str, default="", nargs=1, help='output file')
-        self.args = parser.parse_args()
+        self.args = parser.parse_args(argv)
+        if self.args.backend == 'python' and not self.args.run:
+            parser.error("-backend python needs -run")
         if type(self.args.output) == list:
             self.args.output = self.args.output[0]
+        self.args.files = expand_inputs(self.args.files)
+        if not self.args.files:
+            parser.error("no .lya file found")
+        # one program is run or written to the output file
+        if len(self.args.files) > 1 and not self.args.batch and (self.args.run or self.args.output):
+            parser.error("-run and -o take a single file, use -batch to compile several")
+        self.cache = None if self.args.no_cache else CompileCache(self.args.cache_dir)
 
     def run(self):
+        if self.args.batch:
+            return self._batch()
         if self.args.lexer:
             self._lexer()
         if self.args.ast:
@@ -53,64 +276,81 @@ class LyaCompiler:
             self._ast_walker()
         if not (self.args.lexer or self.args.ast or self.args.ast_walker):
             if self.args.run:
-                self.args.output = ".temporary_interpreter.tmp"
-                self._ast_gencode()
-                ast = AST([])
-                ast.set_output(None)
-                sys.argv = ['./interpreter.py', self.args.output]
-                from interpreter import Interpreter
-                i = Interpreter(False)
-                i.load_program()
+                program = self._ast_gencode()
+                program.run(engine=self.args.engine, memory_size=self.args.memory_size,
+                            memory_limit=self.args.memory_limit, memory=self.args.memory)
             else:
                 self._ast_gencode()
 
     def _lexer(self):
         for f in self.args.files:
-            LyaCompiler.lexer.lineno = 0
-            reset()
             if len(self.args.files) > 1:
                 print("Output for file: ", f, file=sys.stderr)
             values = self.readfile(f)
-            result = LyaCompiler.lexer.to_token(values)
+            result = self.lexer.to_token(values)
             print(result)
 
     def _ast(self):
         for f in self.args.files:
-            LyaCompiler.lexer.lineno = 0
-            reset()
             if len(self.args.files) > 1:
                 print("Output for file: ", f, file=sys.stderr)
             values = self.readfile(f)
-            result = LyaCompiler.parser.parseInput(values)
+            result = self.parser.parseInput(values)
             ast = AST(result)
             ast.program.print_node(0)
 
     def _ast_walker(self):
         for f in self.args.files:
-            LyaCompiler.lexer.lineno = 0
-            reset()
             if len(self.args.files) > 1:
                 print("Output for file: ", f, file=sys.stderr)
             values = self.readfile(f)
-            result = LyaCompiler.parser.parseInput(values)
+            result = self.parser.parseInput(values)
             ast = AST(result)
-            ast.program.visit_node()
+            ast.program.visit_node(Context())
 
     def _ast_gencode(self):
         for f in self.args.files:
-            LyaCompiler.lexer.lineno = 0
-            reset()
             if len(self.args.files) > 1:
                 print("Output for file: ", f, file=sys.stderr)
             values = self.readfile(f)
-            result = LyaCompiler.parser.parseInput(values)
-            ast = AST(result)
-            if self.args.output != '':
-                ast.set_output(self.args.output)
-            # check semantic errors
-            ast.program.visit_node()
-            # generate code
-            ast.program.generate_code1()
+            if self.args.run and self.args.backend == 'python':
+                program = compile_python(values)
+            elif self.args.run or self.args.output != '':
+                # the program stays in memory, it is only saved if -o is given
+                program = compile_source(values, self.cache, self.args.optimized)
+                if self.args.output:
+                    program.save(self.args.output, not self.args.text)
+            elif self.args.optimized:
+                # the code is printed once it has been optimized
+                program = compile_source(values, self.cache, True)
+                printer = ListCodePrinter()
+                printer.H = program.H
+                printer.text = program.text
+                sys.stdout.write(printer.dumps_text())
+            else:
+                program = generate_code(values, CodePrinter(None))
+        return program
+
+    def _batch(self):
+        start = time.time()
+        cache_dir = False if self.args.no_cache else self.args.cache_dir
+        results = compile_batch(self.args.files, self.args.output or None,
+                                not self.args.text, self.args.jobs, self.args.timeout, cache_dir,
+                                self.args.optimized)
+        failures = 0
+        hits = 0
+        for f, elapsed, error, instructions, hit in results:
+            hits += hit
+            if error is None:
+                print("ok    {0:8.3f}s {1:6} instructions  {2}{3}".format(
+                    elapsed, instructions, f, " (cached)" if hit else ""))
+            else:
+                failures += 1
+                print("FAIL  {0:8.3f}s {1:>19}  {2}\n      {3}".format(
+                    elapsed, "", f, error.replace("\n", "\n      ")))
+        print("{0} files, {1} compiled, {2} failed, {3} from cache in {4:.3f}s".format(
+            len(results), len(results) - failures, failures, hits, time.time() - start))
+        return failures
 
     def readfile(self, name):
         try:
@@ -123,4 +363,10 @@ class LyaCompiler:
 
 if __name__ == "__main__":
     m = LyaCompiler()
-    m.run()
+    try:
+        failed = m.run()
+    except CompilerException as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    if failed:
+        sys.exit(1)
@@ -4,30 +4,150 @@
 from __future__ import print_function
 
 
-from lya_errors import FileNotFoundError, InterpreterError
+from lya_errors import FileNotFoundError, InterpreterError, OutOfMemoryError, StackOverflowError
+import lya_blocks
+import lya_io
+import lya_profile
+import lya_registers
+import lya_bytecode
+import argparse
+import json
+import operator
 import sys
+import time
+from array import array
 
 from ast import literal_eval
 import re
 
+# machine integers of the typed memory, Python 2 has no 'q' but its 'l' is
+# 64 bits wide on LP64 platforms
+try:
+    CELL = array('q').typecode
+except ValueError:
+    CELL = 'l'
+
+# functions of the operations fused into superinstructions
+OPERATORS = {
+    'add': operator.add, 'sub': operator.sub, 'mul': operator.mul,
+    'div': operator.floordiv, 'mod': operator.mod,
+    'les': operator.lt, 'leq': operator.le, 'grt': operator.gt,
+    'gre': operator.ge, 'equ': operator.eq, 'neq': operator.ne,
+}
+COMPARISONS = {
+    'jlt': operator.lt, 'jle': operator.le, 'jgt': operator.gt,
+    'jge': operator.ge, 'jeq': operator.eq, 'jne': operator.ne,
+}
+
 
 class Interpreter(object):
-    def __init__(self, debug=False):
+    # 'blocks' runs the code translated into Python functions by lya_blocks,
+    # 'registers' the three-address code of lya_registers
+    ENGINES = ('classic', 'dispatch', 'blocks', 'registers')
+    # 'list' keeps Python objects in the cells, 'typed' keeps machine integers
+    # in an array of CELL and the kind of each value (lya_bytecode tags) apart
+    MEMORIES = ('list', 'typed')
+    # memory cells, the memory grows by GROWTH times when it is not enough
+    MEMORY_SIZE = 1024
+    MEMORY_LIMIT = 1 << 22
+    GROWTH = 2
+    # characters of output collected before they are written
+    OUTPUT_BUFFER = 1 << 16
+
+    def __init__(self, debug=False, engine='dispatch', files=None, stdin=None, stdout=None,
+                 memory_size=MEMORY_SIZE, memory_limit=MEMORY_LIMIT, memory='list', output_buffer=OUTPUT_BUFFER,
+                 profile=False):
+        if engine not in Interpreter.ENGINES:
+            raise InterpreterError("Unknown engine.", engine)
+        if memory not in Interpreter.MEMORIES:
+            raise InterpreterError("Unknown memory.", memory)
+        if memory == 'typed' and engine != 'dispatch':
+            raise InterpreterError("Unsupported memory.", "The typed memory needs the dispatch engine.")
+        if not 0 < memory_size <= memory_limit:
+            raise InterpreterError("Invalid memory size.", "{0} cells, limited to {1}.".format(memory_size, memory_limit))
         self._debug = debug
-        self._file = sys.argv[1:]
+        self._engine = engine
+        # runs the linked code counting the instructions, whatever the engine
+        self._profile = profile
+        # lya_profile.Profile of the last run
+        self.profile = None
+        self._memory_size = memory_size
+        self._memory_limit = memory_limit
+        self._typed = memory == 'typed'
+        if files is None:
+            files = sys.argv[1:]
+        self._file = files
+        # program input and output, sys.stdin and sys.stdout when None, the
+        # input can also be a file name or a list of lines (see lya_io.open_input)
+        self._stdout = stdout
+        self._output = lya_io.BufferedOutput(stdout, output_buffer)
+        self._input = lya_io.open_input(stdin, self._output)
         # from file
         self._H = None
         self._text = ""
+        # linked (handler, row) pairs used by the dispatch engine
+        self._code = None
+        # position in _text of each instruction of _code
+        self._text_pc = None
+        # code object and LINES of the blocks engine, and its functions by pc
+        self._blocks_code = None
+        self._blocks_lines = None
+        self._blocks = None
+        # register rows, linked pc of each of them and handlers of the registers engine
+        self._registers_rows = None
+        self._registers_origin = None
+        self._registers_make = None
+        self._registers = None
+        self._handlers = {
+            'ldc': self._op_ldc, 'ldv': self._op_ldv, 'ldr': self._op_ldr,
+            'stv': self._op_stv, 'stk': self._op_stk, 'lrv': self._op_lrv, 'srv': self._op_srv,
+            'add': self._op_add, 'sub': self._op_sub, 'mul': self._op_mul,
+            'div': self._op_div, 'mod': self._op_mod, 'neg': self._op_neg,
+            'and': self._op_and, 'or': self._op_or, 'lor': self._op_or,
+            'not': self._op_not, 'les': self._op_les, 'leq': self._op_leq,
+            'grt': self._op_grt, 'gre': self._op_gre, 'equ': self._op_equ,
+            'neq': self._op_neq, 'jmp': self._op_jmp, 'jof': self._op_jof,
+            'alc': self._op_alc, 'dlc': self._op_dlc, 'cfu': self._op_cfu,
+            'enf': self._op_enf, 'ret': self._op_ret, 'idx': self._op_idx,
+            'grc': self._op_grc, 'lmv': self._op_lmv, 'smv': self._op_smv,
+            'smr': self._op_smr, 'sts': self._op_sts, 'rdv': self._op_rdv,
+            'rds': self._op_rds, 'prv': self._op_prv, 'prt': self._op_prt,
+            'prc': self._op_prc, 'prs': self._op_prs, 'stp': self._op_stp,
+            'end': self._op_end, 'inc': self._op_inc,
+        }
+        for name, f in COMPARISONS.items():
+            self._handlers[name] = self._compare_jump(f)
+        for op, f in OPERATORS.items():
+            self._handlers['vv_' + op] = self._values_operation(f)
+            self._handlers['vc_' + op] = self._value_constant_operation(f)
+        # instructions that handle the kinds of the values in the typed memory
+        self._typed_handlers = {
+            'ldc': self._typed_ldc, 'ldv': self._typed_ldv, 'ldr': self._typed_ldr,
+            'stv': self._typed_stv, 'stk': self._typed_stk, 'lrv': self._typed_lrv, 'srv': self._typed_srv,
+            'not': self._typed_not, 'les': self._typed_les, 'leq': self._typed_leq,
+            'grt': self._typed_grt, 'gre': self._typed_gre, 'equ': self._typed_equ,
+            'neq': self._typed_neq, 'cfu': self._typed_cfu, 'enf': self._typed_enf,
+            'grc': self._typed_grc, 'lmv': self._typed_lmv, 'smv': self._typed_smv,
+            'smr': self._typed_smr, 'sts': self._typed_sts, 'rdv': self._typed_rdv,
+            'rds': self._typed_rds, 'prv': self._typed_prv, 'prt': self._typed_prt,
+            'prs': self._typed_prs,
+        }
+        for op, f in OPERATORS.items():
+            tag = lya_bytecode.TAG_INT if op in ('add', 'sub', 'mul', 'div', 'mod') else lya_bytecode.TAG_BOOL
+            self._typed_handlers['vv_' + op] = self._values_operation(f, tag)
+            self._typed_handlers['vc_' + op] = self._value_constant_operation(f, tag)
         # from execution
         self._pc = None
         self._sp = None
         self._M = None
+        # kinds of the values of _M in the typed memory
+        self._T = None
+        # strings of H as codes and kinds, for the typed 'sts'
+        self._H_codes = None
         self._D = None
         self._running = None
         # labels
         self._labels_ref = dict()
-        #input buffer
-        self._input_buffer = list()
 
     def load_program(self, file_name=None):
         if file_name is None:
@@ -41,10 +161,28 @@ class Interpreter(object):
             self.run()
 
     def load_file(self, file_name):
+        if lya_bytecode.is_bytecode(file_name):
+            self.load_code(*lya_bytecode.load(file_name))
+        else:
+            self.load_text(file_name)
+            self.load_code(self._H, self._text)
+
+    # loads a program kept in memory, such as the one of a ListCodePrinter
+    def load_code(self, H, text):
+        self._H = H
+        self._text = [row if len(row) > 1 else (row[0], None) for row in text]
+        self._labels_ref = dict()
+        self.process_labels()
+        self.link()
+
+    # reads the Python-literal text dump of a program
+    def load_text(self, file_name):
         try:
             curr_file = open(file_name, "r")
         except:
             raise FileNotFoundError("Could not open file.", file_name)
+        self._H = None
+        self._text = ""
         for l in curr_file:
             if 'H' in l:
                 self._H = re.sub("^\s+(.*)", '\\1', l.replace('’', "'"))
@@ -68,33 +206,255 @@ class Interpreter(object):
 
         curr_file.close()
 
+    def link(self):
+        # index of each instruction once the 'lbl' no-ops are removed
+        linked_pc = []
+        count = 0
+        for row in self._text:
+            linked_pc.append(count)
+            if row[0] != 'lbl':
+                count += 1
+
+        self._code = []
+        self._text_pc = []
+        for i, row in enumerate(self._text):
+            if row[0] == 'lbl':
+                continue
+            if row[0] in lya_bytecode.JUMPS:
+                pos_dest = self._labels_ref.get(row[1], None)
+                if pos_dest is None:
+                    raise InterpreterError("Jump to a place not identified.", row[1])
+                row = (row[0], linked_pc[pos_dest])
+            handler = self._handlers.get(row[0], None)
+            if handler is None:
+                raise InterpreterError("Unknown instruction.", row)
+            if self._typed:
+                handler = self._typed_handlers.get(row[0], handler)
+                if row[0] == 'ldc':
+                    tag, value = lya_bytecode.encode_operand(row[1])
+                    row = (row[0], value, tag)
+            self._code.append((handler, row))
+            self._text_pc.append(i)
+        if self._engine == 'blocks':
+            self._blocks_code, self._blocks_lines = lya_blocks.translate(self._code)
+        elif self._engine == 'registers':
+            self._registers_rows, self._registers_origin, self._registers_make = lya_registers.translate(self._code)
+
     def reset(self):
         self._pc = 0
         self._sp = 0
-        self._M = [0] * 10000
+        if self._typed:
+            self._M = array(CELL, [0]) * self._memory_size
+            self._T = array('B', [lya_bytecode.TAG_INT]) * self._memory_size
+            self._H_codes = []
+            for h in self._H or []:
+                self._H_codes.append((array(CELL, [len(h)] + [ord(c) for c in h]),
+                                      array('B', [lya_bytecode.TAG_INT] + [lya_bytecode.TAG_CHAR] * len(h))))
+        else:
+            self._M = [0] * self._memory_size
         self._D = [0] * 6
         self._running = True
+        if self._engine == 'blocks':
+            self._blocks = lya_blocks.make_blocks(self._blocks_code, self, self._M, self._D, self._code)
+        elif self._engine == 'registers':
+            self._registers = lya_registers.make_code(self._registers_make, self._registers_rows, self,
+                                                      self._M, self._D, self._code)
 
     def run(self):
         self.reset()
-        """
-        print "H", type(self._H)
-        print self._H
-        print "text", type(self._text)
-        print self._text
-        """
-        self.process_labels()
+        if self._profile:
+            self.profile = lya_profile.Profile(self._text, self._text_pc, self._code)
+            start = time.time()
         if self._debug:
-            for i in range(len(self._text)):
-                print(i, self._text[i])
+            listing = self._text if self._engine == 'classic' else [row for handler, row in self._code]
+            for i in range(len(listing)):
+                print(i, listing[i])
+        try:
+            while self._running:
+                # the instructions fail before changing any state when they go past
+                # the end of the memory, so they run again once it has grown
+                try:
+                    if self._profile:
+                        self._run_profile()
+                    elif self._engine == 'classic':
+                        self._run_classic()
+                    elif self._engine == 'blocks' and not self._debug:
+                        self._run_blocks()
+                    elif self._engine == 'registers' and not self._debug:
+                        self._run_registers()
+                    else:
+                        self._run_dispatch()
+                except IndexError:
+                    self._fault()
+                except OverflowError:
+                    raise InterpreterError("Integer overflow.",
+                                           "pc = {0}, the typed memory holds 64-bit integers.".format(
+                                               self._loaded_pc()))
+        finally:
+            # at the end of the program and on errors
+            self._output.flush()
+            if self._profile:
+                self.profile.seconds = time.time() - start
+
+    def _extend(self, n):
+        if self._typed:
+            self._M.extend(array(CELL, [0]) * n)
+            self._T.extend(array('B', [lya_bytecode.TAG_INT]) * n)
+        else:
+            self._M.extend([0] * n)
+
+    def _fault(self):
+        """Grows the memory after an IndexError of the instruction at pc that
+        accessed a cell past its end, the instruction then runs again. Any
+        other IndexError is an InterpreterError."""
+        registers = self._engine == 'registers' and not self._debug and not self._profile
+        if registers:
+            rows = self._registers_rows
+        elif self._engine == 'classic' and not self._profile:
+            rows = self._text
+        else:
+            rows = self._code
+        if not 0 <= self._pc < len(rows):
+            raise InterpreterError("Execution past the end of the program.", "pc = {0}".format(len(self._text)))
+        try:
+            if not registers:
+                cells = self._cells(rows[self._pc] if rows is self._text else rows[self._pc][1])
+            elif rows[self._pc][1][0] == 'stack':
+                cells = self._cells(self._code[rows[self._pc][1][1]][1])
+            else:
+                cells = lya_registers.cells(rows[self._pc][0], rows[self._pc][1], self._sp, self._M, self._D)
+        except IndexError:
+            # outside the memory, such as a display D[i] that does not exist
+            cells = []
+        if not any(cell >= len(self._M) for cell in cells):
+            raise InterpreterError("Index out of range.", "pc = {0}".format(self._loaded_pc()))
+        self._grow()
+
+    def _cells(self, row):
+        # the cells of the memory an instruction of the linked code may access
+        # without _ensure: the one above the stack, its variables and the ones
+        # their references point to
+        M = self._M
+        op = row[0]
+        cells = [self._sp + 1]
+        if op in ('ldv', 'stv', 'stk', 'lrv', 'srv', 'inc') or op[:3] in ('vv_', 'vc_'):
+            cells.append(self._D[row[1]] + row[2])
+            if op[:3] == 'vv_':
+                cells.append(self._D[row[3]] + row[4])
+            elif op in ('lrv', 'srv') and cells[1] < len(M):
+                cells.append(M[cells[1]])
+        elif op == 'grc':
+            cells.append(M[self._sp])
+        return cells
+
+    def _grow(self):
+        size = len(self._M)
+        if size >= self._memory_limit:
+            raise self._memory_error(self._sp + 1 >= size)
+        self._extend(min(size * Interpreter.GROWTH, self._memory_limit) - size)
+
+    def _ensure(self, size, stack=False):
+        """Grows the memory to at least size cells."""
+        if size > len(self._M):
+            if size > self._memory_limit:
+                raise self._memory_error(stack)
+            new_size = min(max(size, len(self._M) * Interpreter.GROWTH), self._memory_limit)
+            self._extend(new_size - len(self._M))
+
+    def _loaded_pc(self):
+        # the pc of the program as loaded, with its labels
+        if self._profile:
+            return self._text_pc[self._pc]
+        if self._engine == 'classic':
+            return self._pc
+        if self._engine == 'registers' and not self._debug:
+            return self._text_pc[self._registers_origin[self._pc]]
+        return self._text_pc[self._pc]
+
+    def _memory_error(self, stack):
+        pc = self._loaded_pc()
+        if stack:
+            return StackOverflowError("Stack overflow.", pc, self._memory_limit)
+        return OutOfMemoryError("Out of memory.", pc, self._memory_limit)
+
+    def _print_state(self, row):
+        self._output.flush()
+        print("pc:", self._pc, ", sp:", self._sp)
+        print("M:", self._M)
+        print("D:", self._D)
+        print(row)
+
+    def _run_classic(self):
         while self._running:
             if self._debug:
-                print("pc:", self._pc, ", sp:", self._sp)
-                print("M:", self._M)
-                print("D:", self._D)
-                print(self._text[self._pc])
+                self._print_state(self._text[self._pc])
             self.exec_op(self._text[self._pc])
 
+    def _run_dispatch(self):
+        code = self._code
+        if self._debug:
+            while self._running:
+                handler, row = code[self._pc]
+                self._print_state(row)
+                handler(row)
+                self._pc += 1
+        else:
+            while self._running:
+                handler, row = code[self._pc]
+                handler(row)
+                self._pc += 1
+
+    def _run_blocks(self):
+        code = self._code
+        blocks = self._blocks
+        # after the memory grew the failed instruction may be inside a block,
+        # the dispatch engine runs up to the start of the next one
+        while self._running and blocks[self._pc] is None:
+            handler, row = code[self._pc]
+            handler(row)
+            self._pc += 1
+        if not self._running:
+            # the program ended before the next block
+            return
+        pc = self._pc
+        sp = self._sp
+        try:
+            while pc >= 0:
+                pc, sp = blocks[pc](sp)
+        except IndexError:
+            state = lya_blocks.fault_state(sys.exc_info()[2], self._blocks_lines)
+            # outside the blocks only blocks[pc] fails, pc is past the end
+            self._pc, self._sp = state if state is not None else (pc, sp)
+            raise
+        self._sp = sp
+
+    def _run_registers(self):
+        code = self._registers
+        while self._running:
+            handler, row = code[self._pc]
+            handler(row)
+            self._pc += 1
+
+    def _run_profile(self):
+        code = self._code
+        profile = self.profile
+        counts = profile.counts
+        calls = profile.calls
+        executed = profile.executed
+        try:
+            while self._running:
+                pc = self._pc
+                handler, row = code[pc]
+                handler(row)
+                # counted once done, a failed instruction runs again
+                counts[pc] += 1
+                if pc in calls:
+                    profile.event(row, executed)
+                executed += 1
+                self._pc += 1
+        finally:
+            profile.executed = executed
+
     def process_labels(self):
         for i in range(len(self._text)):
             row = self._text[i]
@@ -104,65 +464,67 @@ class Interpreter(object):
 
     def exec_op(self, row):
         if row[0] == 'ldc':
+            self._M[self._sp + 1] = row[1]
             self._sp += 1
-            self._M[self._sp] = row[1]
         elif row[0] == 'ldv':
+            self._M[self._sp + 1] = self._M[self._D[row[1]] + row[2]]
             self._sp += 1
-            self._M[self._sp] = self._M[self._D[row[1]] + row[2]]
         elif row[0] == 'ldr':
+            self._M[self._sp + 1] = self._D[row[1]] + row[2]
             self._sp += 1
-            self._M[self._sp] = self._D[row[1]] + row[2]
         elif row[0] == 'stv':
             self._M[self._D[row[1]]+row[2]] = self._M[self._sp]
             self._sp -= 1
+        elif row[0] == 'stk':
+            self._M[self._D[row[1]] + row[2]] = self._M[self._sp]
         elif row[0] == 'lrv':
+            self._M[self._sp + 1] = self._M[self._M[self._D[row[1]] + row[2]]]
             self._sp += 1
-            self._M[self._sp] = self._M[self._M[self._D[row[1]] + row[2]]]
         elif row[0] == 'srv':
             self._M[self._M[self._D[row[1]] + row[2]]] = self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'add':
-            self._M[self._sp - 1] = eval("{} + {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] + self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'sub':
-            self._M[self._sp - 1] = eval("{} - {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] - self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'mul':
-            self._M[self._sp - 1] = eval("{} * {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] * self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'div':
-            self._M[self._sp - 1] = eval("{} / {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] // self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'mod':
-            self._M[self._sp - 1] = eval("{} % {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] % self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'neg':
-            self._M[self._sp] = eval("-{}".format(self._M[self._sp]))
+            self._M[self._sp] = -self._M[self._sp]
         elif row[0] == 'and':
-            self._M[self._sp - 1] = eval("{} and {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] and self._M[self._sp]
             self._sp -= 1
-        elif row[0] == 'or':
-            self._M[self._sp - 1] = eval("{} or {}".format(self._M[self._sp - 1], self._M[self._sp]))
+        elif row[0] == 'or' or row[0] == 'lor':
+            self._M[self._sp - 1] = self._M[self._sp - 1] or self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'not':
-            self._M[self._sp] = eval("not({})".format(self._M[self._sp]))
+            self._M[self._sp] = not self._M[self._sp]
         elif row[0] == 'les':
-            self._M[self._sp - 1] = eval("{} < {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] < self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'leq':
-            self._M[self._sp - 1] = eval("{} <= {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] <= self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'grt':
-            self._M[self._sp - 1] = eval("{} > {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] > self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'gre':
-            self._M[self._sp - 1] = eval("{} >= {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] >= self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'equ':
-            self._M[self._sp - 1] = eval("{} == {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] == self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'neq':
-            self._M[self._sp - 1] = eval("{} != {}".format(self._M[self._sp - 1], self._M[self._sp]))
+            self._M[self._sp - 1] = self._M[self._sp - 1] != self._M[self._sp]
             self._sp -= 1
         elif row[0] == 'jmp':
             pos_dest = self._labels_ref.get(row[1], None)
@@ -177,19 +539,20 @@ class Interpreter(object):
                 self._pc = pos_dest - 1
             self._sp -= 1
         elif row[0] == 'alc':
+            self._ensure(self._sp + row[1] + 1, stack=True)
             self._sp += row[1]
         elif row[0] == 'dlc':
             self._sp -= row[1]
         elif row[0] == 'cfu':
+            self._M[self._sp + 1] = self._pc + 1
             self._sp += 1
-            self._M[self._sp] = self._pc + 1
             pos_dest = self._labels_ref.get(row[1], None)
             if pos_dest is None:
                 raise InterpreterError("Jump to a place not identified.", row[1])
             self._pc = pos_dest - 1
         elif row[0] == 'enf':
+            self._M[self._sp + 1] = self._D[row[1]]
             self._sp += 1
-            self._M[self._sp] = self._D[row[1]]
             self._D[row[1]] = self._sp + 1
         elif row[0] == 'ret':
             self._D[row[1]] = self._M[self._sp]
@@ -202,60 +565,61 @@ class Interpreter(object):
             self._M[self._sp] = self._M[self._M[self._sp]]
         elif row[0] == 'lmv':
             t = self._M[self._sp]
+            self._ensure(max(t, self._sp) + row[1])
             self._M[self._sp: self._sp + row[1]] = self._M[t: t + row[1]]
             self._sp += row[1] - 1
         elif row[0] == 'smv':
             t = self._M[self._sp - row[1]]
+            self._ensure(t + row[1])
             self._M[t: t + row[1]] = self._M[self._sp - row[1] + 1: self._sp + 1]
             self._sp -= row[1] + 1
         elif row[0] == 'smr':
             t1 = self._M[self._sp - 1]
             t2 = self._M[self._sp]
+            self._ensure(max(t1, t2) + row[1])
             self._M[t1: t1 + row[1]] = self._M[t2: t2 + row[1]]
             self._sp -= 1
         elif row[0] == 'sts':
             adr = self._M[self._sp]
+            self._ensure(adr + len(self._H[row[1]]) + 1)
             self._M[adr] = len(self._H[row[1]])
             for c in self._H[row[1]]:
                 adr += 1
                 self._M[adr] = c
             self._sp -= 1
         elif row[0] == 'rdv':
+            # the input is not read again if the memory has to grow
+            self._ensure(self._sp + 2, stack=True)
             self._sp += 1
-            if len(self._input_buffer) == 0:
-                self._input_buffer = raw_input().split(' ')
-            self._M[self._sp] = self._input_buffer[0]
-            self._input_buffer = self._input_buffer[1:]
+            self._M[self._sp] = self._input.token()
             if self._M[self._sp].isdigit():
                 self._M[self._sp] = int(self._M[self._sp])
             elif self._M[self._sp] == 'true':
-                self._M[self._sp] = "True"
+                self._M[self._sp] = True
             elif self._M[self._sp] == 'false':
-                self._M[self._sp] = "False"
+                self._M[self._sp] = False
             else:
                 raise InterpreterError("Invalid input, text when boolean or integer required.", self._M[self._sp])
         elif row[0] == 'rds':
-            _str = raw_input()
+            _str = self._input.line()
             adr = self._M[self._sp]
+            self._ensure(adr + len(_str) + 1)
             self._M[adr] = len(_str)
             for k in _str:
                 adr += 1
                 self._M[adr] = k
             self._sp -= 1
         elif row[0] == 'prv':
-            print(self._M[self._sp])
+            self._output.write(str(self._M[self._sp]) + "\n")
             self._sp -= 1
         elif row[0] == 'prt':
-            print(self._M[self._sp - row[1] + 1: self._sp + 1])
+            self._output.write(str(self._M[self._sp - row[1] + 1: self._sp + 1]) + "\n")
             self._sp -= row[1]-1
         elif row[0] == 'prc':
-            print(self._H[row[1]], end="")
+            self._output.write(self._H[row[1]])
         elif row[0] == 'prs':
             adr = self._M[self._sp]
-            _len = self._M[adr]
-            for i in range(_len):
-                adr += 1
-                print(self._M[adr], end="")
+            self._output.write("".join(map(str, self._M[adr + 1: adr + 1 + self._M[adr]])))
             self._sp -= 1
         elif row[0] == 'stp':
             self._sp = -1
@@ -264,9 +628,448 @@ class Interpreter(object):
             pass
         elif row[0] == 'end':
             self._running = False
+        elif row[0] == 'inc':
+            adr = self._D[row[1]] + row[2]
+            self._M[adr] = self._M[adr] + row[3]
+        elif row[0] in COMPARISONS:
+            if COMPARISONS[row[0]](self._M[self._sp - 1], self._M[self._sp]):
+                pos_dest = self._labels_ref.get(row[1], None)
+                if pos_dest is None:
+                    raise InterpreterError("Jump to a place not identified.", row[1])
+                self._pc = pos_dest - 1
+            self._sp -= 2
+        elif row[0][:3] == 'vv_':
+            self._M[self._sp + 1] = OPERATORS[row[0][3:]](self._M[self._D[row[1]] + row[2]],
+                                                          self._M[self._D[row[3]] + row[4]])
+            self._sp += 1
+        elif row[0][:3] == 'vc_':
+            self._M[self._sp + 1] = OPERATORS[row[0][3:]](self._M[self._D[row[1]] + row[2]], row[3])
+            self._sp += 1
         self._pc += 1
 
+    # Handlers of the dispatch engine, one per instruction. They have the same
+    # semantics as the branches of exec_op, the caller increments the pc.
+
+    def _op_ldc(self, row):
+        self._M[self._sp + 1] = row[1]
+        self._sp += 1
+
+    def _op_ldv(self, row):
+        self._M[self._sp + 1] = self._M[self._D[row[1]] + row[2]]
+        self._sp += 1
+
+    def _op_ldr(self, row):
+        self._M[self._sp + 1] = self._D[row[1]] + row[2]
+        self._sp += 1
+
+    def _op_stv(self, row):
+        self._M[self._D[row[1]] + row[2]] = self._M[self._sp]
+        self._sp -= 1
+
+    def _op_stk(self, row):
+        self._M[self._D[row[1]] + row[2]] = self._M[self._sp]
+
+    def _op_lrv(self, row):
+        self._M[self._sp + 1] = self._M[self._M[self._D[row[1]] + row[2]]]
+        self._sp += 1
+
+    def _op_srv(self, row):
+        self._M[self._M[self._D[row[1]] + row[2]]] = self._M[self._sp]
+        self._sp -= 1
+
+    def _op_add(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] + self._M[self._sp + 1]
+
+    def _op_sub(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] - self._M[self._sp + 1]
+
+    def _op_mul(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] * self._M[self._sp + 1]
+
+    def _op_div(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] // self._M[self._sp + 1]
+
+    def _op_mod(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] % self._M[self._sp + 1]
+
+    def _op_neg(self, row):
+        self._M[self._sp] = -self._M[self._sp]
+
+    def _op_and(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] and self._M[self._sp + 1]
+
+    def _op_or(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] or self._M[self._sp + 1]
+
+    def _op_not(self, row):
+        self._M[self._sp] = not self._M[self._sp]
+
+    def _op_les(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] < self._M[self._sp + 1]
+
+    def _op_leq(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] <= self._M[self._sp + 1]
+
+    def _op_grt(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] > self._M[self._sp + 1]
+
+    def _op_gre(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] >= self._M[self._sp + 1]
+
+    def _op_equ(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] == self._M[self._sp + 1]
+
+    def _op_neq(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] != self._M[self._sp + 1]
+
+    # the operand of jmp, jof and cfu is already the pc resolved by link()
+
+    def _op_jmp(self, row):
+        self._pc = row[1] - 1
+
+    def _op_jof(self, row):
+        if not self._M[self._sp]:
+            self._pc = row[1] - 1
+        self._sp -= 1
+
+    def _op_alc(self, row):
+        self._ensure(self._sp + row[1] + 1, stack=True)
+        self._sp += row[1]
+
+    def _op_dlc(self, row):
+        self._sp -= row[1]
+
+    def _op_cfu(self, row):
+        self._M[self._sp + 1] = self._pc + 1
+        self._sp += 1
+        self._pc = row[1] - 1
+
+    def _op_enf(self, row):
+        self._M[self._sp + 1] = self._D[row[1]]
+        self._sp += 1
+        self._D[row[1]] = self._sp + 1
+
+    def _op_ret(self, row):
+        self._D[row[1]] = self._M[self._sp]
+        self._pc = self._M[self._sp - 1] - 1
+        self._sp -= (row[2]+2)
+
+    def _op_idx(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] + self._M[self._sp + 1] * row[1]
+
+    def _op_grc(self, row):
+        self._M[self._sp] = self._M[self._M[self._sp]]
+
+    def _op_lmv(self, row):
+        t = self._M[self._sp]
+        self._ensure(max(t, self._sp) + row[1])
+        self._M[self._sp: self._sp + row[1]] = self._M[t: t + row[1]]
+        self._sp += row[1] - 1
+
+    def _op_smv(self, row):
+        t = self._M[self._sp - row[1]]
+        self._ensure(t + row[1])
+        self._M[t: t + row[1]] = self._M[self._sp - row[1] + 1: self._sp + 1]
+        self._sp -= row[1] + 1
+
+    def _op_smr(self, row):
+        t1 = self._M[self._sp - 1]
+        t2 = self._M[self._sp]
+        self._ensure(max(t1, t2) + row[1])
+        self._M[t1: t1 + row[1]] = self._M[t2: t2 + row[1]]
+        self._sp -= 1
+
+    def _op_sts(self, row):
+        adr = self._M[self._sp]
+        self._ensure(adr + len(self._H[row[1]]) + 1)
+        self._M[adr] = len(self._H[row[1]])
+        for c in self._H[row[1]]:
+            adr += 1
+            self._M[adr] = c
+        self._sp -= 1
+
+    def _op_rdv(self, row):
+        # the input is not read again if the memory has to grow
+        self._ensure(self._sp + 2, stack=True)
+        self._sp += 1
+        self._M[self._sp] = self._input.value()
+
+    def _op_rds(self, row):
+        _str = self._input.line()
+        adr = self._M[self._sp]
+        self._ensure(adr + len(_str) + 1)
+        self._M[adr] = len(_str)
+        for k in _str:
+            adr += 1
+            self._M[adr] = k
+        self._sp -= 1
+
+    def _op_prv(self, row):
+        self._output.write(str(self._M[self._sp]) + "\n")
+        self._sp -= 1
+
+    def _op_prt(self, row):
+        self._output.write(str(self._M[self._sp - row[1] + 1: self._sp + 1]) + "\n")
+        self._sp -= row[1]-1
+
+    def _op_prc(self, row):
+        self._output.write(self._H[row[1]])
+
+    def _op_prs(self, row):
+        adr = self._M[self._sp]
+        self._output.write("".join(map(str, self._M[adr + 1: adr + 1 + self._M[adr]])))
+        self._sp -= 1
+
+    def _op_stp(self, row):
+        self._sp = -1
+        self._D[0] = 0
+
+    def _op_end(self, row):
+        self._running = False
+
+    # Superinstructions, see lya_bytecode. The handlers of the fused
+    # operations are built for each operator.
+
+    def _op_inc(self, row):
+        adr = self._D[row[1]] + row[2]
+        self._M[adr] = self._M[adr] + row[3]
+
+    def _compare_jump(self, f):
+        def handler(row):
+            self._sp -= 2
+            if f(self._M[self._sp + 1], self._M[self._sp + 2]):
+                self._pc = row[1] - 1
+        return handler
+
+    def _values_operation(self, f, tag=None):
+        def handler(row):
+            M = self._M
+            M[self._sp + 1] = f(M[self._D[row[1]] + row[2]], M[self._D[row[3]] + row[4]])
+            if tag is not None:
+                self._T[self._sp + 1] = tag
+            self._sp += 1
+        return handler
+
+    def _value_constant_operation(self, f, tag=None):
+        def handler(row):
+            M = self._M
+            M[self._sp + 1] = f(M[self._D[row[1]] + row[2]], row[3])
+            if tag is not None:
+                self._T[self._sp + 1] = tag
+            self._sp += 1
+        return handler
+
+    # Handlers of the typed memory. Every value is stored as an integer in _M
+    # and its kind in _T, so the values are printed as in the list memory.
+    # 'ldc' rows hold (op, value, kind) once linked.
+
+    def _typed_ldc(self, row):
+        self._M[self._sp + 1] = row[1]
+        self._T[self._sp + 1] = row[2]
+        self._sp += 1
+
+    def _typed_ldv(self, row):
+        adr = self._D[row[1]] + row[2]
+        self._M[self._sp + 1] = self._M[adr]
+        self._T[self._sp + 1] = self._T[adr]
+        self._sp += 1
+
+    def _typed_ldr(self, row):
+        self._M[self._sp + 1] = self._D[row[1]] + row[2]
+        self._T[self._sp + 1] = lya_bytecode.TAG_INT
+        self._sp += 1
+
+    def _typed_stv(self, row):
+        adr = self._D[row[1]] + row[2]
+        self._M[adr] = self._M[self._sp]
+        self._T[adr] = self._T[self._sp]
+        self._sp -= 1
+
+    def _typed_stk(self, row):
+        adr = self._D[row[1]] + row[2]
+        self._M[adr] = self._M[self._sp]
+        self._T[adr] = self._T[self._sp]
+
+    def _typed_lrv(self, row):
+        adr = self._M[self._D[row[1]] + row[2]]
+        self._M[self._sp + 1] = self._M[adr]
+        self._T[self._sp + 1] = self._T[adr]
+        self._sp += 1
+
+    def _typed_srv(self, row):
+        adr = self._M[self._D[row[1]] + row[2]]
+        self._M[adr] = self._M[self._sp]
+        self._T[adr] = self._T[self._sp]
+        self._sp -= 1
+
+    def _typed_not(self, row):
+        self._M[self._sp] = not self._M[self._sp]
+        self._T[self._sp] = lya_bytecode.TAG_BOOL
+
+    def _typed_les(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] < self._M[self._sp + 1]
+        self._T[self._sp] = lya_bytecode.TAG_BOOL
+
+    def _typed_leq(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] <= self._M[self._sp + 1]
+        self._T[self._sp] = lya_bytecode.TAG_BOOL
+
+    def _typed_grt(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] > self._M[self._sp + 1]
+        self._T[self._sp] = lya_bytecode.TAG_BOOL
+
+    def _typed_gre(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] >= self._M[self._sp + 1]
+        self._T[self._sp] = lya_bytecode.TAG_BOOL
+
+    def _typed_equ(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] == self._M[self._sp + 1]
+        self._T[self._sp] = lya_bytecode.TAG_BOOL
+
+    def _typed_neq(self, row):
+        self._sp -= 1
+        self._M[self._sp] = self._M[self._sp] != self._M[self._sp + 1]
+        self._T[self._sp] = lya_bytecode.TAG_BOOL
+
+    def _typed_cfu(self, row):
+        self._M[self._sp + 1] = self._pc + 1
+        self._T[self._sp + 1] = lya_bytecode.TAG_INT
+        self._sp += 1
+        self._pc = row[1] - 1
+
+    def _typed_enf(self, row):
+        self._M[self._sp + 1] = self._D[row[1]]
+        self._T[self._sp + 1] = lya_bytecode.TAG_INT
+        self._sp += 1
+        self._D[row[1]] = self._sp + 1
+
+    def _typed_grc(self, row):
+        adr = self._M[self._sp]
+        self._M[self._sp] = self._M[adr]
+        self._T[self._sp] = self._T[adr]
+
+    # the block moves copy slices of both arrays
+
+    def _typed_lmv(self, row):
+        t = self._M[self._sp]
+        self._ensure(max(t, self._sp) + row[1])
+        self._M[self._sp: self._sp + row[1]] = self._M[t: t + row[1]]
+        self._T[self._sp: self._sp + row[1]] = self._T[t: t + row[1]]
+        self._sp += row[1] - 1
+
+    def _typed_smv(self, row):
+        t = self._M[self._sp - row[1]]
+        self._ensure(t + row[1])
+        self._M[t: t + row[1]] = self._M[self._sp - row[1] + 1: self._sp + 1]
+        self._T[t: t + row[1]] = self._T[self._sp - row[1] + 1: self._sp + 1]
+        self._sp -= row[1] + 1
+
+    def _typed_smr(self, row):
+        t1 = self._M[self._sp - 1]
+        t2 = self._M[self._sp]
+        self._ensure(max(t1, t2) + row[1])
+        self._M[t1: t1 + row[1]] = self._M[t2: t2 + row[1]]
+        self._T[t1: t1 + row[1]] = self._T[t2: t2 + row[1]]
+        self._sp -= 1
+
+    def _typed_sts(self, row):
+        codes, tags = self._H_codes[row[1]]
+        adr = self._M[self._sp]
+        self._ensure(adr + len(codes))
+        self._M[adr: adr + len(codes)] = codes
+        self._T[adr: adr + len(codes)] = tags
+        self._sp -= 1
+
+    def _typed_rdv(self, row):
+        self._ensure(self._sp + 2, stack=True)
+        value = self._input.value()
+        self._M[self._sp + 1] = value
+        self._T[self._sp + 1] = lya_bytecode.TAG_BOOL if type(value) == bool else lya_bytecode.TAG_INT
+        self._sp += 1
+
+    def _typed_rds(self, row):
+        _str = self._input.line()
+        adr = self._M[self._sp]
+        self._ensure(adr + len(_str) + 1)
+        self._M[adr: adr + len(_str) + 1] = array(CELL, [len(_str)] + [ord(c) for c in _str])
+        self._T[adr] = lya_bytecode.TAG_INT
+        self._T[adr + 1: adr + len(_str) + 1] = array('B', [lya_bytecode.TAG_CHAR]) * len(_str)
+        self._sp -= 1
+
+    def _typed_prv(self, row):
+        self._output.write(str(lya_bytecode.decode_operand(self._T[self._sp], self._M[self._sp])) + "\n")
+        self._sp -= 1
+
+    def _typed_prt(self, row):
+        first = self._sp - row[1] + 1
+        self._output.write(str(map(lya_bytecode.decode_operand, self._T[first: self._sp + 1],
+                                   self._M[first: self._sp + 1])) + "\n")
+        self._sp -= row[1]-1
+
+    def _typed_prs(self, row):
+        adr = self._M[self._sp]
+        self._output.write("".join(map(chr, self._M[adr + 1: adr + 1 + self._M[adr]])))
+        self._sp -= 1
+
 
 if __name__ == "__main__":
-    i = Interpreter(False)
-    i.load_program()
+    parser = argparse.ArgumentParser(description='Run a compiled lya program.')
+    parser.add_argument('files', metavar='files', type=str, nargs='*',
+                        help='the compiled programs')
+    parser.add_argument('-engine', dest='engine', choices=Interpreter.ENGINES,
+                        default='dispatch', help='select the execution engine')
+    parser.add_argument('-memory', dest='memory', choices=Interpreter.MEMORIES,
+                        default='list', help='select how the memory cells are stored')
+    parser.add_argument('-memory-size', dest='memory_size', type=int, default=Interpreter.MEMORY_SIZE,
+                        help='initial number of memory cells')
+    parser.add_argument('-memory-limit', dest='memory_limit', type=int, default=Interpreter.MEMORY_LIMIT,
+                        help='maximum number of memory cells')
+    parser.add_argument('-profile', dest='profile', action='store_const',
+                        const=True, default=False,
+                        help='count the instructions and the calls, print the report on stderr')
+    parser.add_argument('-profile-json', dest='profile_json', type=str, default=None,
+                        help='write the profiles to this JSON file')
+    args = parser.parse_args()
+    profile = args.profile or args.profile_json is not None
+    i = Interpreter(False, engine=args.engine, files=args.files,
+                    memory_size=args.memory_size, memory_limit=args.memory_limit, memory=args.memory,
+                    profile=profile)
+    if not profile:
+        i.load_program()
+    else:
+        # the profiles of the programs that failed too
+        profiles = []
+        try:
+            for name in args.files:
+                try:
+                    i.load_program(name)
+                finally:
+                    if i.profile is not None:
+                        if args.profile:
+                            print(name, file=sys.stderr)
+                            i.profile.report(sys.stderr)
+                        profiles.append(dict(i.profile.as_dict(), file=name))
+                        i.profile = None
+        finally:
+            if args.profile_json is not None:
+                with open(args.profile_json, 'w') as f:
+                    json.dump(profiles, f, indent=1)
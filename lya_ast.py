@@ -1,34 +1,34 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
+import operator
+
 from lya_environment import *
 from lya_errors import *
 from lya_codeprinter import CodePrinter
 from lya_codegen import CodeGen
 
-environment = Environment()
 
-# prints the code of a tree object
-cp = CodePrinter()
-cg = CodeGen()
-#li = LabelInformation()
+# the operations of the ints folded while compiling, as the LVM runs them
+INT_OPERATORS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.floordiv, '%': operator.mod}
 
 
-def reset():
-    global environment
-    environment = Environment()
-    global cg
-    cg = CodeGen()
+class Context(object):
+    """State of one compilation, passed along the visit_node, generate_code1
+    and print_code walks so that compilations do not share anything."""
+    def __init__(self, printer=None):
+        self.environment = Environment()
+        # prints the code of a tree object
+        if printer is None:
+            printer = CodePrinter(None)
+        self.cp = printer
+        self.cg = CodeGen()
 
 
 class AST(object):
     _fields = ["program"]
     lineno = None
 
-    def set_output(self, output_file):
-        global cp
-        cp = CodePrinter(output_file)
-
     def __init__(self, *args, **kwargs):
         assert len(args) == len(self._fields)
         for name, value in zip(self._fields, args):
@@ -38,7 +38,10 @@ class AST(object):
             setattr(self, name, value)
         self.type = self.__class__.__name__.lower()
 
-        self.location = "(at line: " + str(self.lineno) + ")"
+    @property
+    def location(self):
+        # only the printing and the messages need it, a string per node is not kept
+        return "(at line: " + str(self.lineno) + ")"
 
     # Returns the name of the class to printing
     def get_type_formated(self):
@@ -62,30 +65,30 @@ class AST(object):
     def print_node(self, spacing):
         raise InvalidASTNode("printNode not defined", "on class " + self)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         raise InvalidASTNode("visitNode not defined", "on class " + self)
 
-    def check_assignment_type(self, mode, expression, identifier, elementMode=None):
+    def check_assignment_type(self, ctx, mode, expression, identifier, elementMode=None):
         if expression.valueType == "empty_literal" or expression.valueType == "builtin_call":
             expression.valueType = None
 
         if mode == "int" and (expression.valueType is None or expression.valueType == "int"):
-            environment.add_local(identifier.id, IntType(identifier.id, expression))
+            ctx.environment.add_local(identifier.id, IntType(identifier.id, expression))
             return True
         elif mode == "char" and (expression.valueType is None or expression.valueType == "char"):
-            environment.add_local(identifier.id, CharType(identifier.id, expression))
+            ctx.environment.add_local(identifier.id, CharType(identifier.id, expression))
             return True
         elif mode == "bool" and (expression.valueType is None or expression.valueType == "bool"):
-            environment.add_local(identifier.id, BoolType(identifier.id, expression))
+            ctx.environment.add_local(identifier.id, BoolType(identifier.id, expression))
             return True
         elif mode == "string" and (expression.valueType is None or expression.valueType == "string"):
-            environment.add_local(identifier.id, StringType(identifier.id, expression))
+            ctx.environment.add_local(identifier.id, StringType(identifier.id, expression))
             return True
         elif hasattr(mode, "type") and mode.type == "array":
-            environment.add_local(identifier.id, ArrayType(identifier.id, mode.elementMode, expression)) 
+            ctx.environment.add_local(identifier.id, ArrayType(identifier.id, mode.elementMode, expression)) 
             return True
         elif mode == "array":
-            environment.add_local(identifier.id, ArrayType(identifier.id, elementMode, expression)) 
+            ctx.environment.add_local(identifier.id, ArrayType(identifier.id, elementMode, expression)) 
             return True  
 
         # Not added, the caller should raise an error   
@@ -105,39 +108,50 @@ class AST(object):
             
         return x
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         raise InvalidASTNode("generateCode1 not defined", "on class " + str(self))
 
-    def print_code(self):
+    def print_code(self, ctx):
         raise InvalidASTNode("printCode not defined", "on class " + str(self))
 
-    def print_operator(self, operator):
+    def constant_value(self, ctx):
+        # the value known while compiling, None if it is only known when running
+        return None
+
+    def print_address(self, ctx, ret):
+        # the loc and array parameters hold the address of their location
+        if ret.type == "parameter" and (ret.isLocation or ret.indexList is not None):
+            ctx.cp.loadValue(ret.scope, ret.idStart)
+        else:
+            ctx.cp.loadReference(ret.scope, ret.idStart)
+
+    def print_operator(self, ctx, operator):
         if operator == '+':
-            cp.add()
+            ctx.cp.add()
         elif operator == '-':
-            cp.subtract()
+            ctx.cp.subtract()
         elif operator == '*':
-            cp.multiply()
+            ctx.cp.multiply()
         elif operator == '/':
-            cp.subtract()
+            ctx.cp.division()
         elif operator == '%':
-            cp.modulus()
+            ctx.cp.modulus()
         elif operator == '&&':
-            cp.logicalAnd()
+            ctx.cp.logicalAnd()
         elif operator == '||':
-            cp.logicalOr()
+            ctx.cp.logicalOr()
         elif operator == '==':
-            cp.equal()
+            ctx.cp.equal()
         elif operator == '!=':
-            cp.notEqual()
+            ctx.cp.notEqual()
         elif operator == '>':
-            cp.greater()
+            ctx.cp.greater()
         elif operator == '>=':
-            cp.greaterOrEqual()
+            ctx.cp.greaterOrEqual()
         elif operator == '<':
-            cp.less()
+            ctx.cp.less()
         elif operator == '<=':
-            cp.lessOrEqual()
+            ctx.cp.lessOrEqual()
 
 
 class Program(AST):
@@ -152,25 +166,25 @@ class Program(AST):
         self.print_spacing(spacing)
         self.statement_list.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.statement_list.visit_node()
+    def visit_node(self, ctx):
+        self.statement_list.visit_node(ctx)
 
-    def generate_code1(self):
-        self.statement_list.generate_code1()
-        self.print_code()
+    def generate_code1(self, ctx):
+        self.statement_list.generate_code1(ctx)
+        self.print_code(ctx)
 
-    def print_code(self):
-        strs = cg.get_all_str()
+    def print_code(self, ctx):
+        strs = ctx.cg.get_all_str()
         other_ref_strs = [0]*len(strs)
         for i, j in strs.items():
             other_ref_strs[j] = i
         if len(other_ref_strs) > 0:
-            cp.printStrs(other_ref_strs)
-        cp.startProgram()
+            ctx.cp.printStrs(other_ref_strs)
+        ctx.cp.startProgram()
         _min = 99999999
         _max = 0
-        for j in cg.curr_node.st:
-            i = cg.curr_node.st[j]
+        for j in ctx.cg.curr_node.st:
+            i = ctx.cg.curr_node.st[j]
             if i.type != "declaration":
                 continue
             if i.idStart < _min:
@@ -178,11 +192,11 @@ class Program(AST):
             if i.idEnd > _max:
                 _max = i.idEnd
         if _min <= _max:
-            cp.alocateMemory(_max-_min)
-        self.statement_list.print_code()
+            ctx.cp.alocateMemory(_max-_min)
+        self.statement_list.print_code(ctx)
         if _min <= _max:
-            cp.deallocateMemory(_max-_min)
-        cp.endProgram()
+            ctx.cp.deallocateMemory(_max-_min)
+        ctx.cp.endProgram()
 
 
 class Statement_list(AST):
@@ -198,17 +212,17 @@ class Statement_list(AST):
         for statements in self.statements:
             statements.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         for statements in self.statements:
-            statements.visit_node()
+            statements.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         for statements in self.statements:
-            statements.generate_code1()
+            statements.generate_code1(ctx)
 
-    def print_code(self):
+    def print_code(self, ctx):
         for statements in self.statements:
-            statements.print_code()
+            statements.print_code(ctx)
 
 
 class Declaration_statement(AST):
@@ -223,14 +237,14 @@ class Declaration_statement(AST):
         self.print_spacing(spacing)
         self.declaration_list.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.declaration_list.visit_node()
+    def visit_node(self, ctx):
+        self.declaration_list.visit_node(ctx)
 
-    def generate_code1(self):
-        self.declaration_list.generate_code1()
+    def generate_code1(self, ctx):
+        self.declaration_list.generate_code1(ctx)
 
-    def print_code(self):
-        self.declaration_list.print_code()
+    def print_code(self, ctx):
+        self.declaration_list.print_code(ctx)
 
 
 class Declaration_list(AST):
@@ -246,17 +260,17 @@ class Declaration_list(AST):
         for declaration in self.declarations:
             declaration.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         for declaration in self.declarations:
-            declaration.visit_node()
+            declaration.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         for declaration in self.declarations:
-            declaration.generate_code1()
+            declaration.generate_code1(ctx)
 
-    def print_code(self):
+    def print_code(self, ctx):
         for declaration in self.declarations:
-            declaration.print_code()
+            declaration.print_code(ctx)
 
 
 class Declaration(AST):
@@ -274,15 +288,15 @@ class Declaration(AST):
         if self.initialization is not None:
             self.initialization.print_node(spacing)
 
-    def visit_node(self):
-        identifierList = self.identifier_list.visit_node(declaring=True)
-        mode = self.mode.visit_node()
+    def visit_node(self, ctx):
+        identifierList = self.identifier_list.visit_node(ctx, declaring=True)
+        mode = self.mode.visit_node(ctx)
 
         # Initialization is an expression
         initialization = None
 
         if self.initialization is not None:
-            initialization = self.initialization.visit_node()
+            initialization = self.initialization.visit_node(ctx)
 
         # if there is no initialization   
         if initialization is None:
@@ -296,33 +310,33 @@ class Declaration(AST):
 
         if isDiscreteRangeMode is False:
             for identifier in identifierList:
-                if self.check_assignment_type(mode, initialization, identifier) is False:
+                if self.check_assignment_type(ctx, mode, initialization, identifier) is False:
                     raise InitializationError(str(initialization.value) + " is not a {0}, it is a {2}. Line={1}".format(mode, self.lineno, initialization.valueType), "Be sure to check variables types.")
 
-    def generate_code1(self):
-        identifierList = self.identifier_list.generate_code1()
-        mode = self.mode.generate_code1()
+    def generate_code1(self, ctx):
+        identifierList = self.identifier_list.generate_code1(ctx)
+        mode = self.mode.generate_code1(ctx)
 
         # Initialization is an expression
         initialization = None
 
         if self.initialization is not None:
-            initialization = self.initialization.generate_code1()
+            initialization = self.initialization.generate_code1(ctx)
 
-        cg.declaration(identifierList, mode)
+        ctx.cg.declaration(identifierList, mode)
 
-    def print_code(self):
-        identifierList = self.identifier_list.print_code()
-        mode = self.mode.print_code()
+    def print_code(self, ctx):
+        identifierList = self.identifier_list.print_code(ctx)
+        mode = self.mode.print_code(ctx)
 
         initialization = None
 
         if self.initialization is not None:
             for i in identifierList:
-                initialization = self.initialization.print_code()
+                initialization = self.initialization.print_code(ctx)
 
-                ret = cg.curr_node.lookup(i)
-                cp.storeValue(ret.scope, ret.idStart)
+                ret = ctx.cg.curr_node.lookup(i)
+                ctx.cp.storeValue(ret.scope, ret.idStart)
 
 
 class Identifier_list(AST):
@@ -337,20 +351,20 @@ class Identifier_list(AST):
         for identifier in self.identifiers:
             identifier.print_node(spacing)
 
-    def visit_node(self, declaring=None):
+    def visit_node(self, ctx, declaring=None):
         identifierList = list()
         for identifier in self.identifiers:
-            identifierList.append(identifier.visit_node(declaring))
+            identifierList.append(identifier.visit_node(ctx, declaring))
             
         return identifierList
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         self.identifierList = list()
         for identifier in self.identifiers:
-            self.identifierList.append(identifier.generate_code1().id)
+            self.identifierList.append(identifier.generate_code1(ctx).id)
         return self.identifierList
 
-    def print_code(self,type="load"):
+    def print_code(self, ctx, type="load"):
         return self.identifierList
 
 
@@ -365,31 +379,34 @@ class Identifier(AST):
     def print_node(self, spacing):
         print spacing * " " +  "ID: " + self.id + " " + self.location
 
-    def visit_node(self, declaring=None):
-        if declaring is None and environment.lookup(self.id) is None:
+    def visit_node(self, ctx, declaring=None):
+        if declaring is None and ctx.environment.lookup(self.id) is None:
             raise DefinitionError("'{0}' is not defined. Line = {1}.".format(self.id, self.lineno), "Be sure to declare variable before usage.")
-        elif declaring is True and environment.find(self.id) is True:
+        elif declaring is True and ctx.environment.find(self.id) is True:
             raise DefinitionError("'{0}' is already declared in this scope. Line = {1}.".format(self.id, self.lineno), "Do not declare the same variable twice in the same scope.")
         return self
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         return self
 
 
-    def print_code(self, type="load"):
-        ret = cg.curr_node.lookup(self.id)
+    def print_code(self, ctx, type="load"):
+        ret = ctx.cg.curr_node.lookup(self.id)
 
         if ret.type == "synonym":
-            cp.loadConstant(ret.value)
+            ctx.cp.loadConstant(ret.value)
+            return
 
         try:
             if ret.indexList is not None:
-                cp.loadReference(ret.scope, ret.idStart)
+                self.print_address(ctx, ret)
                 if type == "store":
-                    cp.loadMultipleValues(ret.idSize)
-                    cp.storeMultipleValues(ret.idSize)
-                elif type == "slice":
-                    ret.indexList[0].print_code()
+                    # an array parameter is the address of the values
+                    size = ret.idSize
+                    if ret.type == "parameter":
+                        size = ctx.cg.calculateIndexesSize(ret.indexList)
+                    ctx.cp.loadMultipleValues(size)
+                    ctx.cp.storeMultipleValues(size)
                 return
         except:
             pass
@@ -397,24 +414,30 @@ class Identifier(AST):
         else:
             if type == "store":
                 if ret.isLocation:
-                    cp.storeReferenceValue(ret.scope, ret.idStart)
+                    ctx.cp.storeReferenceValue(ret.scope, ret.idStart)
                 else:
-                    cp.storeValue(ret.scope, ret.idStart)
+                    ctx.cp.storeValue(ret.scope, ret.idStart)
             elif type == "load":
                 if ret is not None and ret.mode is not None and hasattr(ret.mode, "type") and ret.mode.type == "array":
-                    cp.loadReference(ret.scope,ret.idStart)
+                    self.print_address(ctx, ret)
                 elif ret.isLocation:
-                    cp.loadReferenceValue(ret.scope, ret.idStart)
+                    ctx.cp.loadReferenceValue(ret.scope, ret.idStart)
                 else:
-                    cp.loadValue(ret.scope, ret.idStart)
+                    ctx.cp.loadValue(ret.scope, ret.idStart)
             elif type == "load_reference_value":
-                cp.loadReferenceValue(ret.scope, ret.idStart)
+                ctx.cp.loadReferenceValue(ret.scope, ret.idStart)
             elif type == "load_reference":
-                cp.loadReference(ret.scope, ret.idStart)
+                self.print_address(ctx, ret)
             elif type == "referenced_location":
-                cp.loadReference(ret.scope, ret.idStart)
+                self.print_address(ctx, ret)
             elif type == "store_reference_value":
-                cp.storeReferenceValue(ret.scope, ret.idStart)
+                ctx.cp.storeReferenceValue(ret.scope, ret.idStart)
+
+    def constant_value(self, ctx):
+        ret = ctx.cg.curr_node.lookup(self.id)
+        if ret is not None and ret.type == "synonym":
+            return ret.value
+        return None
 
 
 class Synonym_list(AST):
@@ -429,15 +452,15 @@ class Synonym_list(AST):
         for synonym in self.synonym_definitions:
             synonym.print_node(spacing)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         for synonym in self.synonym_definitions:
-            synonym.visit_node()
+            synonym.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         for synonym in self.synonym_definitions:
-            synonym.generate_code1()
+            synonym.generate_code1(ctx)
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -457,16 +480,16 @@ class Synonym_definition(AST):
             self.mode.print_node(spacing + 2)
         self.constant_expression.print_node(spacing + 2)
 
-    def visit_node(self):
-        identifierList = self.identifier_list.visit_node(declaring=True)
+    def visit_node(self, ctx):
+        identifierList = self.identifier_list.visit_node(ctx, declaring=True)
 
         mode = None
         if self.mode:
-            mode = self.mode.visit_node()
+            mode = self.mode.visit_node(ctx)
 
         initialization = None
         if self.constant_expression is not None:
-            initialization = self.constant_expression.visit_node()
+            initialization = self.constant_expression.visit_node(ctx)
 
         if initialization is None:
             raise UnexpectedError(initialization, "SYN initialization must have a value.")
@@ -476,31 +499,32 @@ class Synonym_definition(AST):
 
         for identifier in identifierList:
             if mode == "int" and (initialization.valueType is None or initialization.valueType == "int"):
-                environment.add_local(identifier.id, IntType(identifier, initialization, synonym=True))
+                ctx.environment.add_local(identifier.id, IntType(identifier, initialization, synonym=True))
             elif mode == "char" and (initialization.valueType is None or initialization.valueType == "char"):
-                environment.add_local(identifier.id, CharType(identifier, initialization, synonym=True))
+                ctx.environment.add_local(identifier.id, CharType(identifier, initialization, synonym=True))
             elif mode == "bool" and (initialization.valueType is None or initialization.valueType == "bool"):
-                environment.add_local(identifier.id, BoolType(identifier, initialization, synonym=True))
+                ctx.environment.add_local(identifier.id, BoolType(identifier, initialization, synonym=True))
             elif mode == "string" and (initialization.valueType is None or initialization.valueType == "string"):
-                environment.add_local(identifier.id, StringType(identifier, initialization, synonym=True))
+                ctx.environment.add_local(identifier.id, StringType(identifier, initialization, synonym=True))
             else:
                 raise InitializationError(initialization.value + "is not a {0}. Line={1}".format(mode, self.lineno), "")
 
-    def generate_code1(self):
-        identifierList = self.identifier_list.generate_code1()
-        initialization = self.constant_expression.generate_code1()
+    def generate_code1(self, ctx):
+        identifierList = self.identifier_list.generate_code1(ctx)
+        self.constant_expression.generate_code1(ctx)
+        value = self.constant_expression.constant_value(ctx)
 
-        mode = None
-        if self.mode:
-            mode = self.mode.generate_code1()
+        if value is None:
+            raise UnexpectedError("SYN initialization must be a constant. Line={0}".format(self.lineno), "")
 
-        # mode must be the same of the initialization
-        if mode is None:
-            mode = initialization.valueType
+        # without a mode, the synonym has the mode of the initialization
+        mode = self.constant_expression.valueType
+        if self.mode:
+            mode = self.mode.generate_code1(ctx)
 
-        cg.synonymDefinition(identifierList, mode, initialization)
+        ctx.cg.synonymDefinition(identifierList, mode, value)
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -516,13 +540,13 @@ class Newmode_statement(AST):
         self.print_spacing(spacing)
         self.newmode_list.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.newmode_list.visit_node()
+    def visit_node(self, ctx):
+        self.newmode_list.visit_node(ctx)
 
-    def generate_code1(self):
-        self.newmode_list.generate_code1()
+    def generate_code1(self, ctx):
+        self.newmode_list.generate_code1(ctx)
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -538,15 +562,15 @@ class Newmode_list(AST):
         for modeDefinition in self.mode_definitions:
             modeDefinition.print_node(spacing)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         for modeDefinition in self.mode_definitions:
-            modeDefinition.visit_node()
+            modeDefinition.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         for modeDefinition in self.mode_definitions:
-            modeDefinition.generate_code1()
+            modeDefinition.generate_code1(ctx)
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -563,30 +587,30 @@ class Mode_definition(AST):
         self.identifier_list.print_node(spacing + 2)
         self.mode.print_node(spacing + 2)
 
-    def visit_node(self):
-        identifierList = self.identifier_list.visit_node(declaring=True)
-        mode = self.mode.visit_node()
+    def visit_node(self, ctx):
+        identifierList = self.identifier_list.visit_node(ctx, declaring=True)
+        mode = self.mode.visit_node(ctx)
         
         for identifier in identifierList:
             if mode == "int":
-                environment.add_local(identifier.id, IntType(identifier, None))
+                ctx.environment.add_local(identifier.id, IntType(identifier, None))
             elif mode == "char":
-                environment.add_local(identifier.id, CharType(identifier, None))
+                ctx.environment.add_local(identifier.id, CharType(identifier, None))
             elif mode == "bool" :
-                environment.add_local(identifier.id, BoolType(identifier, None))
+                ctx.environment.add_local(identifier.id, BoolType(identifier, None))
             elif mode == "string":
-                environment.add_local(identifier.id, StringType(identifier, None))
+                ctx.environment.add_local(identifier.id, StringType(identifier, None))
             elif hasattr(mode, "type") and mode.type == "array":
-                environment.add_local(identifier.id, ArrayType(identifier, mode.elementMode, None)) 
+                ctx.environment.add_local(identifier.id, ArrayType(identifier, mode.elementMode, None)) 
             else:
                 raise NewModeStatementError("Mode {0} unknown. Line={1}".format(mode, self.lineno), "")
 
-    def generate_code1(self):
-        identifierList = self.identifier_list.generate_code1()
-        mode = self.mode.generate_code1()
-        cg.modeDefinition(identifierList, mode)
+    def generate_code1(self, ctx):
+        identifierList = self.identifier_list.generate_code1(ctx)
+        mode = self.mode.generate_code1(ctx)
+        ctx.cg.modeDefinition(identifierList, mode)
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -602,15 +626,15 @@ class Mode(AST):
         self.print_spacing(spacing)
         self.mode_type.print_node(spacing + 2)
 
-    def visit_node(self):
-        mode = self.mode_type.visit_node()
+    def visit_node(self, ctx):
+        mode = self.mode_type.visit_node(ctx)
         self.modeId = None
         self.modeIdType = None
         
         # if a mode is already defined
         if hasattr(mode, "type") and mode.type == "identifier":
             self.modeId = mode.id
-            self.modeIdType = environment.lookup(mode.id)
+            self.modeIdType = ctx.environment.lookup(mode.id)
             self.type = self.modeIdType.type
             
             if self.modeIdType.type == "array":
@@ -619,8 +643,8 @@ class Mode(AST):
             
         return mode
 
-    def generate_code1(self):
-        modeType = self.mode_type.generate_code1()
+    def generate_code1(self, ctx):
+        modeType = self.mode_type.generate_code1(ctx)
         self.isReference = False
         self.type2 = modeType.type
         self.modeNameModeId = None
@@ -648,7 +672,7 @@ class Mode(AST):
         return self
 
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -663,17 +687,17 @@ class Discrete_mode(AST):
     def print_node(self, spacing):
         self.print_spacing(spacing, self.discrete_mode_type, self.location)
 
-    def visit_node(self, declaring=None):
+    def visit_node(self, ctx, declaring=None):
         return self.discrete_mode_type
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         self.mode = None
         self.discreteRangeModeName = None
         self.discreteRangeModeLiteralRange = None
 
         try:
             # if it is discrete_range_mode
-            discreteModeType = self.discrete_mode_type.generate_code1()
+            discreteModeType = self.discrete_mode_type.generate_code1(ctx)
             self.mode = discreteModeType.type
             self.discreteRangeModeName = discreteModeType.discreteModeName
             self.discreteRangeModeLiteralRange = discreteModeType.literalRange
@@ -683,9 +707,9 @@ class Discrete_mode(AST):
 
         return self
 
-    def print_code(self):
+    def print_code(self, ctx):
         if hasattr(self.discrete_mode_type, "type"):
-            self.discrete_mode_type.print_code()
+            self.discrete_mode_type.print_code(ctx)
 
 
 class Discrete_range_mode(AST):
@@ -701,25 +725,25 @@ class Discrete_range_mode(AST):
         self.discrete_mode_name.print_node(spacing + 2)
         self.literal_range.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.id = self.discrete_mode_name.visit_node(declaring=True)
-        self.literalRange = self.literal_range.visit_node()
+    def visit_node(self, ctx):
+        self.id = self.discrete_mode_name.visit_node(ctx, declaring=True)
+        self.literalRange = self.literal_range.visit_node(ctx)
         return self
 
-    def generate_code1(self):
-        self.discreteModeName = self.discrete_mode_name.generate_code1()
-        self.literalRange = self.literal_range.generate_code1()
+    def generate_code1(self, ctx):
+        self.discreteModeName = self.discrete_mode_name.generate_code1(ctx)
+        self.literalRange = self.literal_range.generate_code1(ctx)
         return self
 
-    def print_code(self):
-        self.literal_range.print_code()
-        self.discrete_mode_name.print_code()
+    def print_code(self, ctx):
+        self.literal_range.print_code(ctx)
+        self.discrete_mode_name.print_code(ctx)
 
-    def print_code1(self):
-        self.literal_range.print_code()
+    def print_code1(self, ctx):
+        self.literal_range.print_code(ctx)
 
-    def print_code2(self):
-        self.literal_range.print_code2()
+    def print_code2(self, ctx):
+        self.literal_range.print_code2(ctx)
 
 
 class Mode_name(AST):
@@ -733,14 +757,14 @@ class Mode_name(AST):
     def print_node(self, spacing):
         return self.identifier.print_node(spacing)
 
-    def visit_node(self):
-        return self.identifier.visit_node()
+    def visit_node(self, ctx):
+        return self.identifier.visit_node(ctx)
 
-    def generate_code1(self):
-        self.modeId = self.identifier.generate_code1().id
+    def generate_code1(self, ctx):
+        self.modeId = self.identifier.generate_code1(ctx).id
         return self
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -756,21 +780,30 @@ class Literal_range(AST):
         self.expression1.print_node(spacing)
         self.expression2.print_node(spacing)
 
-    def visit_node(self):
-        self.expr1 = self.expression1.visit_node()
-        self.expr2 = self.expression2.visit_node()
+    def visit_node(self, ctx):
+        self.expr1 = self.expression1.visit_node(ctx)
+        self.expr2 = self.expression2.visit_node(ctx)
         return self
 
-    def generate_code1(self):
-        self.expr1 = self.expression1.generate_code1()
-        self.expr2 = self.expression2.generate_code1()
+    def generate_code1(self, ctx):
+        self.expr1 = self.expression1.generate_code1(ctx)
+        self.expr2 = self.expression2.generate_code1(ctx)
+        # the bounds of the array modes are constants
+        self.lower = self.expr1.constant_value(ctx)
+        self.upper = self.expr2.constant_value(ctx)
         return self
 
-    def print_code(self):
-       self.expr1.print_code(type="load")
+    def print_code(self, ctx):
+        if self.lower is not None:
+            ctx.cp.loadConstant(self.lower)
+        else:
+            self.expr1.print_code(ctx, type="load")
 
-    def print_code2(self):
-        self.expr2.print_code(type="load")
+    def print_code2(self, ctx):
+        if self.upper is not None:
+            ctx.cp.loadConstant(self.upper)
+        else:
+            self.expr2.print_code(ctx, type="load")
 
 
 class Reference_mode(AST):
@@ -784,14 +817,14 @@ class Reference_mode(AST):
         self.print_spacing(spacing)
         self.mode2.print_node(spacing + 2)
 
-    def visit_node(self):
-        return self.mode2.visit_node()
+    def visit_node(self, ctx):
+        return self.mode2.visit_node(ctx)
 
-    def generate_code1(self):
-        self.mode = self.mode2.generate_code1()
+    def generate_code1(self, ctx):
+        self.mode = self.mode2.generate_code1(ctx)
         return self
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -807,15 +840,15 @@ class String_mode(AST):
         self.print_spacing(spacing)
         self.string_length.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         return "string"
 
-    def generate_code1(self):
-        self.stringLength = self.string_length.generate_code1()
+    def generate_code1(self, ctx):
+        self.stringLength = self.string_length.generate_code1(ctx)
         self.type = "string"
         return self
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -830,13 +863,13 @@ class String_length(AST):
     def print_node(self, spacing):
         self.print_spacing(spacing, str(self.length.value))
 
-    def visitNode(self):
+    def visitNode(self, ctx):
         pass
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         return self.length.value
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -853,19 +886,19 @@ class Array_mode(AST):
         self.index_list.print_node(spacing + 2)
         self.element_mode.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.indexList = self.index_list.visit_node()
-        self.elementMode = self.element_mode.visit_node()
+    def visit_node(self, ctx):
+        self.indexList = self.index_list.visit_node(ctx)
+        self.elementMode = self.element_mode.visit_node(ctx)
         self.type = "array"
         return self
 
-    def generate_code1(self):
-        self.indexModeList = self.index_list.generate_code1()
-        self.elementMode = self.element_mode.generate_code1()
+    def generate_code1(self, ctx):
+        self.indexModeList = self.index_list.generate_code1(ctx)
+        self.elementMode = self.element_mode.generate_code1(ctx)
         self.type = "array"
         return self
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass 
 
 
@@ -881,19 +914,19 @@ class Index_list(AST):
         for index in self.index_modes:
             index.print_node(spacing)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         self.indexModeList = []
         for index in self.index_modes:
-            self.indexModeList.append(index.visit_node())
+            self.indexModeList.append(index.visit_node(ctx))
         return self
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         self.indexModeList = []
         for index in self.index_modes:
-            self.indexModeList.append(index.generate_code1())
+            self.indexModeList.append(index.generate_code1(ctx))
         return self.indexModeList
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -914,12 +947,12 @@ class Location(AST):
     def print_node(self, spacing):
         self.location_type.print_node(spacing)
          
-    def visit_node(self):
-        loc = self.location_type.visit_node()
+    def visit_node(self, ctx):
+        loc = self.location_type.visit_node(ctx)
         return loc
 
-    def generate_code1(self):
-        loc = self.location_type.generate_code1()
+    def generate_code1(self, ctx):
+        loc = self.location_type.generate_code1(ctx)
 
         self.id = None
         self.locationType = loc.type
@@ -958,16 +991,19 @@ class Location(AST):
 
         return self
 
-    def print_code(self, type="load"):
+    def print_code(self, ctx, type="load"):
         if self.location_type.type == "stringarray_element":
-            self.print_stringarray()
+            self.print_stringarray(ctx)
             if type == "load":
-                cp.getReferenceContents()
+                ctx.cp.getReferenceContents()
         else:
-            return self.location_type.print_code(type=type)
+            return self.location_type.print_code(ctx, type=type)
+
+    def print_stringarray(self, ctx):
+        self.location_type.print_stringarray(ctx)
 
-    def print_stringarray(self):
-        self.location_type.print_stringarray()
+    def constant_value(self, ctx):
+        return self.location_type.constant_value(ctx)
 
 
 class Dereferenced_reference(AST):
@@ -982,14 +1018,20 @@ class Dereferenced_reference(AST):
         self.print_spacing(spacing)
         self.loc.print_node(spacing + 2)
 
-    def visit_node(self):
-        return self.loc.visit_node()
+    def visit_node(self, ctx):
+        return self.loc.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         return self
 
-    def print_code(self, type="load"):
-        self.loc.print_code(type="load_reference_value")
+    def print_code(self, ctx, type="load"):
+        if type == "store":
+            self.loc.print_code(ctx, type="store_reference_value")
+        elif type in ("load_reference", "referenced_location"):
+            # the address is the value of the reference
+            self.loc.print_code(ctx, type="load")
+        else:
+            self.loc.print_code(ctx, type="load_reference_value")
 
 # string_element
 # array_element
@@ -1006,42 +1048,45 @@ class StringArray_element(AST):
         self.loc.print_node(spacing + 2)
         self.expression_list.print_node(spacing + 2)
 
-    def visit_node(self):
-        loc = self.loc.visit_node()
-        self.expressionList = self.expression_list.visit_node()
+    def visit_node(self, ctx):
+        loc = self.loc.visit_node(ctx)
+        self.expressionList = self.expression_list.visit_node(ctx)
 
         self.id = "_INVALID_STRINGARRAY_ELEMENT_"
         if(hasattr(loc, "id")):
             self.id = loc.id
         return self
 
-    def generate_code1(self):
-        self.loc2 = self.loc.generate_code1()
-        self.expressionList = self.expression_list.generate_code1()
+    def generate_code1(self, ctx):
+        self.loc2 = self.loc.generate_code1(ctx)
+        self.expressionList = self.expression_list.generate_code1(ctx)
         self.id = self.loc2.id
 
         return self
 
-    def print_code(self, type="load_reference"):
-        self.expression_list.print_code(type)
-        self.loc.print_code(type)
+    def print_code(self, ctx, type="load_reference"):
+        self.expression_list.print_code(ctx, type)
+        self.loc.print_code(ctx, type)
         return self
 
-    def print_stringarray(self):
+    def print_stringarray(self, ctx):
         ret = None
         if self.loc.location_type.type == "identifier":
-            ret = cg.curr_node.lookup(self.loc.location_type.id)
-            cp.loadReference(ret.scope, ret.idStart)
-
-        self.expression_list.print_code()
-
-        if ret is not None:
-            if ret.indexList is not None:
-                for index_mode in ret.indexList:
-                    index_mode.print_code()
-
-        cp.subtract()
-        cp.index(1)
+            ret = ctx.cg.curr_node.lookup(self.loc.location_type.id)
+            self.print_address(ctx, ret)
+
+        if ret is not None and ret.indexList is not None:
+            # the values are stored by rows, an index skips the values of the indexes after it
+            lengths = ctx.cg.calculateIndexLengths(ret.indexList)
+            for k, expression in enumerate(self.expression_list.expressions):
+                expression.print_code(ctx)
+                ret.indexList[k].print_code(ctx)
+                ctx.cp.subtract()
+                ctx.cp.index(reduce(operator.mul, lengths[k + 1:], 1))
+        else:
+            self.expression_list.print_code(ctx)
+            ctx.cp.subtract()
+            ctx.cp.index(1)
 
 
 class Slice(AST):
@@ -1059,30 +1104,45 @@ class Slice(AST):
         self.expression1.print_node(spacing + 2)
         self.expression2.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.loc2 = self.loc.visit_node()
-        self.left = self.expression1.visit_node()
-        self.right = self.expression2.visit_node()
+    def visit_node(self, ctx):
+        self.loc2 = self.loc.visit_node(ctx)
+        self.left = self.expression1.visit_node(ctx)
+        self.right = self.expression2.visit_node(ctx)
         self.id = self.loc2.id
         return self
 
-    def generate_code1(self):
-        self.loc2 = self.loc.generate_code1()
-        self.left = self.expression1.generate_code1()
-        self.right = self.expression2.generate_code1()
+    def generate_code1(self, ctx):
+        self.loc2 = self.loc.generate_code1(ctx)
+        self.left = self.expression1.generate_code1(ctx)
+        self.right = self.expression2.generate_code1(ctx)
         self.id = self.loc2.id
         return self
 
-    def print_code(self, type="load"):
-        self.loc.print_code(type="slice")
-        self.expression1.print_code()
-        cp.subtract()
-        cp.index(1)
+    def print_code(self, ctx, type="load"):
+        # the LVM moves a fixed number of values, the bounds must be constants
+        left = self.expression1.constant_value(ctx)
+        right = self.expression2.constant_value(ctx)
+        if not isinstance(left, int) or not isinstance(right, int):
+            raise UnexpectedError("The bounds of the slice of {0} must be constants. Line={1}".format(self.id, self.lineno), "")
+        size = right - left + 1
 
-        if type == "store":
-            cp.loadMultipleValues(1)
-            cp.storeMultipleValues(1)
+        lower = 0
+        ret = ctx.cg.curr_node.lookup(self.id)
+        if ret is not None and ret.indexList is not None:
+            lower = ret.indexList[0].lower
+
+        # the address of the first value of the slice
+        self.loc.print_code(ctx, type="load_reference")
+        ctx.cp.loadConstant(left - lower)
+        ctx.cp.index(1)
 
+        if type == "load":
+            ctx.cp.loadMultipleValues(size)
+        elif type == "store":
+            ctx.cp.loadMultipleValues(size)
+            ctx.cp.storeMultipleValues(size)
+
+        return list, size
 
 
 class Expression_list(AST):
@@ -1097,22 +1157,22 @@ class Expression_list(AST):
         for expression in self.expressions:
             expression.print_node(spacing)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         expressionList = []
         for expression in self.expressions:
-            expressionList.append(expression.visit_node())
+            expressionList.append(expression.visit_node(ctx))
         return expressionList
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         self.expressionList = []
         for expression in self.expressions:
-            self.expressionList.append(expression.generate_code1())
+            self.expressionList.append(expression.generate_code1(ctx))
         return self.expressionList
 
-    def print_code(self, type="load"):
+    def print_code(self, ctx, type="load"):
         self.expressionList = []
         for expression in self.expressions:
-            self.expressionList.append(expression.print_code(type=type))
+            self.expressionList.append(expression.print_code(ctx, type=type))
         return self.expressionList
 
 
@@ -1127,14 +1187,17 @@ class Int(AST):
     def print_node(self, spacing):
         self.print_spacing(spacing, str(self.value), self.location)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         return self
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         return self
 
-    def print_code(self, type=None):
-        cp.loadConstant(self.value)
+    def print_code(self, ctx, type=None):
+        ctx.cp.loadConstant(self.value)
+
+    def constant_value(self, ctx):
+        return self.value
 
 
 class Bool(AST):
@@ -1148,14 +1211,17 @@ class Bool(AST):
     def print_node(self, spacing):
         self.print_spacing(spacing, str(self.value), self.location)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         return self
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         return self
 
-    def print_code(self, type=None):
-        cp.loadConstant(self.value)
+    def print_code(self, ctx, type=None):
+        ctx.cp.loadConstant(self.value)
+
+    def constant_value(self, ctx):
+        return self.value
 
 
 class Char(AST):
@@ -1169,14 +1235,17 @@ class Char(AST):
     def print_node(self, spacing):
         self.print_spacing(spacing, "'" + str(self.value) + "'", self.location)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         return self
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         return self
 
-    def print_code(self, type=None):
-        cp.loadConstant(self.value)
+    def print_code(self, ctx, type=None):
+        ctx.cp.loadConstant(self.value)
+
+    def constant_value(self, ctx):
+        return self.value
 
 
 class Empty_literal(AST):
@@ -1190,14 +1259,14 @@ class Empty_literal(AST):
     def print_node(self, spacing):
         self.print_spacing(spacing, str(self.value), self.location)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         return self
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         return self
 
-    def print_code(self, type=None):
-        cp.loadConstant(self.value)
+    def print_code(self, ctx, type=None):
+        ctx.cp.loadConstant(self.value)
 
 
 class String(AST):
@@ -1211,18 +1280,21 @@ class String(AST):
     def print_node(self, spacing):
         self.print_spacing(spacing, '"' + self.value + '"', self.location)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         return self
 
-    def generate_code1(self):
-        if cg.get_str(self.value) is None:
-            cg.add_str(self.value)
+    def generate_code1(self, ctx):
+        if ctx.cg.get_str(self.value) is None:
+            ctx.cg.add_str(self.value)
         return self
 
-    def print_code(self, type=None):
+    def print_code(self, ctx, type=None):
         #raise Exception("aqui")
-        return str, cg.get_str(self.value)
-        #cp.loadConstant(self.value)
+        return str, ctx.cg.get_str(self.value)
+        #ctx.cp.loadConstant(self.value)
+
+    def constant_value(self, ctx):
+        return self.value
 
 
 class Expression(AST):
@@ -1237,8 +1309,8 @@ class Expression(AST):
         self.print_spacing(spacing)
         self.expr.print_node(spacing + 2)
 
-    def visit_node(self):
-        child = self.expr.visit_node()
+    def visit_node(self, ctx):
+        child = self.expr.visit_node(ctx)
         self.valueType = "_INVALID_"
         self.value = "_INVALID_"
 
@@ -1256,13 +1328,13 @@ class Expression(AST):
                 self.value = child.value
 
             elif child.type == "identifier" or child.type == "procedure_call" or child.type == "slice":
-                ret = environment.lookup(child.id)
+                ret = ctx.environment.lookup(child.id)
                 self.valueType = ret.type
                 self.value = ret._value
                 self.arrayId = child.id
                 
             elif child.type == "stringarray_element":
-                ret = environment.lookup(child.id)
+                ret = ctx.environment.lookup(child.id)
                 self.valueType = ret.valuesType
                 self.value = ret._value
                 self.arrayId = child.id
@@ -1279,14 +1351,17 @@ class Expression(AST):
         return self
 
     # soh eh usada na classe sinonimos
-    def generate_code1(self):
-        child = self.expr.generate_code1()
+    def generate_code1(self, ctx):
+        child = self.expr.generate_code1(ctx)
         return self
 
-    def print_code(self, type="load"):
-        child = self.expr.print_code(type=type)
+    def print_code(self, ctx, type="load"):
+        child = self.expr.print_code(ctx, type=type)
         return child
 
+    def constant_value(self, ctx):
+        return self.expr.constant_value(ctx)
+
 
 class Conditional_expression(AST):
     _fields = ["boolean_expression", "then_expression", "elsif_expression", "else_expression"]
@@ -1306,26 +1381,40 @@ class Conditional_expression(AST):
             self.elsif_expression.print_node(spacing + 2)
         self.else_expression.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.boolean_expression.visit_node()
-        self.then_expression.visit_node()
+    def visit_node(self, ctx):
+        self.boolean_expression.visit_node(ctx)
+        then = self.then_expression.visit_node(ctx)
         if self.elsif_expression is not None:
-            self.elsif_expression.visit_node()
-        self.else_expression.visit_node()
+            self.elsif_expression.visit_node(ctx)
+        self.else_expression.visit_node(ctx)
 
-    def generate_code1(self):
-        self.boolean_expression.generate_code1()
-        self.then_expression.generate_code1()
-        if self.elsif_expression is not None:
-            self.elsif_expression.generate_code1()
-        self.else_expression.generate_code1()
+        # the value has the type of the expressions
+        self.type = then.valueType
+        self.value = None
+        return self
 
-    def print_code(self, type="load"):
-        self.boolean_expression.print_code()
-        self.then_expression.print_code()
+    def generate_code1(self, ctx):
+        self.end = None # pula pro elsif (ou pro else)
+        self.end2 = None # pula pro fim da expressao
+
+        self.boolean_expression.generate_code1(ctx)
+        self.then_expression.generate_code1(ctx)
+        ctx.cg.ifActionEnd(self)
+        if self.elsif_expression is not None:
+            self.elsif_expression.generate_code1(ctx)
+        self.else_expression.generate_code1(ctx)
+        ctx.cg.ifActionEnd2(self)
+
+    def print_code(self, ctx, type="load"):
+        self.boolean_expression.print_code(ctx)
+        ctx.cp.jumpOnFalse(self.end)
+        self.then_expression.print_code(ctx)
+        ctx.cp.jump(self.end2)
+        ctx.cp.addLabel(self.end)
         if self.elsif_expression is not None:
-            self.elsif_expression.print_code()
-        self.else_expression.print_code()
+            self.elsif_expression.print_code(ctx, ifObject=self)
+        self.else_expression.print_code(ctx)
+        ctx.cp.addLabel(self.end2)
 
 
 class Elsif_expression(AST):
@@ -1343,23 +1432,29 @@ class Elsif_expression(AST):
         self.boolean_expression.print_node(spacing + 2)
         self.then_expression.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         if self.elsif_expr is not None:
-            self.elsif_expr.visit_node()
-        self.boolean_expression.visit_node()
-        self.then_expression.visit_node()
+            self.elsif_expr.visit_node(ctx)
+        self.boolean_expression.visit_node(ctx)
+        self.then_expression.visit_node(ctx)
+
+    def generate_code1(self, ctx):
+        self.end = None # pula pro proximo elsif (ou pro else)
 
-    def generate_code1(self):
         if self.elsif_expr is not None:
-            self.elsif_expr.generate_code1()
-        self.boolean_expression.generate_code1()
-        self.then_expression.generate_code1()
+            self.elsif_expr.generate_code1(ctx)
+        self.boolean_expression.generate_code1(ctx)
+        self.then_expression.generate_code1(ctx)
+        ctx.cg.elseActionEnd(self)
 
-    def print_code(self):
+    def print_code(self, ctx, ifObject=None):
         if self.elsif_expr is not None:
-            self.elsif_expr.print_code()
-        self.boolean_expression.print_code()
-        self.then_expression.print_code()
+            self.elsif_expr.print_code(ctx, ifObject=ifObject)
+        self.boolean_expression.print_code(ctx)
+        ctx.cp.jumpOnFalse(self.end)
+        self.then_expression.print_code(ctx)
+        ctx.cp.jump(ifObject.end2)
+        ctx.cp.addLabel(self.end)
 
 
 class Binary_Operator(AST):
@@ -1376,10 +1471,10 @@ class Binary_Operator(AST):
         self.left_operand.print_node(spacing + 2)
         self.right_operand.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         try:
-            id0 = self.left_operand.visit_node().id
-            use = environment.lookup(id0)
+            id0 = self.left_operand.visit_node(ctx).id
+            use = ctx.environment.lookup(id0)
         except AttributeError:
             type0 = self.left_operand.type
             type2 = "_INVALID_"
@@ -1400,8 +1495,8 @@ class Binary_Operator(AST):
                 raise VariableTypeError("Invalid type: \"" + type0 +"\" at binary operation.",
                                         "Check variable types for left operand. line="+str(self.lineno))
         try:
-            id1 = self.right_operand.visit_node().id
-            use1 = environment.lookup(id1)
+            id1 = self.right_operand.visit_node(ctx).id
+            use1 = ctx.environment.lookup(id1)
         except AttributeError:
             type1 = self.right_operand.type
             type2 = "_INVALID_"
@@ -1445,16 +1540,26 @@ class Binary_Operator(AST):
         self.value = use._value
         return self
 
-    def generate_code1(self):
-        left = self.left_operand.generate_code1()
-        right = self.right_operand.generate_code1()
+    def generate_code1(self, ctx):
+        left = self.left_operand.generate_code1(ctx)
+        right = self.right_operand.generate_code1(ctx)
 
         return self
 
-    def print_code(self, type="load"):
-        self.left_operand.print_code(type)
-        self.right_operand.print_code(type)
-        self.print_operator(self.operator)
+    def print_code(self, ctx, type="load"):
+        self.left_operand.print_code(ctx, type)
+        self.right_operand.print_code(ctx, type)
+        self.print_operator(ctx, self.operator)
+
+    def constant_value(self, ctx):
+        left = self.left_operand.constant_value(ctx)
+        right = self.right_operand.constant_value(ctx)
+        # only the operations of the ints are folded
+        if type(left) is not int or type(right) is not int or self.operator not in INT_OPERATORS:
+            return None
+        if self.operator in ('/', '%') and right == 0:
+            return None
+        return INT_OPERATORS[self.operator](left, right)
 
 
 class Unary_Operator(AST):
@@ -1469,10 +1574,10 @@ class Unary_Operator(AST):
         self.print_spacing(spacing, self.operator)
         self.operand.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         try:
-            id0 = self.operand.visit_node().id
-            use = environment.lookup(id0)
+            id0 = self.operand.visit_node(ctx).id
+            use = ctx.environment.lookup(id0)
         except AttributeError:
             use = self.operand.type
             if use == 'int':
@@ -1496,17 +1601,25 @@ class Unary_Operator(AST):
 
         return self
 
-    def generate_code1(self):
-        operand = self.operand.generate_code1()
+    def generate_code1(self, ctx):
+        operand = self.operand.generate_code1(ctx)
 
         return self
 
-    def print_code(self, type="load"):
-        self.operand.print_code()
+    def print_code(self, ctx, type="load"):
+        self.operand.print_code(ctx)
         if self.operator == '-':
-            cp.negate()
+            ctx.cp.negate()
         elif self.operator == '!':
-            cp.logicalNot()
+            ctx.cp.logicalNot()
+
+    def constant_value(self, ctx):
+        value = self.operand.constant_value(ctx)
+        if type(value) is not int:
+            return None
+        if self.operator == '-':
+            return -value
+        return value
 
 
 class Referenced_location(AST):
@@ -1519,14 +1632,14 @@ class Referenced_location(AST):
     def print_node(self, spacing):
         self.loc.print_node(spacing)
 
-    def visit_node(self):
-        return self.loc.visit_node()
+    def visit_node(self, ctx):
+        return self.loc.visit_node(ctx)
 
-    def generate_code1(self):
-        return self.loc.generate_code1()
+    def generate_code1(self, ctx):
+        return self.loc.generate_code1(ctx)
 
-    def print_code(self, type=None):
-        self.loc.print_code(type="referenced_location")
+    def print_code(self, ctx, type=None):
+        self.loc.print_code(ctx, type="referenced_location")
 
 class Action_statement(AST):
     _fields = ["action", "identifier"]
@@ -1544,31 +1657,31 @@ class Action_statement(AST):
         else:
             self.action.print_node(spacing)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         # se a action possui um label, adiciona esse label
         # no environment
         self.labelId = None
         if self.identifier is not None:
-            self.labelId = self.identifier.visit_node(declaring=True).id
-            environment.add_local(self.labelId, LabelType(self.labelId, None))
+            self.labelId = self.identifier.visit_node(ctx, declaring=True).id
+            ctx.environment.add_local(self.labelId, LabelType(self.labelId, None))
                 
-        self.action.visit_node()
+        self.action.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         labelId = None
         if self.identifier is not None:
-            labelId = self.identifier.generate_code1().id
-            cg.actionStatement(labelId)
+            labelId = self.identifier.generate_code1(ctx).id
+            ctx.cg.actionStatement(labelId)
 
-        self.action.generate_code1()
+        self.action.generate_code1(ctx)
 
-    def print_code(self):
+    def print_code(self, ctx):
         if self.labelId is not None:
-            ret = cg.curr_node.lookup(self.labelId)
-            self.action.print_code()
-            cp.addLabel(ret.actionStatementLabel)
+            ret = ctx.cg.curr_node.lookup(self.labelId)
+            self.action.print_code(ctx)
+            ctx.cp.addLabel(ret.actionStatementLabel)
         else:
-            self.action.print_code()
+            self.action.print_code(ctx)
 
 
 class Assignment_action(AST):
@@ -1585,13 +1698,13 @@ class Assignment_action(AST):
         self.loc.print_node(spacing + 2)
         self.expression.print_node(spacing + 2)
 
-    def visit_node(self):
-        operator = self.assigning_operator.visit_node()
+    def visit_node(self, ctx):
+        operator = self.assigning_operator.visit_node(ctx)
 
-        location = self.loc.visit_node()
-        expression = self.expression.visit_node()
+        location = self.loc.visit_node(ctx)
+        expression = self.expression.visit_node(ctx)
 
-        ret = environment.lookup(location.id)
+        ret = ctx.environment.lookup(location.id)
 
         if ret is None:
             raise UnexpectedError("unknown error.", ":-(")
@@ -1600,7 +1713,7 @@ class Assignment_action(AST):
         # se for, coloca ele e o valor antigo da location na expressao
         if operator is not None:
             binOp = Binary_Operator(operator, location, expression)
-            binOp.visit_node()
+            binOp.visit_node(ctx)
 
             expression.expression2 = ret._value
             expression.operator2 = operator
@@ -1612,54 +1725,59 @@ class Assignment_action(AST):
             arrayValuesType = ret.valuesType
             # se a for assign a um array, ve se eh do mesmo tipo os valores
             if expression.valueType == "array":
-                expressionId = environment.lookup(expression.arrayId)
+                expressionId = ctx.environment.lookup(expression.arrayId)
                 expression.valueType = expressionId.valuesType
 
             if arrayValuesType != expression.valueType:
                 raise VariableTypeError("The array was not declared as " + expression.valueType + " array it was declared as an {0} array. line={1}".format(arrayValuesType, self.lineno), "Be sure to only set a valid value to type.")
 
         # verifica se eh uma constante
-        ret = environment.lookup(location.id)
+        ret = ctx.environment.lookup(location.id)
         if hasattr(ret, "synonym") and ret.synonym is True:
             raise SynonymAssignmentError("You cannot assign to the synonym {0}. Line={1}".format(location.id, self.lineno),"Synonyms are constant values")
 
-        if self.check_assignment_type(ret.type, expression, location, arrayValuesType) is False:
+        if self.check_assignment_type(ctx, ret.type, expression, location, arrayValuesType) is False:
             raise VariableTypeError(expression.valueType + " is not a {0}. line={1}".format(ret.type, self.lineno), "Be sure to only set a valid value to type.")
 
-    def generate_code1(self):
-        self.assigning_operator.generate_code1()
-        self.loc.generate_code1()
-        self.expression.generate_code1()
+    def generate_code1(self, ctx):
+        self.assigning_operator.generate_code1(ctx)
+        self.loc.generate_code1(ctx)
+        self.expression.generate_code1(ctx)
 
-    def print_code(self, type="load"):
+    def print_code(self, ctx, type="load"):
         # se for array, carrega primeiro o indice
         if self.loc.location_type.type == "stringarray_element":
-            self.loc.print_stringarray()
+            self.loc.print_stringarray(ctx)
+
+        # p(b) = 20, the location returned by the procedure
+        elif self.loc.location_type.type == "procedure_call":
+            self.loc.print_code(ctx, type="load_reference")
 
         # testa sea location eh um identifier de um vetor
         # b = a (ambos b e a sao vetores)
         elif self.loc.location_type.type == "identifier":
-            ret = cg.curr_node.lookup(self.loc.location_type.id)
+            ret = ctx.cg.curr_node.lookup(self.loc.location_type.id)
             if ret is not None and ret.indexList is not None:
-                self.loc.print_code(type=type)
-                self.expression.print_code(type="store")
+                self.loc.print_code(ctx, type=type)
+                self.expression.print_code(ctx, type="store")
                 return
 
-        if self.assigning_operator.closed_dyadic_operator is not None:
-            self.loc.print_code(type="load")
-        isLocation = self.expression.print_code(type=type)
-        self.assigning_operator.print_code()
-
-        type = "store"
+        # b[2:5] = a[6:9], the values are copied to the address of the slice
+        elif self.loc.location_type.type == "slice":
+            self.loc.print_code(ctx, type="load_reference")
+            self.expression.print_code(ctx, type="store")
+            return
 
-        if isLocation:
-            type = "store_reference_value"
+        if self.assigning_operator.closed_dyadic_operator is not None:
+            self.loc.print_code(ctx, type="load")
+        self.expression.print_code(ctx, type=type)
+        self.assigning_operator.print_code(ctx)
 
         # se for array, guarda os multiplos valores
-        if self.loc.location_type.type == "stringarray_element":
-            cp.storeMultipleValues(1)
+        if self.loc.location_type.type in ("stringarray_element", "procedure_call"):
+            ctx.cp.storeMultipleValues(1)
         else:
-            self.loc.print_code(type=type)
+            self.loc.print_code(ctx, type="store")
 
 
 class Assigning_operator(AST):
@@ -1677,15 +1795,15 @@ class Assigning_operator(AST):
         else:
             print "="
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         return self.closed_dyadic_operator
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         return self.closed_dyadic_operator
 
-    def print_code(self):
+    def print_code(self, ctx):
         if self.closed_dyadic_operator is not None:
-            self.print_operator(self.closed_dyadic_operator)
+            self.print_operator(ctx, self.closed_dyadic_operator)
 
 
 class If_action(AST):
@@ -1704,39 +1822,39 @@ class If_action(AST):
         if self.else_clause is not None:
             self.else_clause.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.boolean_expression.visit_node()
-        self.then_clause.visit_node()
+    def visit_node(self, ctx):
+        self.boolean_expression.visit_node(ctx)
+        self.then_clause.visit_node(ctx)
         if self.else_clause is not None:
-            self.else_clause.visit_node()
+            self.else_clause.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         self.end = None # pula pro else (ou pro fim do if)
         self.end2 = None # pula pro fim do if qdo ele eh verdadeiro
 
-        self.boolean_expression.generate_code1()
-        self.then_clause.generate_code1()
+        self.boolean_expression.generate_code1(ctx)
+        self.then_clause.generate_code1(ctx)
 
-        cg.ifActionEnd(self)
+        ctx.cg.ifActionEnd(self)
 
         if self.else_clause is not None:
-            self.else_clause.generate_code1()
-            cg.ifActionEnd2(self)
+            self.else_clause.generate_code1(ctx)
+            ctx.cg.ifActionEnd2(self)
         else:
             self.end2 = self.end
 
-    def print_code(self):
-        self.boolean_expression.print_code()
+    def print_code(self, ctx):
+        self.boolean_expression.print_code(ctx)
 
-        cp.jumpOnFalse(self.end)
+        ctx.cp.jumpOnFalse(self.end)
 
-        self.then_clause.print_code()
+        self.then_clause.print_code(ctx)
 
         if self.else_clause is not None:
-            cp.jump(self.end2)
-            self.else_clause.print_code(prevObject=self, ifObject=self)
+            ctx.cp.jump(self.end2)
+            self.else_clause.print_code(ctx, prevObject=self, ifObject=self)
 
-        cp.addLabel(self.end2)
+        ctx.cp.addLabel(self.end2)
 
 
 class Then_clause(AST):
@@ -1752,18 +1870,18 @@ class Then_clause(AST):
         if self.action_statement_list is not None:
             self.action_statement_list.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         if self.action_statement_list is not None:
-            self.action_statement_list.visit_node()
+            self.action_statement_list.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         if self.action_statement_list is not None:
-            self.action_statement_list.generate_code1()
+            self.action_statement_list.generate_code1(ctx)
 
 
-    def print_code(self):
+    def print_code(self, ctx):
         if self.action_statement_list is not None:
-            self.action_statement_list.print_code()
+            self.action_statement_list.print_code(ctx)
 
 
 class Else_clause(AST):
@@ -1786,55 +1904,55 @@ class Else_clause(AST):
         if self.else_clause is not None:
             self.else_clause.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         if self.action_statement_list is not None:
-            self.action_statement_list.visit_node()
+            self.action_statement_list.visit_node(ctx)
         if self.boolean_expression is not None:
-            self.boolean_expression.visit_node()
+            self.boolean_expression.visit_node(ctx)
         if self.then_clause is not None:
-            self.then_clause.visit_node()
+            self.then_clause.visit_node(ctx)
         if self.else_clause is not None:
-            self.else_clause.visit_node()
+            self.else_clause.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         self.end = None # pula pro proximo else if
 
         # eh else
         if self.action_statement_list is not None:
-            self.action_statement_list.generate_code1()
+            self.action_statement_list.generate_code1(ctx)
 
         # daqui pra baixo eh else if
         if self.boolean_expression is not None:
-            self.boolean_expression.generate_code1()
+            self.boolean_expression.generate_code1(ctx)
 
         if self.then_clause is not None:
-            self.then_clause.generate_code1()
+            self.then_clause.generate_code1(ctx)
 
 
         if self.else_clause is not None:
-            cg.elseActionEnd(self)
-            self.else_clause.generate_code1()
+            ctx.cg.elseActionEnd(self)
+            self.else_clause.generate_code1(ctx)
 
-    def print_code(self,prevObject=None, ifObject=None):
+    def print_code(self, ctx, prevObject=None, ifObject=None):
         if prevObject.end is not None:
-            cp.addLabel(prevObject.end)
+            ctx.cp.addLabel(prevObject.end)
 
         if self.action_statement_list is not None:
-            self.action_statement_list.print_code()
+            self.action_statement_list.print_code(ctx)
 
         if self.boolean_expression is not None:
-            self.boolean_expression.print_code()
+            self.boolean_expression.print_code(ctx)
             if self.end is not None:
-                cp.jumpOnFalse(self.end)
+                ctx.cp.jumpOnFalse(self.end)
             else:
-                cp.jumpOnFalse(ifObject.end2)
+                ctx.cp.jumpOnFalse(ifObject.end2)
 
         if self.then_clause is not None:
-            self.then_clause.print_code()
-            cp.jump(ifObject.end2)
+            self.then_clause.print_code(ctx)
+            ctx.cp.jump(ifObject.end2)
 
         if self.else_clause is not None:
-            self.else_clause.print_code(prevObject=self, ifObject=ifObject)
+            self.else_clause.print_code(ctx, prevObject=self, ifObject=ifObject)
 
 
 class Do_action(AST):
@@ -1853,65 +1971,66 @@ class Do_action(AST):
 
         self.action_statement_list.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         if self.control_part is not None:
             self.control = None
             if(len(self.control_part)) == 2:
-                self.forControl = self.control_part[0].visit_node()
-                self.whileControl = self.control_part[1].visit_node()
+                self.forControl = self.control_part[0].visit_node(ctx)
+                self.whileControl = self.control_part[1].visit_node(ctx)
             else:
-                self.control = self.forControl = self.control_part[0].visit_node()
+                self.control = self.forControl = self.control_part[0].visit_node(ctx)
 
         if self.action_statement_list is not None:
-            self.action_statement_list.visit_node()
+            self.action_statement_list.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         self.start = None
         self.end = None
 
+        ctx.cg.doActionStart(self)
         if self.control_part is not None:
-            cg.doActionStart(self)
             self.control = None
             if (len(self.control_part)) == 2:
-                self.forControl = self.control_part[0].generate_code1()
-                self.whileControl = self.control_part[1].generate_code1()
+                self.forControl = self.control_part[0].generate_code1(ctx)
+                self.whileControl = self.control_part[1].generate_code1(ctx)
             else:
-                self.control = self.forControl = self.control_part[0].generate_code1()
+                self.control = self.forControl = self.control_part[0].generate_code1(ctx)
 
         if self.action_statement_list is not None:
-            self.action_statement_list.generate_code1()
+            self.action_statement_list.generate_code1(ctx)
 
-        if self.control_part is not None:
-            cg.doActionEnd(self)
+        ctx.cg.doActionEnd(self)
 
-    def print_code(self):
+    def print_code(self, ctx):
         if self.control_part is not None:
             if (len(self.control_part)) == 2:
-                self.control_part[0].print_code()
-                cp.addLabel(self.start)
-                self.control_part[1].print_code(jumpTo=self.end)
+                self.control_part[0].print_code(ctx)
+                ctx.cp.addLabel(self.start)
+                self.control_part[1].print_code(ctx, jumpTo=self.end)
 
             # eh for ou while, se for for, declara o label dps de carregar o valor
             # do inicio do contador, se for while ja reclara antes
             else:
                 if self.control_part[0].type == "while_control":
-                    cp.addLabel(self.start)
-                    self.control_part[0].print_code(jumpTo=self.end)
+                    ctx.cp.addLabel(self.start)
+                    self.control_part[0].print_code(ctx, jumpTo=self.end)
                 else:
-                    self.control_part[0].print_code()
-                    cp.addLabel(self.start)
+                    self.control_part[0].print_code(ctx)
+                    ctx.cp.addLabel(self.start)
+
+        # sem controle, repete ate um exit
+        else:
+            ctx.cp.addLabel(self.start)
 
         if self.action_statement_list is not None:
-            self.action_statement_list.print_code()
+            self.action_statement_list.print_code(ctx)
 
         # testa a condicao de parada do for
         if  self.control_part is not None and self.control_part[0].type == "for_control":
-            self.control_part[0].print_code2(jumpTo=self.end)
+            self.control_part[0].print_code2(ctx, jumpTo=self.end)
 
-        cp.jump(self.start)
-
-        if self.control_part is not None:
-            cp.addLabel(self.end)
+        ctx.cp.jump(self.start)
+        ctx.cp.addLabel(self.end)
 
 
 class For_control(AST):
@@ -1926,18 +2045,18 @@ class For_control(AST):
         self.print_spacing(spacing, self.location)
         self.iteration.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.iteration.visit_node()
+    def visit_node(self, ctx):
+        self.iteration.visit_node(ctx)
 
-    def generate_code1(self):
-        self.iteration.generate_code1()
+    def generate_code1(self, ctx):
+        self.iteration.generate_code1(ctx)
 
-    def print_code(self):
-        self.iteration.print_code()
+    def print_code(self, ctx):
+        self.iteration.print_code(ctx)
 
-    def print_code2(self, jumpTo=None):
-        self.iteration.print_code2()
-        cp.jumpOnFalse(jumpTo)
+    def print_code2(self, ctx, jumpTo=None):
+        self.iteration.print_code2(ctx)
+        ctx.cp.jumpOnFalse(jumpTo)
 
 
 class Step_enumeration(AST):
@@ -1963,45 +2082,45 @@ class Step_enumeration(AST):
             self.step_value.print_node(spacing + 2)
         self.end_value.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.identifier.visit_node()
-        self.expression.visit_node()
+    def visit_node(self, ctx):
+        self.identifier.visit_node(ctx)
+        self.expression.visit_node(ctx)
         if self.step_value is not None:
-            self.step_value.visit_node()
-        self.end_value.visit_node()
+            self.step_value.visit_node(ctx)
+        self.end_value.visit_node(ctx)
 
-    def generate_code1(self):
-        self.identifier.generate_code1()
-        self.expression.generate_code1()
+    def generate_code1(self, ctx):
+        self.identifier.generate_code1(ctx)
+        self.expression.generate_code1(ctx)
         if self.step_value is not None:
-            self.step_value.generate_code1()
-        self.end_value.generate_code1()
+            self.step_value.generate_code1(ctx)
+        self.end_value.generate_code1(ctx)
 
-    def print_code(self):
-        self.expression.print_code()
-        self.identifier.print_code(type="store")
+    def print_code(self, ctx):
+        self.expression.print_code(ctx)
+        self.identifier.print_code(ctx, type="store")
 
-    def print_code2(self):
-        self.identifier.print_code(type="load")
+    def print_code2(self, ctx):
+        self.identifier.print_code(ctx, type="load")
 
         if self.step_value is not None:
-            self.step_value.print_code()
+            self.step_value.print_code(ctx)
         else:
-            cp.loadConstant(1)
+            ctx.cp.loadConstant(1)
 
         if self.isDown:
-            cp.subtract()
+            ctx.cp.subtract()
         else:
-            cp.add()
+            ctx.cp.add()
 
-        self.identifier.print_code(type="store")
-        self.identifier.print_code(type="load")
-        self.end_value.print_code()
+        self.identifier.print_code(ctx, type="store")
+        self.identifier.print_code(ctx, type="load")
+        self.end_value.print_code(ctx)
 
         if self.isDown:
-            cp.greaterOrEqual()
+            ctx.cp.greaterOrEqual()
         else:
-            cp.lessOrEqual()
+            ctx.cp.lessOrEqual()
 
 
 class Range_enumeration(AST):
@@ -2021,26 +2140,26 @@ class Range_enumeration(AST):
         self.identifier.print_node(spacing + 2)
         self.discrete_mode_name.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.identifier.visit_node()
-        self.discrete_mode_name.visit_node()
+    def visit_node(self, ctx):
+        self.identifier.visit_node(ctx)
+        self.discrete_mode_name.visit_node(ctx)
 
-    def generate_code1(self):
-        identifier = self.identifier.generate_code1()
-        discreteModeName = self.discrete_mode_name.generate_code1()
+    def generate_code1(self, ctx):
+        identifier = self.identifier.generate_code1(ctx)
+        discreteModeName = self.discrete_mode_name.generate_code1(ctx)
 
-    def print_code(self):
-        self.discrete_mode_name.print_code1()
-        self.identifier.print_code(type="store")
+    def print_code(self, ctx):
+        self.discrete_mode_name.print_code1(ctx)
+        self.identifier.print_code(ctx, type="store")
 
-    def print_code2(self):
-        self.identifier.print_code(type="load")
-        cp.loadConstant(1)
-        cp.add()
-        self.identifier.print_code(type="store")
-        self.identifier.print_code(type="load")
-        self.discrete_mode_name.print_code2()
-        cp.lessOrEqual()
+    def print_code2(self, ctx):
+        self.identifier.print_code(ctx, type="load")
+        ctx.cp.loadConstant(1)
+        ctx.cp.add()
+        self.identifier.print_code(ctx, type="store")
+        self.identifier.print_code(ctx, type="load")
+        self.discrete_mode_name.print_code2(ctx)
+        ctx.cp.lessOrEqual()
 
 
 class While_control(AST):
@@ -2055,15 +2174,15 @@ class While_control(AST):
         self.print_spacing(spacing, self.location)
         self.boolean_expression.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.boolean_expression.visit_node()
+    def visit_node(self, ctx):
+        self.boolean_expression.visit_node(ctx)
 
-    def generate_code1(self):
-        self.boolean_expression.generate_code1()
+    def generate_code1(self, ctx):
+        self.boolean_expression.generate_code1(ctx)
 
-    def print_code(self, jumpTo=None):
-        self.boolean_expression.print_code()
-        cp.jumpOnFalse(jumpTo)
+    def print_code(self, ctx, jumpTo=None):
+        self.boolean_expression.print_code(ctx)
+        ctx.cp.jumpOnFalse(jumpTo)
 
 
 class Procedure_call(AST):
@@ -2080,41 +2199,57 @@ class Procedure_call(AST):
         if self.parameter_list is not None:
             self.parameter_list.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.identifier.visit_node()
+    def visit_node(self, ctx):
+        self.identifier.visit_node(ctx)
+        nParameters = 0
         if self.parameter_list is not None:
-            self.parameter_list.visit_node()
+            self.parameter_list.visit_node(ctx)
+            nParameters = len(self.parameter_list.expressions)
+
+        procedure = ctx.environment.lookup(self.identifier.id)
+        if hasattr(procedure, "nParameters") and procedure.nParameters != nParameters:
+            raise DefinitionError("'{0}' has {1} parameters, it is called with {2}. Line = {3}.".format(self.identifier.id, procedure.nParameters, nParameters, self.lineno),
+                                  "Be sure to give a value to each parameter.")
             
         self.id = None 
         if self.identifier.id is not None:
             self.id = self.identifier.id
         return self
 
-    def generate_code1(self):
-        identifier = self.identifier.generate_code1()
+    def generate_code1(self, ctx):
+        identifier = self.identifier.generate_code1(ctx)
         self.parameterList = None
         self.id = None
 
         if self.parameter_list is not None:
-            self.parameterList = self.parameter_list.generate_code1()
+            self.parameterList = self.parameter_list.generate_code1(ctx)
 
         if identifier is not None:
             self.id = identifier.id
 
         return self
 
-    def print_code(self, type="load"):
-        ret = cg.curr_node.lookup(self.id)
+    def print_code(self, ctx, type="load"):
+        ret = ctx.cg.curr_node.lookup(self.id)
 
         # se tem retorno, aloca espaco na pilha para o resultado
         if ret.hasReturn:
-            cp.alocateMemory(ret.returnSize)
+            ctx.cp.alocateMemory(ret.returnSize)
 
-        self.parameter_list.print_code(param_list=ret.param_list)
+        if self.parameter_list is not None:
+            self.parameter_list.print_code(ctx, param_list=ret.param_list)
+
+        ctx.cp.callFunction(ret.idStart)
 
-        cp.callFunction(ret.idStart)
+        # the procedures that return a loc return its address
+        if ret.isLocation and type == "load":
+            ctx.cp.getReferenceContents()
 
-        return ret.isLocation
+        # the values of a result of many cells, an array, are on the stack
+        if ret.hasReturn and ret.returnSize > 1:
+            if type == "store":
+                ctx.cp.storeMultipleValues(ret.returnSize)
+            return list, ret.returnSize
 
 
 class Parameter_list(AST):
@@ -2130,17 +2265,17 @@ class Parameter_list(AST):
         for expression in self.expressions:
             expression.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         for expression in self.expressions:
-            expression.visit_node()
+            expression.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         parameterList = []
         for expression in self.expressions:
-            parameterList.append(expression.generate_code1())
+            parameterList.append(expression.generate_code1(ctx))
         return parameterList
 
-    def print_code(self, param_list=None):
+    def print_code(self, ctx, param_list=None):
         #param_list.reverse()
         for index in reversed(range(len(self.expressions))):
             expression = self.expressions[index]
@@ -2149,7 +2284,7 @@ class Parameter_list(AST):
             if param:
                 type="load_reference"
 
-            expression.print_code(type=type)
+            expression.print_code(ctx, type=type)
 
 
     def getParameterList(self):
@@ -2171,15 +2306,15 @@ class Exit_action(AST):
         self.print_spacing(spacing, self.location)
         self.identifier.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.identifier.visit_node()
+    def visit_node(self, ctx):
+        self.identifier.visit_node(ctx)
 
-    def generate_code1(self):
-        identifier = self.identifier.generate_code1()
+    def generate_code1(self, ctx):
+        identifier = self.identifier.generate_code1(ctx)
 
-    def print_code(self):
-        ret = cg.curr_node.lookup(self.identifier.id)
-        cp.jump(ret.actionStatementLabel)
+    def print_code(self, ctx):
+        ret = ctx.cg.curr_node.lookup(self.identifier.id)
+        ctx.cp.jump(ret.actionStatementLabel)
 
 
 class Return_action(AST):
@@ -2195,25 +2330,31 @@ class Return_action(AST):
         if self.expression is not None:
             self.expression.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         if self.expression is not None:
-            self.expression.visit_node()
+            self.expression.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         if self.expression is not None:
-            self.expression.generate_code1()
+            self.expression.generate_code1(ctx)
 
-    def print_code(self):
+    def print_code(self, ctx):
         if self.expression is not None:
-            ret = cg.curr_node.lookup(cg.curr_node.nodeId)
+            ret = ctx.cg.curr_node.lookup(ctx.cg.curr_node.nodeId)
             type = "load"
 
             if ret.isLocation:
                 type = "load_reference"
 
-            self.expression.print_code(type=type)
+            # a result of many cells, an array, is copied into its cells
+            if ret.returnSize > 1:
+                ctx.cp.loadReference(ctx.cg.curr_node.scope, ctx.cg.curr_node.ids_parameter - ret.returnSize + 1)
+                self.expression.print_code(ctx, type="store")
+                return
 
-            cp.storeValue(cg.curr_node.scope, cg.curr_node.ids_parameter)
+            self.expression.print_code(ctx, type=type)
+
+            ctx.cp.storeValue(ctx.cg.curr_node.scope, ctx.cg.curr_node.ids_parameter)
 
 
 class Result_action(AST):
@@ -2228,22 +2369,28 @@ class Result_action(AST):
         self.print_spacing(spacing)
         self.expression.print_node(spacing + 2)
 
-    def visit_node(self):
-        self.expression.visit_node()
+    def visit_node(self, ctx):
+        self.expression.visit_node(ctx)
 
-    def generate_code1(self):
-        self.expression.generate_code1()
+    def generate_code1(self, ctx):
+        self.expression.generate_code1(ctx)
 
-    def print_code(self):
-        ret = cg.curr_node.lookup(cg.curr_node.nodeId)
+    def print_code(self, ctx):
+        ret = ctx.cg.curr_node.lookup(ctx.cg.curr_node.nodeId)
         type="load"
 
         if ret.isLocation:
             type="load_reference"
 
-        self.expression.print_code(type=type)
+        # a result of many cells, an array, is copied into its cells
+        if ret.returnSize > 1:
+            ctx.cp.loadReference(ctx.cg.curr_node.scope, ctx.cg.curr_node.ids_parameter - ret.returnSize + 1)
+            self.expression.print_code(ctx, type="store")
+            return
+
+        self.expression.print_code(ctx, type=type)
 
-        cp.storeValue(cg.curr_node.scope, cg.curr_node.ids_parameter)
+        ctx.cp.storeValue(ctx.cg.curr_node.scope, ctx.cg.curr_node.ids_parameter)
 
 
 class Builtin_call(AST):
@@ -2259,29 +2406,33 @@ class Builtin_call(AST):
         if self.parameter_list is not None:
             self.parameter_list.print_node(spacing + 2)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         if self.parameter_list is not None:
-            self.parameterList = self.parameter_list.visit_node()
+            self.parameterList = self.parameter_list.visit_node(ctx)
         self.builtinName = self.builtin_name
         return self
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         if self.parameter_list is not None:
-            self.parameterList = self.parameter_list.generate_code1()
+            self.parameterList = self.parameter_list.generate_code1(ctx)
         self.builtinName = self.builtin_name
         return self
 
 
-    def print_code(self, type="load"):
+    def print_code(self, ctx, type="load"):
         if self.parameter_list is not None:
             parameterList = self.parameter_list.getParameterList()
             if self.builtin_name == "print":
                 for expression in parameterList:
-                    ret = expression.print_code()
+                    ret = expression.print_code(ctx)
                     if ret and ret[0] == str:
-                        cp.printStringContents(ret[1])
+                        ctx.cp.printStringContents(ret[1])
+                    elif ret and ret[0] == list:
+                        ctx.cp.printMultipleValues(ret[1])
+                        # prt leaves one cell of the values on the stack
+                        ctx.cp.deallocateMemory(1)
                     else:
-                        cp.printValue()
+                        ctx.cp.printValue()
             elif self.builtin_name == "num":
                 return 97
             elif self.builtin_name == "pred":
@@ -2292,26 +2443,26 @@ class Builtin_call(AST):
                 try:
                     for expression in parameterList:
                         if expression.expr.location_type.type == "identifier":
-                            ret = cg.curr_node.lookup(expression.expr.location_type.id)
-                            value = ret.indexList[0].expr2.expr.value
-                            cp.loadConstant(value)
+                            ret = ctx.cg.curr_node.lookup(expression.expr.location_type.id)
+                            value = ret.indexList[0].upper
+                            ctx.cp.loadConstant(value)
                 except:
                     pass
             elif self.builtin_name == "lower":
                 try:
                     for expression in parameterList:
                         if expression.expr.location_type.type == "identifier":
-                            ret = cg.curr_node.lookup(expression.expr.location_type.id)
-                            value = ret.indexList[0].expr1.expr.value
-                            cp.loadConstant(value)
+                            ret = ctx.cg.curr_node.lookup(expression.expr.location_type.id)
+                            value = ret.indexList[0].lower
+                            ctx.cp.loadConstant(value)
                 except:
                     pass
             elif self.builtin_name == "length":
                 try:
                     for expression in parameterList:
                         if expression.expr.location_type.type == "identifier":
-                            ret = cg.curr_node.lookup(expression.expr.location_type.id)
-                            cp.loadConstant(ret.idSize)
+                            ret = ctx.cg.curr_node.lookup(expression.expr.location_type.id)
+                            ctx.cp.loadConstant(ret.idSize)
                 except:
                     pass
             elif self.builtin_name == "read":
@@ -2320,15 +2471,15 @@ class Builtin_call(AST):
                         l = expression.expr
                         if l.location_type.type == "stringarray_element":
                             l = l.location_type
-                            expression.print_code(type="")
-                            cp.readSingleValue()
-                            cp.storeMultipleValues(1)
+                            expression.print_code(ctx, type="")
+                            ctx.cp.readSingleValue()
+                            ctx.cp.storeMultipleValues(1)
                         else:
-                            cp.readSingleValue()
-                            expression.print_code(type="store")
+                            ctx.cp.readSingleValue()
+                            expression.print_code(ctx, type="store")
                     else:
-                        cp.readSingleValue()
-                        expression.print_code(type="store")
+                        ctx.cp.readSingleValue()
+                        expression.print_code(ctx, type="store")
 
 
 class Procedure_statement(AST):
@@ -2344,30 +2495,30 @@ class Procedure_statement(AST):
         self.identifier.print_node(spacing + 2)
         self.procedure_definition.print_node(spacing + 2)
 
-    def visit_node(self):
-        identifier = self.identifier.visit_node(declaring=True)
-        procedureDefinition = self.procedure_definition.visit_node(procName=identifier.id)
+    def visit_node(self, ctx):
+        identifier = self.identifier.visit_node(ctx, declaring=True)
+        procedureDefinition = self.procedure_definition.visit_node(ctx, procName=identifier.id)
         procedureDefinition.id = identifier.id
         return procedureDefinition
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         self.start = None
         self.end = None
         self.scope = None
 
-        self.identifier = self.identifier.generate_code1().id
-        self.procedure_definition.generate_code1(identifier=self.identifier)
+        self.identifier = self.identifier.generate_code1(ctx).id
+        self.procedure_definition.generate_code1(ctx, identifier=self.identifier)
 
-    def print_code(self):
-        ret = cg.curr_node.lookup(self.identifier)
+    def print_code(self, ctx):
+        ret = ctx.cg.curr_node.lookup(self.identifier)
 
-        cp.jump(ret.idEnd)
-        cp.addLabel(ret.idStart)
-        cp.enterFunction(ret.scope+1)
+        ctx.cp.jump(ret.idEnd)
+        ctx.cp.addLabel(ret.idStart)
+        ctx.cp.enterFunction(ret.scope+1)
 
-        self.procedure_definition.print_code()
+        self.procedure_definition.print_code(ctx)
 
-        cp.addLabel(ret.idEnd)
+        ctx.cp.addLabel(ret.idEnd)
 
 
 class Procedure_definition(AST):
@@ -2387,34 +2538,39 @@ class Procedure_definition(AST):
         if self.statement_list is not None:
             self.statement_list.print_node(spacing)
             
-    def visit_node(self, procName=None):
+    def visit_node(self, ctx, procName=None):
         self.parameterList = []
         self.resultSpec = None
         self.statementList = None
         
         if self.result_spec is not None:
-            self.resultSpec = self.result_spec.visit_node()
+            self.resultSpec = self.result_spec.visit_node(ctx)
          
         if self.resultSpec is not None: 
             # adiciona o procedimento no environment com o tipo adequado
             specMode = self.resultSpec.specMode
             if specMode == "int":
-                environment.add_local(procName, IntType(procName, None))
+                ctx.environment.add_local(procName, IntType(procName, None))
             elif specMode == "char":
-                environment.add_local(procName, CharType(procName, None)) 
+                ctx.environment.add_local(procName, CharType(procName, None)) 
             elif specMode == "bool":
-                environment.add_local(procName, BoolType(procName, None)) 
+                ctx.environment.add_local(procName, BoolType(procName, None)) 
             elif specMode == "string":
-                environment.add_local(procName, StringType(procName, None)) 
+                ctx.environment.add_local(procName, StringType(procName, None)) 
             elif hasattr(self.resultSpec, "type") and specMode.type == "array":
-                environment.add_local(procName, ArrayType(procName,specMode.elementMode, None))   
+                ctx.environment.add_local(procName, ArrayType(procName,specMode.elementMode, None))   
         else:
-            environment.add_local(procName, VoidType(procName, None))
+            ctx.environment.add_local(procName, VoidType(procName, None))
 
-        environment.push(None)
+        procedure = ctx.environment.peek().lookup(procName)
+        ctx.environment.push(None)
                 
         if self.formal_parameter_list is not None:
-            self.parameterList = self.formal_parameter_list.visit_node(declaring=True)
+            self.parameterList = self.formal_parameter_list.visit_node(ctx, declaring=True)
+
+        # the calls check the number of parameters, also the recursive ones
+        if procedure:
+            procedure.nParameters = sum(len(parameter.identifierList) for parameter in self.parameterList)
 
         # adiciona os parametros
         for parameter in self.parameterList:
@@ -2433,26 +2589,26 @@ class Procedure_definition(AST):
                     mode = mode.modeIdType
                         
                 if mode == "int":
-                    environment.add_local(identifier.id, IntType(identifier.id, None))
+                    ctx.environment.add_local(identifier.id, IntType(identifier.id, None))
                 elif mode == "char":
-                    environment.add_local(identifier.id, CharType(identifier.id, None)) 
+                    ctx.environment.add_local(identifier.id, CharType(identifier.id, None)) 
                 elif mode == "bool":
-                    environment.add_local(identifier.id, BoolType(identifier.id, None)) 
+                    ctx.environment.add_local(identifier.id, BoolType(identifier.id, None)) 
                 elif mode == "string":
-                    environment.add_local(identifier.id, StringType(identifier.id, None)) 
+                    ctx.environment.add_local(identifier.id, StringType(identifier.id, None)) 
                 elif hasattr(mode, "type") and mode.type == "array":
-                    environment.add_local(identifier.id, ArrayType(identifier.id,elementMode, None)) 
+                    ctx.environment.add_local(identifier.id, ArrayType(identifier.id,elementMode, None)) 
 
                 else:
                     raise DefinitionError("Error: parameter mode {0} unknown. Line={1}".format(parameter.parameterSpec, self.lineno),"")
         
         if self.statement_list is not None:
-            self.statement_list.visit_node()
+            self.statement_list.visit_node(ctx)
         
-        environment.pop()
+        ctx.environment.pop()
         return self
 
-    def generate_code1(self, identifier=None):
+    def generate_code1(self, ctx, identifier=None):
         self.identifier = identifier
         self.formalParameterList = None
         self.resultSpec = None
@@ -2463,26 +2619,26 @@ class Procedure_definition(AST):
         self.nParameters = 0
 
         if self.formal_parameter_list is not None:
-            self.formalParameterList = self.formal_parameter_list.generate_code1()
+            self.formalParameterList = self.formal_parameter_list.generate_code1(ctx)
         if self.result_spec is not None:
-            self.resultSpec = self.result_spec.generate_code1()
+            self.resultSpec = self.result_spec.generate_code1(ctx)
 
-        cg.procedureDefinitionStart(self)
+        ctx.cg.procedureDefinitionStart(self)
 
         if self.statement_list is not None:
-            self.statementList = self.statement_list.generate_code1()
+            self.statementList = self.statement_list.generate_code1(ctx)
 
-        cg.procedureDefinitionEnd(self)
+        ctx.cg.procedureDefinitionEnd(self)
 
         return self
 
-    def print_code(self):
-        cg.procedureCall()
+    def print_code(self, ctx):
+        ctx.cg.procedureCall()
 
         _min = 99999999
         _max = 0
-        for j in cg.curr_node.st:
-            i = cg.curr_node.st[j]
+        for j in ctx.cg.curr_node.st:
+            i = ctx.cg.curr_node.st[j]
             if i.type != "declaration":
                 continue
             if i.idStart < _min:
@@ -2490,15 +2646,15 @@ class Procedure_definition(AST):
             if i.idEnd > _max:
                 _max = i.idEnd
         if _min <= _max:
-            cp.alocateMemory(_max-_min)
+            ctx.cp.alocateMemory(_max-_min)
 
-        self.statement_list.print_code()
+        self.statement_list.print_code(ctx)
 
         if _min <= _max:
-            cp.deallocateMemory(_max - _min)
+            ctx.cp.deallocateMemory(_max - _min)
 
-        cp.returnFromFunction(cg.curr_node.scope,self.nParameters)
-        cg.procedureLeave()
+        ctx.cp.returnFromFunction(ctx.cg.curr_node.scope,self.nParameters)
+        ctx.cg.procedureLeave()
 
 
 class Action_statement_list(AST):
@@ -2514,17 +2670,17 @@ class Action_statement_list(AST):
         for i in self.action_statements:
             i.print_node(spacing)
 
-    def visit_node(self):
+    def visit_node(self, ctx):
         for actionStatement in self.action_statements:
-            actionStatement.visit_node()
+            actionStatement.visit_node(ctx)
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         for actionStatement in self.action_statements:
-            actionStatement.generate_code1()
+            actionStatement.generate_code1(ctx)
 
-    def print_code(self):
+    def print_code(self, ctx):
         for actionStatement in self.action_statements:
-            actionStatement.print_code()
+            actionStatement.print_code(ctx)
 
 
 class Formal_parameter_list(AST):
@@ -2539,19 +2695,19 @@ class Formal_parameter_list(AST):
         for i in self.formal_parameters:
             i.print_node(spacing)
 
-    def visit_node(self, declaring=None):
+    def visit_node(self, ctx, declaring=None):
         parameterList = []
         for i in self.formal_parameters:
-            parameterList.append(i.visit_node(declaring))
+            parameterList.append(i.visit_node(ctx, declaring))
         return parameterList
 
-    def generate_code1(self):
+    def generate_code1(self, ctx):
         parameterList = []
         for parameter in self.formal_parameters:
-            parameterList.append(parameter.generate_code1())
+            parameterList.append(parameter.generate_code1(ctx))
         return parameterList
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -2568,19 +2724,19 @@ class Formal_parameter(AST):
         self.identifier_list.print_node(spacing + 2)
         self.parameter_spec.print_node(spacing + 2)
 
-    def visit_node(self, declaring=None):
-        self.parameterSpec = self.parameter_spec.visit_node()
-        self.identifierList = self.identifier_list.visit_node(declaring)
+    def visit_node(self, ctx, declaring=None):
+        self.parameterSpec = self.parameter_spec.visit_node(ctx)
+        self.identifierList = self.identifier_list.visit_node(ctx, declaring)
         return self
 
-    def generate_code1(self):
-        self.identifierList = self.identifier_list.generate_code1()
-        parameterSpec = self.parameter_spec.generate_code1()
+    def generate_code1(self, ctx):
+        self.identifierList = self.identifier_list.generate_code1(ctx)
+        parameterSpec = self.parameter_spec.generate_code1(ctx)
         self.parameterSpecMode = parameterSpec.mode
         self.isLocation = parameterSpec.isReference
         return self
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -2597,15 +2753,15 @@ class Parameter_spec(AST):
             print " " * (spacing+2) + "LOC Param"
         self.mode.print_node(spacing)
 
-    def visit_node(self):
-        self.specMode = self.mode.visit_node()
+    def visit_node(self, ctx):
+        self.specMode = self.mode.visit_node(ctx)
         return self
 
-    def generate_code1(self):
-        self.parameterSpecMode = self.mode.generate_code1()
+    def generate_code1(self, ctx):
+        self.parameterSpecMode = self.mode.generate_code1(ctx)
         return self
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
 
 
@@ -2622,13 +2778,13 @@ class Result_spec(AST):
             print " " * (spacing+2) + "LOC Result"
         self.mode.print_node(spacing)
 
-    def visit_node(self):
-        self.specMode = self.mode.visit_node()
+    def visit_node(self, ctx):
+        self.specMode = self.mode.visit_node(ctx)
         return self
 
-    def generate_code1(self):
-        self.resultSpecMode = self.mode.generate_code1()
+    def generate_code1(self, ctx):
+        self.resultSpecMode = self.mode.generate_code1(ctx)
         return self
 
-    def print_code(self):
+    def print_code(self, ctx):
         pass
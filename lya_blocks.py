@@ -0,0 +1,247 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Translation of linked LVM code into Python functions, one per basic block.
+#
+# A block starts at pc 0, at every jump target and after every instruction
+# that leaves the straight line (jumps, 'cfu', 'ret' and 'end'), so the return
+# address pushed by 'cfu' is always the start of a block. Each block becomes
+#
+#     def b12(sp):
+#         ...
+#         return 17, sp + 1
+#
+# which returns the pc of the next block and the stack pointer. Inside a block
+# sp is not updated, the stack positions are offsets of it known at translation
+# time, and the values pushed by side-effect free instructions are kept as
+# Python expressions until an instruction consumes them, so
+# ('ldv', 0, 3), ('ldc', 1), ('add',), ('stv', 0, 3) becomes
+# M[D[0] + 3] = (M[D[0] + 3]) + (1).
+#
+# Every line either fails before it changes anything or does not fail, as the
+# instructions of the dispatch engine. LINES keeps, for each line, the pc and
+# the stack offset of the first instruction it stands for, so a line that
+# fails with an IndexError is executed again by the dispatch engine from that
+# pc once the memory has grown (see fault_state).
+
+import lya_bytecode
+
+
+FILENAME = '<lya blocks>'
+
+# instructions that leave the straight line
+TERMINATORS = set(['jmp', 'jof', 'cfu', 'ret', 'end'] + lya_bytecode.COMPARE_JUMPS)
+
+OPERATORS = {
+    'add': '+', 'sub': '-', 'mul': '*', 'div': '//', 'mod': '%',
+    'les': '<', 'leq': '<=', 'grt': '>', 'gre': '>=', 'equ': '==', 'neq': '!=',
+    'and': 'and', 'or': 'or', 'lor': 'or',
+}
+COMPARISONS = {'jlt': '<', 'jle': '<=', 'jgt': '>', 'jge': '>=', 'jeq': '==', 'jne': '!='}
+
+# expressions are stored once they nest this deep, the Python parser has a limit
+MAX_DEPTH = 16
+
+
+def at(k):
+    if k == 0:
+        return "sp"
+    return "sp + %d" % k if k > 0 else "sp - %d" % -k
+
+
+def variable(i, j):
+    return "M[D[%d] + %d]" % (i, j)
+
+
+def block_starts(code):
+    starts = set([0])
+    for pc, (handler, row) in enumerate(code):
+        if row[0] in lya_bytecode.JUMPS:
+            starts.add(row[1])
+        if row[0] in TERMINATORS:
+            starts.add(pc + 1)
+    return sorted(s for s in starts if s < len(code))
+
+
+class BlockTranslator(object):
+    def __init__(self):
+        self.source = []
+        # pc and stack offset of the instruction each line starts, by line number
+        self.lines = {}
+
+    def emit(self, text, start):
+        self.source.append(text)
+        self.lines[len(self.source)] = start
+
+    def translate(self, code):
+        """Returns the source of make(self, M, D, C), which returns the list of
+        the block functions indexed by pc, C being the linked code."""
+        starts = block_starts(code)
+        self.emit("def make(self, M, D, C):", None)
+        self.emit("    B = [None] * %d" % len(code), None)
+        for n, first in enumerate(starts):
+            last = starts[n + 1] if n + 1 < len(starts) else len(code)
+            self.block(code, first, last)
+            self.emit("    B[%d] = b%d" % (first, first), None)
+        self.emit("    return B", None)
+        return "\n".join(self.source) + "\n"
+
+    def block(self, code, first, last):
+        self.emit("    def b%d(sp):" % first, None)
+        # the real stack pointer is sp + k, stack holds the values not stored
+        # yet as (expression, start, depth) for the cells above the stored ones
+        self.k = 0
+        self.stack = []
+        for pc in range(first, last):
+            row = code[pc][1]
+            if not self.instruction(pc, row):
+                return
+        self.flush()
+        self.line("return %d, %s" % (last, at(self.k)), (last - 1, self.k))
+
+    def line(self, text, start):
+        self.emit("        " + text, start)
+
+    def push(self, expression, start, depth=0):
+        self.k += 1
+        self.stack.append((expression, start, depth))
+        if depth > MAX_DEPTH:
+            self.flush()
+
+    def pop(self):
+        self.k -= 1
+        if self.stack:
+            return self.stack.pop()
+        return "M[%s]" % at(self.k + 1), None, 0
+
+    def flush(self):
+        # the cells are written from the bottom, an expression only reads the
+        # cells of its own position and above
+        base = self.k - len(self.stack)
+        for n, (expression, start, depth) in enumerate(self.stack):
+            self.line("M[%s] = %s" % (at(base + n + 1), expression), start)
+        self.stack = []
+
+    def operation(self, pc, expression, operands, depth):
+        start = next((s for e, s, d in operands if s is not None), (pc, self.k + len(operands)))
+        self.push(expression, start, depth)
+
+    def instruction(self, pc, row):
+        """Translates one instruction, returns False after the end of the block."""
+        op = row[0]
+        here = (pc, self.k)
+        if op == 'ldc':
+            self.push(repr(row[1]), here)
+        elif op == 'ldv':
+            self.push(variable(row[1], row[2]), here)
+        elif op == 'ldr':
+            self.push("D[%d] + %d" % (row[1], row[2]), here)
+        elif op == 'lrv':
+            self.push("M[%s]" % variable(row[1], row[2]), here)
+        elif op in OPERATORS:
+            b = self.pop()
+            a = self.pop()
+            self.operation(pc, "(%s) %s (%s)" % (a[0], OPERATORS[op], b[0]), [a, b], max(a[2], b[2]) + 1)
+        elif op == 'neg' or op == 'not' or op == 'grc':
+            a = self.pop()
+            expression = {'neg': "-(%s)", 'not': "not (%s)", 'grc': "M[%s]"}[op] % a[0]
+            self.operation(pc, expression, [a], a[2] + 1)
+        elif op == 'idx':
+            b = self.pop()
+            a = self.pop()
+            self.operation(pc, "(%s) + (%s) * %d" % (a[0], b[0], row[1]), [a, b], max(a[2], b[2]) + 1)
+        elif op[:3] == 'vv_':
+            self.push("(%s) %s (%s)" % (variable(row[1], row[2]), OPERATORS[op[3:]], variable(row[3], row[4])), here)
+        elif op[:3] == 'vc_':
+            self.push("(%s) %s (%r)" % (variable(row[1], row[2]), OPERATORS[op[3:]], row[3]), here)
+        elif op == 'dlc':
+            for n in range(row[1]):
+                self.pop()
+        elif op == 'stv' or op == 'srv':
+            a = self.pop()
+            self.flush()
+            target = variable(row[1], row[2]) if op == 'stv' else "M[%s]" % variable(row[1], row[2])
+            self.line("%s = %s" % (target, a[0]), a[1] or here)
+        elif op == 'stk':
+            # the value stays in its stack cell, written before the variable
+            a = self.pop()
+            self.flush()
+            self.line("M[%s] = %s = %s" % (at(self.k + 1), variable(row[1], row[2]), a[0]), a[1] or here)
+            self.k += 1
+        elif op == 'inc':
+            self.flush()
+            self.line("%s = %s + %r" % (variable(row[1], row[2]), variable(row[1], row[2]), row[3]), here)
+        elif op == 'enf':
+            self.flush()
+            self.line("M[%s] = D[%d]; D[%d] = %s" % (at(self.k + 1), row[1], row[1], at(self.k + 2)), here)
+            self.k += 1
+        elif op == 'stp':
+            self.flush()
+            self.line("sp = -1; D[0] = 0", here)
+            self.k = 0
+        elif op in TERMINATORS:
+            self.terminator(pc, row)
+            return False
+        else:
+            # the other instructions run through the handlers of the dispatch engine
+            self.flush()
+            self.line("self._sp = %s; self._pc = %d; C[%d][0](C[%d][1]); sp = self._sp" % (at(self.k), pc, pc, pc),
+                      here)
+            self.k = 0
+        return True
+
+    def terminator(self, pc, row):
+        op = row[0]
+        here = (pc, self.k)
+        if op == 'jmp':
+            self.flush()
+            self.line("return %d, %s" % (row[1], at(self.k)), here)
+        elif op == 'jof' or op in COMPARISONS:
+            if op == 'jof':
+                a = self.pop()
+                condition = "not (%s)" % a[0]
+                start = a[1]
+            else:
+                b = self.pop()
+                a = self.pop()
+                condition = "(%s) %s (%s)" % (a[0], COMPARISONS[op], b[0])
+                start = a[1] or b[1]
+            self.flush()
+            self.line("if %s: return %d, %s" % (condition, row[1], at(self.k)), start or here)
+            self.line("return %d, %s" % (pc + 1, at(self.k)), (pc + 1, self.k))
+        elif op == 'cfu':
+            self.flush()
+            self.line("M[%s] = %d; return %d, %s" % (at(self.k + 1), pc + 1, row[1], at(self.k + 1)), here)
+        elif op == 'ret':
+            self.flush()
+            self.line("D[%d] = M[%s]; return M[%s], %s" % (row[1], at(self.k), at(self.k - 1),
+                                                             at(self.k - row[2] - 2)), here)
+        elif op == 'end':
+            self.flush()
+            self.line("self._running = False; return -1, %s" % at(self.k), here)
+
+
+def translate(code):
+    """Returns (code object, LINES) for the linked code of an Interpreter."""
+    translator = BlockTranslator()
+    source = translator.translate(code)
+    return compile(source, FILENAME, 'exec'), translator.lines
+
+
+def make_blocks(compiled, interpreter, M, D, code):
+    namespace = {}
+    exec compiled in namespace
+    return namespace['make'](interpreter, M, D, code)
+
+
+def fault_state(tb, lines):
+    """Returns (pc, sp) of the instruction of the line of a block that raised
+    the exception of the traceback tb, None when it was raised elsewhere."""
+    state = None
+    while tb is not None:
+        frame = tb.tb_frame
+        if frame.f_code.co_filename == FILENAME and lines.get(tb.tb_lineno) is not None:
+            pc, k = lines[tb.tb_lineno]
+            state = pc, frame.f_locals['sp'] + k
+        tb = tb.tb_next
+    return state
@@ -0,0 +1,179 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Binary container for compiled lya programs.
+#
+# header:      magic, version, number of strings, number of instructions
+# string pool: for each string of H, its length followed by its bytes
+# text:        one fixed-width record per instruction
+#              (opcode, operand tag, first operand, second, third and fourth)
+
+import mmap
+import struct
+
+from lya_errors import FileNotFoundError, InterpreterError, UnexpectedError
+
+
+MAGIC = b'LYAB'
+VERSION = 2
+
+HEADER = struct.Struct('<4sHxxII')
+LENGTH = struct.Struct('<I')
+RECORD = struct.Struct('<BBxxiiii')
+
+# number of operands of each instruction, the position is the opcode
+OPCODES = [
+    ('stp', 0), ('end', 0), ('lbl', 1), ('alc', 1), ('dlc', 1),
+    ('ldc', 1), ('ldv', 2), ('ldr', 2), ('stv', 2), ('lrv', 2), ('srv', 2),
+    ('add', 0), ('sub', 0), ('mul', 0), ('div', 0), ('mod', 0), ('neg', 0),
+    ('and', 0), ('lor', 0), ('or', 0), ('not', 0),
+    ('les', 0), ('leq', 0), ('grt', 0), ('gre', 0), ('equ', 0), ('neq', 0),
+    ('jmp', 1), ('jof', 1), ('cfu', 1), ('enf', 1), ('ret', 2),
+    ('idx', 1), ('grc', 0), ('lmv', 1), ('smv', 1), ('smr', 1), ('sts', 1),
+    ('rdv', 0), ('rds', 0), ('prv', 0), ('prt', 1), ('prc', 1), ('prs', 0),
+]
+
+# operations of two values popped from the stack
+BINARY = ['add', 'sub', 'mul', 'div', 'mod', 'les', 'leq', 'grt', 'gre', 'equ', 'neq']
+
+# Superinstructions, see lya_optimizer.fuse:
+#   ('inc', i, j, k)          M[D[i] + j] += k
+#   ('jge', p) ... ('jeq', p) pop two values and jump to p when they compare so
+#   ('vv_add', i, j, k, l)    push M[D[i] + j] + M[D[k] + l], for every BINARY
+#   ('vc_add', i, j, k)       push M[D[i] + j] + k, for every BINARY
+COMPARE_JUMPS = ['jlt', 'jle', 'jgt', 'jge', 'jeq', 'jne']
+OPCODES += [('inc', 3)] + [(name, 1) for name in COMPARE_JUMPS]
+OPCODES += [('vv_' + op, 4) for op in BINARY] + [('vc_' + op, 3) for op in BINARY]
+
+# Written by lya_optimizer in place of ('stv', i, j), ('ldv', i, j):
+#   ('stk', i, j)             M[D[i] + j] = M[sp], the value stays on the stack
+OPCODES += [('stk', 2)]
+
+# instructions whose first operand is a label
+JUMPS = set(['jmp', 'jof', 'cfu'] + COMPARE_JUMPS)
+
+OPCODE_INDEX = dict((name, i) for i, (name, _) in enumerate(OPCODES))
+
+# kind of the first operand
+TAG_NONE = 0
+TAG_INT = 1
+TAG_BOOL = 2
+TAG_CHAR = 3
+
+
+def is_bytecode(file_name):
+    try:
+        with open(file_name, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except IOError:
+        raise FileNotFoundError("Could not open file.", file_name)
+
+
+def encode_operand(value):
+    # the code generator keeps the lexer values of the literals
+    if value is None or value == 'null':
+        return TAG_NONE, 0
+    if value is True or value == 'true':
+        return TAG_BOOL, 1
+    if value is False or value == 'false':
+        return TAG_BOOL, 0
+    if isinstance(value, int):
+        return TAG_INT, value
+    if isinstance(value, str) and len(value) == 1:
+        return TAG_CHAR, ord(value)
+    raise UnexpectedError("Operand can not be encoded.", repr(value))
+
+
+def decode_operand(tag, value):
+    if tag == TAG_INT:
+        return value
+    elif tag == TAG_BOOL:
+        return value != 0
+    elif tag == TAG_CHAR:
+        return chr(value)
+    return None
+
+
+def dumps(H, text):
+    """Returns the binary representation of the string pool H and the list of instructions."""
+    H = H or []
+    chunks = [HEADER.pack(MAGIC, VERSION, len(H), len(text))]
+    for s in H:
+        chunks.append(LENGTH.pack(len(s)))
+        chunks.append(s)
+
+    for pc, row in enumerate(text):
+        opcode = OPCODE_INDEX.get(row[0], None)
+        if opcode is None:
+            raise UnexpectedError("Unknown instruction.", row)
+        operands = [o for o in row[1:] if o is not None] if OPCODES[opcode][1] == 0 else row[1:]
+        if len(operands) != OPCODES[opcode][1]:
+            raise UnexpectedError("Wrong number of operands.", row)
+        tag, first = TAG_NONE, 0
+        if len(operands) > 0:
+            tag, first = encode_operand(operands[0])
+        rest = list(operands[1:]) + [0] * (4 - max(len(operands), 1))
+        # the code generator leaves None for the offsets it could not resolve
+        if not all(isinstance(o, (int, long)) for o in rest):
+            raise UnexpectedError("Operand is not an integer.", "{0} at pc = {1}".format(row, pc))
+        try:
+            chunks.append(RECORD.pack(opcode, tag, first, *rest))
+        except struct.error:
+            raise UnexpectedError("Operand does not fit in 32 bits.", "{0} at pc = {1}".format(row, pc))
+    return b''.join(chunks)
+
+
+def dump(H, text, file_name):
+    # no file is left behind when the program can not be encoded
+    data = dumps(H, text)
+    with open(file_name, 'wb') as f:
+        f.write(data)
+
+
+def loads(data):
+    """Returns (H, text) from a buffer written by dumps, text rows are tuples as in the text format."""
+    if len(data) < HEADER.size:
+        raise InterpreterError("Invalid bytecode.", "File is too short.")
+    magic, version, n_strings, n_instructions = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise InterpreterError("Invalid bytecode.", "Wrong magic number.")
+    if version != VERSION:
+        raise InterpreterError("Invalid bytecode.", "Unsupported version {0}.".format(version))
+
+    offset = HEADER.size
+    H = []
+    for i in range(n_strings):
+        length, = LENGTH.unpack_from(data, offset)
+        offset += LENGTH.size
+        H.append(data[offset:offset + length])
+        offset += length
+
+    if len(data) - offset != n_instructions * RECORD.size:
+        raise InterpreterError("Invalid bytecode.", "Truncated instruction records.")
+    # decodes all the records at once
+    fields = struct.unpack_from('<' + RECORD.format[1:] * n_instructions, data, offset)
+
+    text = []
+    for i in range(0, len(fields), 6):
+        opcode, tag, first = fields[i:i + 3]
+        name, arity = OPCODES[opcode]
+        if arity == 0:
+            text.append((name, None))
+        elif arity == 1:
+            text.append((name, decode_operand(tag, first)))
+        else:
+            text.append((name, decode_operand(tag, first)) + fields[i + 3:i + 2 + arity])
+    return H, text
+
+
+def load(file_name):
+    try:
+        f = open(file_name, 'rb')
+    except IOError:
+        raise FileNotFoundError("Could not open file.", file_name)
+    with f:
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return loads(m)
+        finally:
+            m.close()
@@ -0,0 +1,154 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# On-disk cache of compiled programs.
+#
+# The key is a hash of the source text, of the options that change the
+# generated code (such as -O) and of the compiler itself, so editing any
+# module that takes part in the code generation invalidates every entry.
+# A program is stored as bytecode in <key>.o, a compilation error as its class
+# name and message in <key>.err. Entries are evicted least recently used first
+# (the modification time is refreshed on every hit) once the cache grows past
+# max_size bytes. The size is scanned once and then counted as entries are
+# written, the directory is only scanned again when a write goes over it.
+
+import hashlib
+import os
+import tempfile
+
+import lya_bytecode
+import lya_errors
+
+
+# modules whose source changes the generated code
+COMPILER_MODULES = ['lya_lex', 'lya_parser', 'lya_tables', 'lya_parsetab', 'lya_lalr',
+                    'lya_ast', 'lya_environment', 'lya_errors', 'lya_codegen',
+                    'lya_codeprinter', 'lya_bytecode', 'lya_optimizer', 'lya_fusetab']
+
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'lya')
+DEFAULT_MAX_SIZE = 32 * 1024 * 1024
+
+_version = None
+
+
+def compiler_version():
+    global _version
+    if _version is None:
+        h = hashlib.sha1()
+        folder = os.path.dirname(os.path.abspath(__file__))
+        for name in COMPILER_MODULES:
+            with open(os.path.join(folder, name + '.py'), 'rb') as f:
+                h.update(f.read())
+        _version = h.hexdigest()
+    return _version
+
+
+class CompileCache(object):
+    def __init__(self, directory=None, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory or os.environ.get('LYA_CACHE_DIR') or DEFAULT_DIRECTORY
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # total size of the entries, None until the first write
+        self._size = None
+
+    def key(self, source, options=''):
+        h = hashlib.sha1(compiler_version())
+        h.update(options + "\0")
+        h.update(source)
+        return h.hexdigest()
+
+    def get(self, source, options=''):
+        """Returns (H, text) of the cached program, None when it is not cached.
+        A cached compilation error is raised again."""
+        path = os.path.join(self.directory, self.key(source, options))
+        for ext in ('.o', '.err'):
+            try:
+                with open(path + ext, 'rb') as f:
+                    data = f.read()
+                os.utime(path + ext, None)
+            except (IOError, OSError):
+                continue
+            self.hits += 1
+            if ext == '.err':
+                raise self._load_error(data)
+            H, text = lya_bytecode.loads(data)
+            # instructions without operands are kept as 1-tuples, as emitted
+            return H, [row[:1] if lya_bytecode.OPCODES[lya_bytecode.OPCODE_INDEX[row[0]]][1] == 0 else row
+                       for row in text]
+        self.misses += 1
+        return None
+
+    def put(self, source, H, text, options=''):
+        try:
+            data = lya_bytecode.dumps(H, text)
+        except lya_errors.UnexpectedError:
+            # not representable as bytecode, it is compiled every time
+            return
+        self._write(self.key(source, options) + '.o', data)
+
+    def put_error(self, source, error, options=''):
+        self._write(self.key(source, options) + '.err', type(error).__name__ + "\n" + str(error))
+
+    def clear(self):
+        for name in self._entries():
+            os.remove(os.path.join(self.directory, name))
+        self._size = None
+
+    def _load_error(self, data):
+        name, message = data.split("\n", 1)
+        cls = getattr(lya_errors, name, lya_errors.CompilerException)
+        # skips CompilerException.__init__, the message is already formatted
+        error = cls.__new__(cls)
+        Exception.__init__(error, message)
+        return error
+
+    def _entries(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return [n for n in names if n.endswith('.o') or n.endswith('.err')]
+
+    def _write(self, name, data):
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                # created by another process meanwhile
+                if not os.path.isdir(self.directory):
+                    raise
+        # written under a temporary name first, concurrent readers never see partial entries
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.rename(tmp, os.path.join(self.directory, name))
+        if self._size is None:
+            self._size = sum(size for mtime, size, name in self._stat())
+        else:
+            self._size += len(data)
+        if self._size > self.max_size:
+            self.evict()
+
+    def _stat(self):
+        entries = []
+        for name in self._entries():
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+        return entries
+
+    def evict(self):
+        entries = sorted(self._stat())
+        total = sum(size for mtime, size, name in entries)
+        for mtime, size, name in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+        self._size = total
@@ -48,26 +48,29 @@ class CodeGen(object):
             self.curr_node.add_local_declaration(identifier, params)
 
 
-    def synonymDefinition(self, identifierList, mode, initialization):
-        if mode.type2 == "discrete_mode":
-            for identifier in identifierList:
-                params = Parameters()
-                params.id = identifier
-                params.mode = mode.discreteModeType
-                params.idSize = 1
-                params.value = initialization.value
-                self.curr_node.add_local_synonym(identifier, params)
-        elif mode.type2 ==   "string":
-            for identifier in identifierList:
-                params = Parameters()
-                params.id = identifier
-                params.mode = "string"
-                params.idSize = self.calculateModeSize(mode)
-                params.value = initialization.value
-                self.curr_node.add_local_synonym(identifier, params)
+    def synonymDefinition(self, identifierList, mode, value):
+        if not hasattr(mode, "type2"):
+            # the name of the mode of the initialization
+            size = 1
+            if mode == "string":
+                size = len(value)
+        elif mode.type2 == "discrete_mode":
+            size = 1
+            mode = mode.discreteModeType
+        elif mode.type2 == "string":
+            size = self.calculateModeSize(mode)
+            mode = "string"
         else:
             raise UnexpectedError("synonymDefinition mode devia ser discrete_mode ou string.Line={0}".format(mode.lineno),"")
 
+        for identifier in identifierList:
+            params = Parameters()
+            params.id = identifier
+            params.mode = mode
+            params.idSize = size
+            params.value = value
+            self.curr_node.add_local_synonym(identifier, params)
+
 
     def modeDefinition(self, identifierList, mode):
         size = self.calculateModeSize(mode)
@@ -100,6 +103,8 @@ class CodeGen(object):
                     ret = self.curr_node.lookup(formalParameter.parameterSpecMode.modeNameModeId)
                     if ret:
                         indexList=ret.indexList
+                elif formalParameter.parameterSpecMode.type2 == "array":
+                    indexList = formalParameter.parameterSpecMode.arrayIndexModeList
 
                 for identifier in formalParameter.identifierList:
                     params = Parameters()
@@ -206,15 +211,7 @@ class CodeGen(object):
         if mode.type2 == "string":
             return mode.stringLength
         elif mode.type2 == "array":
-            sum = 0
-            for indexMode in mode.arrayIndexModeList:
-                try:
-                    if indexMode.type == "literal_range":
-                        sum = indexMode.expr2.value - indexMode.expr1.value + 1
-                except:
-                    return 1
-
-            return sum
+            return self.calculateIndexesSize(mode.arrayIndexModeList)
 
         elif mode.type2 == "discrete_mode":
             if mode.discreteModeType != "discrete_range_mode":
@@ -223,3 +220,19 @@ class CodeGen(object):
                 return 1
         return 1
 
+    # the number of values of each index of an array
+    def calculateIndexLengths(self, indexModeList):
+        lengths = []
+        for indexMode in indexModeList:
+            try:
+                lengths.append(indexMode.upper - indexMode.lower + 1)
+            except:
+                lengths.append(1)
+        return lengths
+
+    # the number of values of an array
+    def calculateIndexesSize(self, indexModeList):
+        size = 1
+        for length in self.calculateIndexLengths(indexModeList):
+            size *= length
+        return size
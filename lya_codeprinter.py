@@ -6,6 +6,22 @@ from __future__ import print_function
 
 import sys
 
+import lya_bytecode
+
+
+# the code generator keeps the lexer values of the literals
+LITERALS = {'true': True, 'false': False, 'null': None}
+
+
+def literal_value(value):
+    if isinstance(value, str):
+        return LITERALS.get(value, value)
+    return value
+
+
+def format_instruction(op, *operands):
+    return " (" + ", ".join([repr(op)] + [repr(o) if isinstance(o, str) else str(o) for o in operands]) + "),"
+
 
 class CodePrinter(object):
     def __init__(self, output=sys.stdout):
@@ -20,6 +36,9 @@ class CodePrinter(object):
         if type(self.output) == file:
             self.output.close()
 
+    def emit(self, op, *operands):
+        print(format_instruction(op, *operands), file=self.output)
+
     def printStrs(self, strs):
         print("H = {}".format(strs), file=self.output)
 
@@ -27,18 +46,18 @@ class CodePrinter(object):
     # sp=-1; D[0]=0
     def startProgram(self):
         print("[", file=self.output)
-        print(" ('stp'),", file=self.output)
+        self.emit('stp')
 
     # ('end') Stop execution
     def endProgram(self):
-        print(" ('end'),", file=self.output)
+        self.emit('end')
         print("]", file=self.output)
 
 
     # ('alc', n)  # Allocate memory
     # sp = sp + n
     def alocateMemory(self, n):
-        print(" ('alc', {0}),".format(n), file=self.output)
+        self.emit('alc', n)
 
 
     # Load constant
@@ -46,7 +65,7 @@ class CodePrinter(object):
     # sp=sp+1;
     # M[sp]=k
     def loadConstant(self, k):
-        print(" ('ldc', {0}),".format(k), file=self.output)
+        self.emit('ldc', literal_value(k))
 
 
     # Load value
@@ -54,7 +73,7 @@ class CodePrinter(object):
     # sp = sp + 1;
     # M[sp] = M[D[i] + j]
     def loadValue(self, i, j):
-        print(" ('ldv', {0}, {1}),".format(i, j), file=self.output)
+        self.emit('ldv', i, j)
 
 
     # Load reference
@@ -62,137 +81,137 @@ class CodePrinter(object):
     # sp = sp + 1;
     # M[sp] = D[i] + j
     def loadReference(self, i, j):
-        print(" ('ldr', {0}, {1}),".format(i, j), file=self.output)
+        self.emit('ldr', i, j)
 
 
     # ('stv', i, j)  # Store value
     # M[D[i] + j] = M[sp];
     # sp = sp
     def storeValue(self, i, j):
-        print(" ('stv', {0}, {1}),".format(i, j), file=self.output)
+        self.emit('stv', i, j)
 
 
     # ('lrv', i, j)  # Load reference value
     # sp = sp + 1;
     # M[sp] = M[M[D[i] + j]]
     def loadReferenceValue(self, i, j):
-        print(" ('lrv', {0}, {1}),".format(i, j), file=self.output)
+        self.emit('lrv', i, j)
 
 
     # ('srv', i, j)  # Store reference value
     # M[M[D[i] + j]] = M[sp];
     # sp = sp - 1
     def storeReferenceValue(self, i, j):
-        print(" ('srv', {0}, {1}),".format(i, j), file=self.output)
+        self.emit('srv', i, j)
 
 
     # ('add')  # Add
     # M[sp - 1] = M[sp - 1] + M[sp];
     # sp = sp - 1
     def add(self):
-        print(" ('add'),", file=self.output)
+        self.emit('add')
 
 
     # ('sub')  # Subtract
     # M[sp - 1] = M[sp - 1] - M[sp];
     # sp = sp - 1
     def subtract(self):
-        print(" ('sub'),", file=self.output)
+        self.emit('sub')
 
 
     # ('mul')  # Multiply
     # M[sp - 1] = M[sp - 1] * M[sp];
     # sp = sp - 1
     def multiply(self):
-        print(" ('mul'),", file=self.output)
+        self.emit('mul')
 
 
     # ('div')  # Division
     # M[sp - 1] = M[sp - 1] / M[sp];
     # sp = sp - 1
     def division(self):
-        print(" ('div'),", file=self.output)
+        self.emit('div')
 
 
     # ('mod')  # Modulus
     # M[sp - 1] = M[sp - 1] % M[sp];
     # sp = sp - 1
     def modulus(self):
-        print(" ('mod'),", file=self.output)
+        self.emit('mod')
 
 
     # ('neg')  # Negate
     # M[sp] = -M[sp]
     def negate(self):
-        print(" ('neg'),", file=self.output)
+        self.emit('neg')
 
 
     # (' and ')  # Logical And
     # M[sp - 1] = M[sp - 1] and M[sp];
     # sp = sp - 1
     def logicalAnd(self):
-        print(" ('and'),", file=self.output)
+        self.emit('and')
 
 
     # ('lor')  # Logical Or
     # M[sp - 1] = M[sp - 1] or M[sp];
     # sp = sp - 1
     def logicalOr(self):
-        print(" ('lor'),", file=self.output)
+        self.emit('lor')
 
 
     # ('not')  # Logical Not
     # M[sp] = not M[sp]
     def logicalNot(self):
-        print(" ('not'),", file=self.output)
+        self.emit('not')
 
 
     # ('les')  # Less
     # M[sp - 1] = M[sp - 1] < M[sp];
     # sp = sp - 1
     def less(self):
-        print(" ('les'),", file=self.output)
+        self.emit('les')
 
 
     # ('leq')  # Less or Equal
     # M[sp - 1] = M[sp - 1] <= M[sp];
     # sp = sp - 1
     def lessOrEqual(self):
-        print(" ('leq'),", file=self.output)
+        self.emit('leq')
 
 
     # ('grt')  # Greater
     # M[sp - 1] = M[sp - 1] > M[sp];
     # sp = sp - 1
     def greater(self):
-        print(" ('grt'),", file=self.output)
+        self.emit('grt')
 
 
     # ('gre')  # Greater or Equal
     # M[sp - 1] = M[sp - 1] >= M[sp];
     # sp = sp - 1
     def greaterOrEqual(self):
-        print(" ('gre'),", file=self.output)
+        self.emit('gre')
 
 
     # ('equ')  # Equal
     # M[sp - 1] = M[sp - 1] == M[sp];
     # sp = sp - 1
     def equal(self):
-        print(" ('equ'),", file=self.output)
+        self.emit('equ')
 
 
     # ('neq')  # Not Equal
     # M[sp - 1] = M[sp - 1] != M[sp];
     # sp = sp - 1
     def notEqual(self):
-        print(" ('neq'),", file=self.output)
+        self.emit('neq')
 
 
     # ('jmp', p)  # Jump
     # pc = p
     def jump(self, p):
-        print(" ('jmp', {0}),".format(p), file=self.output)
+        self.emit('jmp', p)
 
 
     # ('jof', p)  # Jump on False
@@ -202,13 +221,13 @@ class CodePrinter(object):
     #    pc = pc + 1
     # sp = sp - 1
     def jumpOnFalse(self, p):
-        print(" ('jof', {0}),".format(p), file=self.output)
+        self.emit('jof', p)
 
 
     # ('dlc', n)  # Deallocate memory
     # sp = sp - n
     def deallocateMemory(self, n):
-        print(" ('dlc', {0}),".format(n), file=self.output)
+        self.emit('dlc', n)
 
 
     # ('cfu', p)  # Call Function
@@ -216,7 +235,7 @@ class CodePrinter(object):
     # M[sp] = pc + 1;
     # pc = p
     def callFunction(self, p):
-        print(" ('cfu', {0}),".format(p), file=self.output)
+        self.emit('cfu', p)
 
 
     # ('enf', k)  # Enter Function
@@ -224,7 +243,7 @@ class CodePrinter(object):
     # M[sp] = D[k];
     # D[k] = sp + 1
     def enterFunction(self, k):
-        print(" ('enf', {0}),".format(k), file=self.output)
+        self.emit('enf', k)
 
 
     # ('ret', k, n)  # Return from Function
@@ -232,20 +251,20 @@ class CodePrinter(object):
     # pc = M[sp - 1];
     #  sp = sp - (n + 2)
     def returnFromFunction(self, k, n):
-        print(" ('ret', {0}, {1}),".format(k, n), file=self.output)
+        self.emit('ret', k, n)
 
 
     # ('idx', k)  # Index
     # M[sp - 1] = M[sp - 1] + M[sp] * k
     # sp = sp - 1
     def index(self, k):
-        print(" ('idx', {0}),".format(k), file=self.output)
+        self.emit('idx', k)
 
 
     # ('grc')  # Get(Load) Reference Contents
     # M[sp] = M[M[sp]]
     def getReferenceContents(self):
-        print(" ('grc'),", file=self.output)
+        self.emit('grc')
 
 
     # ('lmv', k)  # Load multiple values
@@ -253,7 +272,7 @@ class CodePrinter(object):
     # M[sp:sp + k] = M[t:t + k]
     # sp += (k - 1)
     def loadMultipleValues(self, k):
-        print(" ('lmv', {0}),".format(k), file=self.output)
+        self.emit('lmv', k)
 
 
     # ('smv', k)  # Store multiple Values
@@ -261,7 +280,7 @@ class CodePrinter(object):
     # M[t:t + k] = M[sp - k + 1:sp + 1]
     # sp -= (k + 1)
     def storeMultipleValues(self, k):
-        print(" ('smv', {0}),".format(k), file=self.output)
+        self.emit('smv', k)
 
 
     # ('smr', k)  # Store multiple References
@@ -270,7 +289,7 @@ class CodePrinter(object):
     # M[t1:t1 + k] = M[t2:t2 + k]
     # sp -= 1
     def storeMultipleReferences(self, k):
-        print(" ('smr', {0}),".format(k), file=self.output)
+        self.emit('smr', k)
 
 
     # ('sts', k)  # Store string constant on reference
@@ -281,14 +300,14 @@ class CodePrinter(object):
     #    M[adr] = c;
     # sp = sp - 1
     def storeStringReference(self, k):
-        print(" ('sts', {0}),".format(k), file=self.output)
+        self.emit('sts', k)
 
 
     # ('rdv')  # Read single Value
     # sp = sp + 1;
     # M[sp] = input()
     def readSingleValue(self):
-        print(" ('rdv'),", file=self.output)
+        self.emit('rdv')
 
 
     # ('rds')  # Read String and store it on stack reference
@@ -300,27 +319,27 @@ class CodePrinter(object):
     #    M[adr] = k
     # sp = sp - 1
     def readString(self):
-        print(" ('rds'),", file=self.output)
+        self.emit('rds')
 
 
     # ('prv')  # Print Value
     # print(M[sp]);
     # sp = sp - 1
     def printValue(self):
-        print(" ('prv'),", file=self.output)
+        self.emit('prv')
 
 
     # ('prt', k)  # Print Multiple Values
     # print(M[sp - k + 1:sp + 1]);
     # sp -= (k - 1)
     def printMultipleValues(self, k):
-        print(" ('prt', {0}),".format(k), file=self.output)
+        self.emit('prt', k)
 
 
     # ('prc', i)  # Print String constant
     # print(H(i), end="")
     def printStringContents(self, i):
-        print(" ('prc', {0}),".format(i), file=self.output)
+        self.emit('prc', i)
 
 
         # ('prs')  # Print contents of a string location
@@ -331,12 +350,90 @@ class CodePrinter(object):
         #    print(M(adr), end="")
         # sp = sp - 1
     def printStringContentsLocation(self):
-        print(" ('prs'),", file=self.output)
+        self.emit('prs')
 
 
     # ('lbl', i)  # No operation
     # (define the label index i)
     def addLabel(self, i):
-        print(" ('lbl', {0}),".format(i), file=self.output)
-    
-    
\ No newline at end of file
+        self.emit('lbl', i)
+
+
+    # Superinstructions, emitted by lya_optimizer.fuse in place of the
+    # sequences of instructions that run most often.
+
+    # ('inc', i, j, k)  # Increment Value
+    # (ldv i j; ldc k; add; stv i j)
+    # M[D[i] + j] = M[D[i] + j] + k
+    def incrementValue(self, i, j, k):
+        self.emit('inc', i, j, k)
+
+
+    # ('jge', p)  # Compare and Jump, also jlt, jle, jgt, jeq and jne
+    # (les; jof p)
+    # if M[sp - 1] >= M[sp]:
+    #    pc = p
+    # sp = sp - 2
+    def compareAndJump(self, jump, p):
+        self.emit(jump, p)
+
+
+    # ('vv_add', i, j, k, l)  # Load Values and Operate, for every binary operator
+    # (ldv i j; ldv k l; add)
+    # sp = sp + 1
+    # M[sp] = M[D[i] + j] + M[D[k] + l]
+    def loadValuesOperation(self, op, i, j, k, l):
+        self.emit('vv_' + op, i, j, k, l)
+
+
+    # ('vc_add', i, j, k)  # Load Value, Constant and Operate, for every binary operator
+    # (ldv i j; ldc k; add)
+    # sp = sp + 1
+    # M[sp] = M[D[i] + j] + k
+    def loadValueConstantOperation(self, op, i, j, k):
+        self.emit('vc_' + op, i, j, k)
+
+
+class ListCodePrinter(CodePrinter):
+    """Accumulates the program as a list of instruction tuples.
+
+    The program can be handed to Interpreter.load_code directly, it is only
+    written when an output file is given, in a single write at the end.
+    """
+    def __init__(self, output=None, binary=True):
+        super(ListCodePrinter, self).__init__(None)
+        self.file_name = output
+        self.binary = binary
+        self.H = []
+        self.text = []
+
+    def emit(self, op, *operands):
+        self.text.append((op,) + operands)
+
+    def printStrs(self, strs):
+        self.H = list(strs)
+
+    def startProgram(self):
+        self.emit('stp')
+
+    def endProgram(self):
+        self.emit('end')
+        if self.file_name is not None:
+            self.save(self.file_name)
+
+    def dumps_text(self):
+        lines = []
+        if len(self.H) > 0:
+            lines.append("H = {}".format(self.H))
+        lines.append("[")
+        for row in self.text:
+            lines.append(format_instruction(*row))
+        lines.append("]")
+        return "\n".join(lines) + "\n"
+
+    def save(self, file_name):
+        if self.binary:
+            lya_bytecode.dump(self.H, self.text, file_name)
+        else:
+            with open(file_name, 'w') as f:
+                f.write(self.dumps_text())
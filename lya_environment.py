@@ -26,7 +26,7 @@ class Parameters(object):
         self.scope = None
         self.isLocation = False
         self.hasReturn = False
-        self.returnSize = Non
+        self.returnSize = None
         self.indexList = None
         self.param_list = None
 
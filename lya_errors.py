@@ -42,5 +42,24 @@ class FileNotFoundError(CompilerException):
     pass
 
 
+class UnsupportedError(CompilerException):
+    pass
+
+
 class InterpreterError(CompilerException):
     pass
+
+
+class MemoryLimitError(InterpreterError):
+    def __init__(self, what, pc, limit):
+        super(MemoryLimitError, self).__init__(what, "pc = {0}, the memory is limited to {1} cells.".format(pc, limit))
+        self.pc = pc
+        self.limit = limit
+
+
+class StackOverflowError(MemoryLimitError):
+    pass
+
+
+class OutOfMemoryError(MemoryLimitError):
+    pass
@@ -0,0 +1,24 @@
+# lya_fusetab.py
+# Generated by lya_fusion.py from the profile of the examples. Do not edit.
+
+# instructions executed by the examples
+EXECUTED = 5412
+# the sequences fused into superinstructions and the times they ran
+SEQUENCES = (
+    (('grt', 'jof'), 221),
+    (('ldv', 'ldc', 'sub'), 189),
+    (('ldv', 'ldc', 'grt'), 182),
+    (('ldv', 'ldc', 'add'), 156),
+    (('ldv', 'ldc', 'add', 'stv'), 139),
+    (('ldv', 'ldv', 'mul'), 129),
+    (('ldv', 'ldc', 'les'), 39),
+    (('les', 'jof'), 39),
+    (('ldv', 'ldv', 'add'), 32),
+    (('ldv', 'ldv', 'grt'), 20),
+    (('equ', 'jof'), 13),
+    (('ldv', 'ldv', 'sub'), 7),
+    (('ldv', 'ldc', 'equ'), 6),
+    (('ldv', 'ldc', 'mul'), 6),
+    (('ldv', 'ldc', 'neq'), 6),
+    (('neq', 'jof'), 6),
+)
@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Choice of the superinstructions used by lya_optimizer.fuse.
+#
+# Running
+#
+#     python lya_fusion.py
+#
+# compiles the examples with -O but without superinstructions, with each 'stk'
+# split as fuse sees it, runs each one for at most LIMIT instructions on the
+# classic engine, reading STDIN, counting the CANDIDATES of lya_optimizer that
+# end at each instruction executed, and writes to lya_fusetab.py the
+# candidates run at least once every 1 / MIN_SHARE instructions, with their
+# counts. The tests check that lya_fusetab.py is still the one of the
+# examples and of the code generator.
+
+from __future__ import print_function
+
+import collections
+import os
+import sys
+from StringIO import StringIO
+
+from compiler import compile_source, expand_inputs
+from interpreter import Interpreter
+from lya_optimizer import candidates, optimize, split_stores
+
+
+FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lya_fusetab.py')
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'examples')
+
+MIN_SHARE = 0.001
+# input of the examples that read, and the instructions each example may run
+STDIN = "5 3 7 2 9 1 4 5 6 7 8 9 1 2\n" * 5
+LIMIT = 100000
+
+
+class Stop(Exception):
+    pass
+
+
+class SequenceCounter(Interpreter):
+    # counts the candidates ending at each instruction executed
+    def __init__(self, *args, **kwargs):
+        super(SequenceCounter, self).__init__(*args, **kwargs)
+        self.counts = collections.Counter()
+        self.executed = 0
+        self._window = collections.deque(maxlen=4)
+        self._last_pc = -1
+
+    def exec_op(self, row):
+        if self.executed == LIMIT:
+            raise Stop()
+        self.executed += 1
+        # the instructions on both sides of a jump, a call or a return are
+        # not next to each other in the code, fuse can not join them
+        if self._pc != self._last_pc + 1:
+            self._window.clear()
+        self._last_pc = self._pc
+        self._window.append(row)
+        window = list(self._window)
+        for start in range(len(window) - 1):
+            self.counts.update(s for s in candidates(*window[start:]) if len(s) == len(window) - start)
+        super(SequenceCounter, self).exec_op(row)
+
+
+def profile(folder=EXAMPLES):
+    """Returns the number of instructions executed by the examples of folder
+    and the Counter of the candidates they ran."""
+    counts = collections.Counter()
+    executed = 0
+    for f in expand_inputs([folder]):
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            try:
+                program = compile_source(open(f).read())
+            except Exception:
+                # the examples of the errors
+                continue
+            i = SequenceCounter(False, engine='classic', files=[], stdin=StringIO(STDIN))
+            i.load_code(program.H, split_stores(optimize(program.text)))
+            try:
+                i.run()
+            except Exception:
+                # the instructions run before an error, the end of the input or the limit still count
+                pass
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        counts.update(i.counts)
+        executed += i.executed
+    return executed, counts
+
+
+def dumps(executed, counts):
+    """Source of lya_fusetab.py."""
+    chosen = sorted((s for s in counts if counts[s] >= MIN_SHARE * executed), key=lambda s: (-counts[s], s))
+    lines = ["# lya_fusetab.py", "# Generated by lya_fusion.py from the profile of the examples. Do not edit.", "",
+             "# instructions executed by the examples", "EXECUTED = %d" % executed,
+             "# the sequences fused into superinstructions and the times they ran", "SEQUENCES = ("]
+    lines.extend("    (%r, %d)," % (s, counts[s]) for s in chosen)
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def write(folder=EXAMPLES, file_name=FILENAME):
+    with open(file_name, 'w') as f:
+        f.write(dumps(*profile(folder)))
+
+
+if __name__ == "__main__":
+    write(*sys.argv[1:2])
+    print("Wrote " + FILENAME)
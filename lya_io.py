@@ -0,0 +1,143 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Input and output of the running programs.
+
+import sys
+from collections import deque
+
+from lya_errors import InterpreterError
+
+
+class BufferedOutput(object):
+    """Output of a program. It is written to stream (sys.stdout when None,
+    looked up when written) once size characters have been collected, and
+    when flushed: at the end of the program, before reading the input and
+    on errors. With size 0 every write goes straight to the stream."""
+    def __init__(self, stream=None, size=1 << 16):
+        self.stream = stream
+        self.size = size
+        self._chunks = []
+        self._length = 0
+
+    def write(self, s):
+        self._chunks.append(s)
+        self._length += len(s)
+        if self._length >= self.size:
+            self.flush()
+
+    def flush(self):
+        if self._chunks:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write("".join(self._chunks))
+            self._chunks = []
+            self._length = 0
+            # a prompt shows before the program waits for the input
+            if hasattr(stream, 'flush'):
+                stream.flush()
+
+
+class Input(object):
+    """Input of a program: its lines, and the values read from them, separated
+    by spaces. The sources read the lines by chunks, _more returns the next
+    ones or None at the end, which is all there is without a source. Before
+    it waits for them, output is flushed."""
+    def __init__(self, output=None):
+        self.output = output
+        self._lines = deque()
+        self._tokens = deque()
+
+    def _more(self):
+        return None
+
+    def line(self):
+        while not self._lines:
+            if self.output is not None:
+                self.output.flush()
+            lines = self._more()
+            if lines is None:
+                raise EOFError("EOF when reading a line")
+            self._lines.extend(lines)
+        return self._lines.popleft()
+
+    def token(self):
+        if not self._tokens:
+            self._tokens.extend(self.line().split(' '))
+        return self._tokens.popleft()
+
+    def value(self):
+        token = self.token()
+        if token.isdigit():
+            return int(token)
+        elif token == 'true':
+            return True
+        elif token == 'false':
+            return False
+        raise InterpreterError("Invalid input, text when boolean or integer required.", token)
+
+
+class StreamInput(Input):
+    """Reads size characters at a time, or a line at a time from a terminal
+    and from the streams without read."""
+    def __init__(self, stream, output=None, size=1 << 16):
+        super(StreamInput, self).__init__(output)
+        self.stream = stream
+        self.size = size
+        self._chunked = hasattr(stream, 'read') and not (hasattr(stream, 'isatty') and stream.isatty())
+        # end of the last chunk, the start of a line
+        self._partial = ""
+
+    def _more(self):
+        if not self._chunked:
+            line = self.stream.readline()
+            return [line[:-1] if line[-1:] == '\n' else line] if line else None
+        chunk = self.stream.read(self.size)
+        if not chunk:
+            if not self._partial:
+                return None
+            lines, self._partial = [self._partial], ""
+            return lines
+        lines = (self._partial + chunk).split('\n')
+        self._partial = lines.pop()
+        return lines
+
+
+class FileInput(StreamInput):
+    def __init__(self, name, output=None, size=1 << 16):
+        super(FileInput, self).__init__(open(name), output, size)
+
+
+class ListInput(Input):
+    """The lines of a list, without their ends."""
+    def __init__(self, lines, output=None):
+        super(ListInput, self).__init__(output)
+        self._lines.extend(lines)
+
+    def _more(self):
+        return None
+
+
+class ConsoleInput(Input):
+    """Reads the lines with raw_input, which edits them in a terminal."""
+    def _more(self):
+        try:
+            return [raw_input()]
+        except EOFError:
+            return None
+
+
+def open_input(source=None, output=None):
+    """Input of a program from source: a stream, the name of a file, a list of
+    lines or None for sys.stdin, edited in a terminal."""
+    if isinstance(source, Input):
+        source.output = output
+        return source
+    if source is None:
+        if sys.stdin.isatty():
+            return ConsoleInput(output)
+        source = sys.stdin
+    if isinstance(source, basestring):
+        return FileInput(source, output)
+    if isinstance(source, (list, tuple)):
+        return ListInput(source, output)
+    return StreamInput(source, output)
@@ -0,0 +1,174 @@
+# lya_lalr.py
+# Generated by lya_tables.py from the grammar of LyaParser. Do not edit.
+
+import lya_tables
+
+SIGNATURE = '21B023381FB849CEB762395F01DB7B8D'
+# number of symbols of each production
+LENGTHS = (1, 1, 1, 2, 1, 1, 1, 1, 1, 3, 1, 3, 2, 3, 2, 1, 3, 1, 3, 1, 3, 3, 4, 1, 3, 1, 3, 3, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 4, 4, 1, 1, 3, 2, 4, 1, 5, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 2, 4, 6, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 6, 1, 1, 4, 6, 1, 3, 1, 1, 5, 6, 1, 2, 2, 3, 4, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 2, 4, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 2, 1, 1, 1, 4, 5, 1, 2, 1, 2, 3, 4, 2, 3, 4, 5, 1, 2, 1, 2, 1, 1, 4, 5, 5, 6, 2, 2, 3, 4, 2, 3, 4, 1, 3, 2, 1, 2, 2, 3, 4, 1, 1, 1, 1, 1, 1, 1, 1, 4, 5, 6, 6, 6, 7, 7, 7, 8, 1, 2, 1, 3, 2, 1, 2, 4, 5)
+# column of GOTO of the left-hand side of each production
+LEFT = (-1, 74, 84, 84, 83, 83, 83, 83, 83, 24, 23, 23, 22, 22, 46, 42, 42, 41, 93, 92, 92, 91, 91, 20, 59, 58, 58, 55, 54, 54, 54, 54, 54, 54, 26, 26, 26, 26, 48, 11, 16, 28, 28, 56, 27, 51, 76, 90, 89, 5, 44, 44, 45, 45, 52, 52, 52, 52, 52, 52, 25, 88, 82, 37, 37, 70, 70, 70, 70, 50, 50, 50, 50, 50, 47, 10, 10, 15, 15, 33, 17, 96, 97, 6, 69, 36, 36, 19, 19, 9, 95, 31, 32, 32, 60, 60, 65, 65, 78, 78, 78, 78, 78, 78, 78, 78, 53, 61, 61, 66, 66, 3, 3, 87, 62, 62, 4, 4, 4, 63, 63, 57, 57, 64, 64, 64, 77, 1, 1, 0, 0, 0, 0, 0, 0, 0, 12, 12, 8, 7, 7, 18, 18, 18, 43, 43, 94, 94, 30, 30, 30, 30, 29, 29, 29, 29, 21, 21, 21, 38, 49, 49, 85, 85, 85, 85, 86, 34, 75, 75, 98, 71, 71, 67, 67, 35, 81, 81, 79, 13, 13, 14, 14, 14, 14, 14, 14, 14, 14, 73, 72, 72, 72, 72, 72, 72, 72, 72, 2, 2, 40, 40, 39, 68, 68, 80, 80)
+# method of each production, None when it only does p[0] = p[1] of its only symbol
+ACTIONS = (None, 'p_program', 'p_statement_list', 'p_statement_list', None, None, None, None, None, 'p_declaration_statement', 'p_declaration_list', 'p_declaration_list', 'p_declaration', 'p_declaration', 'p_initialization', 'p_identifier_list', 'p_identifier_list', 'p_identifier', 'p_synonym_statement', 'p_synonym_list', 'p_synonym_list', 'p_synonym_definition', 'p_synonym_definition', None, 'p_newmode_statement', 'p_newmode_list', 'p_newmode_list', 'p_mode_definition', 'p_mode', 'p_mode', 'p_mode', 'p_mode', 'p_mode', 'p_mode', 'p_discrete_mode', 'p_discrete_mode', 'p_discrete_mode', 'p_discrete_mode', None, None, None, 'p_discrete_range_mode', 'p_discrete_range_mode', 'p_mode_name', None, 'p_literal_range', 'p_reference_mode', 'p_string_mode', 'p_string_length', 'p_array_mode', 'p_index_list', 'p_index_list', None, None, 'p_location', 'p_location', 'p_location', 'p_location', 'p_location', 'p_location', 'p_dereferenced_reference', 'p_string_element', 'p_slice', 'p_expression_list', 'p_expression_list', None, None, None, None, None, None, None, None, None, 'p_integer_literal', 'p_boolean_literal', 'p_boolean_literal', 'p_character_literal', 'p_character_literal', 'p_empty_literal', 'p_character_string_literal', 'p_value_array_element', 'p_value_array_slice', None, 'p_parenthesized_expression', 'p_expression', 'p_expression', 'p_conditional_expression', 'p_conditional_expression', None, 'p_then_expression', 'p_else_expression', 'p_elsif_expression', 'p_elsif_expression', 'p_operand0', 'p_operand0', None, None, None, None, None, None, None, None, None, None, None, 'p_operand1', 'p_operand1', None, None, None, None, None, 'p_operand2', 'p_operand2', None, None, None, 'p_operand3', 'p_operand3', None, None, None, None, None, 'p_referenced_location', 'p_action_statement', 'p_action_statement', None, None, None, None, None, None, None, None, None, 'p_assignment_action', 'p_assigning_operator', 'p_assigning_operator', None, None, None, 'p_if_action', 'p_if_action', 'p_then_clause', 'p_then_clause', 'p_else_clause', 'p_else_clause', 'p_else_clause', 'p_else_clause', 'p_do_action', 'p_do_action', 'p_do_action', 'p_do_action', 'p_control_part', 'p_control_part', 'p_control_part', 'p_for_control', None, None, 'p_step_enumeration', 'p_step_enumeration', 'p_step_enumeration', 'p_step_enumeration', 'p_step_value', 'p_end_value', 'p_range_enumeration', 'p_range_enumeration', 'p_while_control', 'p_procedure_call', 'p_procedure_call', 'p_parameter_list', 'p_parameter_list', 'p_exit_action', 'p_return_action', 'p_return_action', 'p_result_action', 'p_builtin_call', 'p_builtin_call', None, None, None, None, None, None, None, None, 'p_procedure_statement', 'p_procedure_definition', 'p_procedure_definition', 'p_procedure_definition', 'p_procedure_definition', 'p_procedure_definition', 'p_procedure_definition', 'p_procedure_definition', 'p_procedure_definition', 'p_action_statement_list', 'p_action_statement_list', 'p_formal_parameter_list', 'p_formal_parameter_list', 'p_formal_parameter', 'p_parameter_spec', 'p_parameter_spec', 'p_result_spec', 'p_result_spec')
+
+
+class Production(list):
+    """The p of the actions, p[0] being the value of the left-hand side."""
+    def lineno(self, n):
+        return self.starts[self.base + n].lineno
+
+    def lexpos(self, n):
+        return self.starts[self.base + n].lexpos
+
+    # the last tokens of the symbols are only kept with tracking, without it
+    # the spans end where they start as in yacc.LRParser
+    def linespan(self, n):
+        return self.starts[self.base + n].lineno, self.ends[self.base + n].lineno
+
+    def lexspan(self, n):
+        return self.starts[self.base + n].lexpos, self.ends[self.base + n].lexpos
+
+
+class Position(object):
+    """The start of a symbol without tokens."""
+    def __init__(self, lineno, lexpos):
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class End(object):
+    type = '$end'
+    value = None
+    lineno = 0
+
+
+END = End()
+
+
+class LALRParser(object):
+    def __init__(self, parser, tables):
+        if tables['SIGNATURE'] != SIGNATURE:
+            raise ValueError("lya_lalr.py is not made for the tables of lya_parsetab.py.")
+        self.errorfunc = parser.p_error
+        self.actions = [getattr(parser, name) if name else None for name in ACTIONS]
+        # the rows of ACTION with a last column of errors, for the unknown tokens
+        terminals = tables['TERMINALS']
+        width = len(terminals)
+        self.index = dict((name, column) for column, name in enumerate(terminals))
+        self.unknown = width
+        self.action = []
+        flat = tables['ACTION']
+        for start in range(0, len(flat), width):
+            self.action.extend(flat[start: start + width])
+            self.action.append(lya_tables.ERROR)
+        self.action_base = [row * (width + 1) for row in tables['ACTION_ROW']]
+        self.goto = list(tables['GOTO'])
+        self.goto_base = [row * len(tables['NONTERMINALS']) for row in tables['GOTO_ROW']]
+        # the production reduced in each state whatever the next token is, or 0
+        self.default = [0] * len(self.action_base)
+        defaulted = tables['DEFAULTED']
+        for n in range(0, len(defaulted), 2):
+            self.default[defaulted[n]] = defaulted[n + 1]
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=True):
+        """Parses as yacc.LRParser.parse, except that the line numbers of the
+        symbols are given without tracking: tracking keeps their last tokens
+        for the spans. debug is only accepted for the calls of
+        yacc.LRParser.parse."""
+        if input is not None:
+            lexer.input(input)
+        get_token = lexer.token
+        action = self.action
+        action_base = self.action_base
+        goto = self.goto
+        goto_base = self.goto_base
+        default = self.default
+        index = self.index
+        unknown = self.unknown
+        actions = self.actions
+        lengths = LENGTHS
+        left = LEFT
+        ERROR = lya_tables.ERROR
+
+        states = [0]
+        values = [None]
+        # the first token of each symbol, its line is only read by p.lineno
+        starts = [Position(0, 0)]
+        ends = [starts[0]] if tracking else starts
+        p = Production()
+        p.starts = starts
+        p.ends = ends
+        state = 0
+        lookahead = None
+        column = unknown
+        errorcount = 0
+        while True:
+            t = default[state]
+            if not t:
+                if lookahead is None:
+                    lookahead = get_token() or END
+                    column = index.get(lookahead.type, unknown)
+                t = action[action_base[state] + column]
+            if t < 0:
+                rule = -t
+                f = actions[rule]
+                if f is None:
+                    # p[0] = p[1]
+                    state = goto[goto_base[states[-2]] + left[rule]]
+                    states[-1] = state
+                    continue
+                n = lengths[rule]
+                if n:
+                    p[:] = values[-n - 1:]
+                    p[0] = None
+                    p.base = len(starts) - n - 1
+                    f(p)
+                    start = starts[-n]
+                    del values[-n:]
+                    del starts[-n:]
+                    del states[-n:]
+                    if tracking:
+                        end = ends[-1]
+                        del ends[-n:]
+                else:
+                    p[:] = [None]
+                    p.base = len(starts) - 1
+                    f(p)
+                    start = end = Position(lexer.lineno, lexer.lexpos)
+                values.append(p[0])
+                starts.append(start)
+                if tracking:
+                    ends.append(end)
+                state = goto[goto_base[states[-1]] + left[rule]]
+                states.append(state)
+                continue
+            if t != ERROR:
+                if t == 0:
+                    return values[-1]
+                states.append(t)
+                state = t
+                values.append(lookahead.value)
+                starts.append(lookahead)
+                if tracking:
+                    ends.append(lookahead)
+                lookahead = None
+                if errorcount:
+                    errorcount -= 1
+                continue
+            # a syntax error, reported unless there was another one in the last 3 tokens
+            if errorcount == 0:
+                errtoken = lookahead if lookahead.type != '$end' else None
+                if errtoken is not None and not hasattr(errtoken, 'lexer'):
+                    errtoken.lexer = lexer
+                self.errorfunc(errtoken)
+            errorcount = 3
+            if lookahead.type == '$end':
+                return None
+            # there are no error rules, the parser starts again after the token
+            del states[1:]
+            del values[1:]
+            del starts[1:]
+            if tracking:
+                del ends[1:]
+            state = 0
+            lookahead = None
@@ -1,12 +1,37 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
+import functools
+import re
+import threading
+
 import ply.lex as lex
 
+# the master regex is compiled once per process, every LyaLexer gets a clone
+_master = None
+_master_lock = threading.Lock()
+
+
 class LyaLexer:
-    def __init__(self):
-        self.lexer = lex.lex(optimize=1, module=self)
+    def __init__(self, ply=False):
+        """The lexer is the Scanner of this module, or with ply=True the
+        lexer ply.lex builds from the rules below."""
+        global _master
+        if ply:
+            if _master is None:
+                with _master_lock:
+                    if _master is None:
+                        # without a lextab, optimize skips the checks of the rules
+                        # and writes no lextab.py next to this file
+                        _master = lex.lex(optimize=1, lextab='', module=self)
+            # rebinds the token rules to this instance, begin() picks the rebound ones
+            self.lexer = _master.clone(self)
+            self.lexer.begin('INITIAL')
+        else:
+            self.lexer = Scanner(self)
         self.error = False
+        # the diagnostics printed or recorded since the last reset, see LyaParser.reported
+        self.errors = 0
 
     reserved = {
         'array': 'ARRAY',
@@ -108,7 +133,7 @@ class LyaLexer:
     t_ARROW = r'->'
     t_SCONC = r'&'
     t_MODUS = r'%'
-    t_CARET = r'^'
+    t_CARET = r'\^'
 
     t_PLUS    = r'\+'
     t_MINUS   = r'-'
@@ -170,8 +195,10 @@ class LyaLexer:
                     elif follower == "\\":
                         strpieces.append("\\\\")
                     else: #value different
+                        self.errors += 1
                         print "%d: Bad string escape code '\%s'" % t.lexer.lineno, value[loc+1]
                 except: #no character after
+                    self.errors += 1
                     print "%d: String ends with '\\' - ignored" % t.lexer.lineno
 
                 value = value[loc+2:] #continue on the remaining of string
@@ -189,6 +216,7 @@ class LyaLexer:
         
     def t_unfinished_comment(self, t):
         r'(/\*(.|\n)*?\Z)'
+        self.errors += 1
         print ">>>> " + str(t.lexer.lineno) + " Unterminated comment"
         pass
 
@@ -200,6 +228,7 @@ class LyaLexer:
 
     def t_error(self, t):
         self.error = True
+        self.errors += 1
         if t.value[0] == '"':
             self.error_message = str(t.lexer.lineno) + ": Unterminated string"
         else:
@@ -209,10 +238,9 @@ class LyaLexer:
     def to_token(self, data):
         self.error = False
         self.error_message = ""
-        # Build the lexer
-        self.lexer = lex.lex(optimize=1, module=self)
         toks = []
         # Give the lexer some input
+        self.lexer.lineno = 1
         self.lexer.input(data)
         # Tokenize
         while True:
@@ -224,3 +252,138 @@ class LyaLexer:
             toks.append(tok)
         return toks
 
+
+# The tokens of the rules of LyaLexer in a single regex, one named group by
+# token type. The groups are tried in the order of the master regex of
+# ply.lex: the rules of the functions first (an ID before the keywords of
+# t_IF, t_DO..., which never match), then the longest operators. Each match
+# starts with the blanks and the newlines before its token and error matches
+# any other character.
+SCANNER = re.compile(r"""
+    [ \t\n]*
+    (?:
+    (?P<ID>[a-zA-Z_][a-zA-Z0-9_]*)
+  | (?P<ICONST>\d+)
+  | (?P<CCONST>'.')
+  | (?P<SCONST>"[^"\n]*")
+  | (?P<comment>/\*[\s\S]*?\*/|//.*)
+  | (?P<unfinished_comment>/\*[\s\S]*)
+  | (?P<OR>\|\|) | (?P<AND>&&) | (?P<NOTEQUAL>!=) | (?P<EQUAL>==) | (?P<ARROW>->)
+  | (?P<GREATEREQUAL>>=) | (?P<LESSEQUAL><=)
+  | (?P<SEMI>;) | (?P<ASSIGN>=) | (?P<LPAREN>\() | (?P<RPAREN>\)) | (?P<COMMA>,) | (?P<PLUS>\+)
+  | (?P<MINUS>-) | (?P<TIMES>\*) | (?P<DIVIDE>/) | (?P<MODUS>%) | (?P<LBRACKET>\[) | (?P<RBRACKET>\])
+  | (?P<COLON>:) | (?P<LESS><) | (?P<GREATER>>) | (?P<NOT>!) | (?P<SCONC>&) | (?P<CARET>\^)
+  | (?P<SQUOTE>')
+  | (?P<error>[^ \t\n])
+    )
+""", re.VERBOSE)
+
+# type of each name matched by ID
+KEYWORDS = dict(LyaLexer.reserved, **LyaLexer.predefined)
+
+# the groups left to the rules of LyaLexer, as ply.lex would call them
+RULES = {
+    'CCONST': 't_CCONST',
+    'SCONST': 't_SCONST',
+    'unfinished_comment': 't_unfinished_comment',
+    'error': 't_error',
+}
+
+
+class Token(lex.LexToken):
+    """LexToken of a Scanner, the lexer of its class, which finds its lineno
+    from its lexpos when it is asked for."""
+    @property
+    def lineno(self):
+        return self.lexer.line(self.lexpos)
+
+
+class Scanner(object):
+    """Lexer with the interface of the lexers of ply.lex the parser uses
+    (input, token, lineno) and the same tokens, read with one finditer over
+    SCANNER. The names, numbers, operators and newlines are handled inline,
+    the other groups call the rules of LyaLexer with the scanner as t.lexer.
+    The newlines are not counted as they go by: the line of a token, as its
+    column, is found from its lexpos when it is asked for. lexpos is the
+    position of the last token."""
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.Token = type('Token', (Token,), {'lexer': self})
+        self.lexdata = ""
+        self.lexpos = 0
+        # the line of the position _lexpos, the last one asked for
+        self._line = 1
+        self._lexpos = 0
+        self.input("")
+
+    @property
+    def lineno(self):
+        return self.line(self.lexpos)
+
+    @lineno.setter
+    def lineno(self, lineno):
+        self._line = lineno
+        self._lexpos = self.lexpos
+
+    def line(self, lexpos):
+        """Line of the character at lexpos, counting the newlines from the
+        position asked for before, the tokens are mostly asked for in order."""
+        if lexpos >= self._lexpos:
+            self._line += self.lexdata.count('\n', self._lexpos, lexpos)
+        else:
+            self._line -= self.lexdata.count('\n', lexpos, self._lexpos)
+        self._lexpos = lexpos
+        return self._line
+
+    def input(self, data):
+        # the input starts on the line where the last one ended
+        line = self.lineno
+        self.lexdata = data
+        self.lexpos = 0
+        self._line = line
+        self._lexpos = 0
+        # token() is the next token of the input or None, without a method call
+        self.token = functools.partial(next, self._scan(data), None)
+
+    def skip(self, n):
+        # only t_error skips, the character its group matched
+        pass
+
+    def column(self, token):
+        """Column of token in its line, from 1."""
+        return token.lexpos - self.lexdata.rfind('\n', 0, token.lexpos)
+
+    def _scan(self, data):
+        keywords = KEYWORDS
+        rules = RULES
+        Token = self.Token
+        for m in SCANNER.finditer(data):
+            kind = m.lastgroup
+            if kind == 'ID':
+                value = m.group(kind)
+                t = Token()
+                t.type = keywords.get(value, kind)
+                t.value = value
+            elif kind == 'ICONST':
+                t = Token()
+                t.type = kind
+                t.value = int(m.group(kind))
+            elif kind == 'comment':
+                continue
+            elif kind in rules:
+                t = Token()
+                t.type = kind
+                t.value = m.group(kind) if kind != 'error' else data[m.start(kind):]
+                t.lexpos = self.lexpos = m.start(kind)
+                t = getattr(self.rules, rules[kind])(t)
+                if t is not None:
+                    yield t
+                continue
+            else:
+                t = Token()
+                t.type = kind
+                t.value = m.group(kind)
+            t.lexpos = self.lexpos = m.start(kind)
+            yield t
+        self.lexpos = len(data)
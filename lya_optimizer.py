@@ -0,0 +1,275 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Peephole optimizer of the LVM code.
+#
+# optimize() applies the rewrites of RULES over a window that slides through
+# the program, together with the passes that need the whole program (unused
+# labels, unreachable code and jumps to jumps), until nothing changes.
+# Every jump goes to a 'lbl', so only the last instruction of a window may be
+# a label, and the rules that match it keep it in place.
+#
+# fuse() then replaces the sequences that run most often with the
+# superinstructions of lya_bytecode. Which of the CANDIDATES run often enough
+# is decided by profiling the examples, see lya_fusion.py, which writes the
+# chosen ones to lya_fusetab.py. Both see the 'stk' written by the rules as
+# the 'stv' and 'ldv' it replaces.
+
+import lya_bytecode
+import lya_fusetab
+from lya_codeprinter import ListCodePrinter
+
+
+def is_int(value):
+    return type(value) in (int, long)
+
+
+FOLD = {
+    'add': lambda a, b: a + b,
+    'sub': lambda a, b: a - b,
+    'mul': lambda a, b: a * b,
+    'div': lambda a, b: a // b if b != 0 else None,
+    'mod': lambda a, b: a % b if b != 0 else None,
+    'les': lambda a, b: a < b,
+    'leq': lambda a, b: a <= b,
+    'grt': lambda a, b: a > b,
+    'gre': lambda a, b: a >= b,
+    'equ': lambda a, b: a == b,
+    'neq': lambda a, b: a != b,
+}
+
+# operations that leave the value unchanged with this right operand
+IDENTITY = {'add': 0, 'sub': 0, 'mul': 1, 'div': 1}
+
+# comparison that gives the negated result
+INVERSE = {'les': 'gre', 'leq': 'grt', 'grt': 'leq', 'gre': 'les', 'equ': 'neq', 'neq': 'equ'}
+
+# the comparison followed by 'jof' jumps when the inverse comparison holds
+COMPARE_JUMP = {'les': 'jge', 'leq': 'jgt', 'grt': 'jle', 'gre': 'jlt', 'equ': 'jne', 'neq': 'jeq'}
+
+# opcodes of the sequences that have a superinstruction: 'inc', 'vv_', 'vc_'
+# and the comparisons with a jump
+CANDIDATES = ([('ldv', 'ldc', op, 'stv') for op in ('add', 'sub')] +
+              [('ldv', 'ldv', op) for op in lya_bytecode.BINARY] +
+              [('ldv', 'ldc', op) for op in lya_bytecode.BINARY] +
+              [(op, 'jof') for op in sorted(COMPARE_JUMP)])
+
+# the candidates fused by default
+FUSED = frozenset(sequence for sequence, count in lya_fusetab.SEQUENCES)
+
+
+# Each rule gets the instructions of its window and returns the ones that
+# replace them, or None when it does not apply.
+
+def drop_empty_allocation(a):
+    if a[0] in ('alc', 'dlc') and a[1] == 0:
+        return []
+
+
+def merge_allocations(a, b):
+    if a[0] == b[0] and a[0] in ('alc', 'dlc'):
+        return [(a[0], a[1] + b[1])]
+    if (a[0], b[0]) == ('alc', 'dlc') and a[1] == b[1]:
+        return []
+
+
+def drop_identity(a, b):
+    if a[0] == 'ldc' and is_int(a[1]) and IDENTITY.get(b[0], None) == a[1]:
+        return []
+
+
+def drop_double_negation(a, b):
+    if a[0] == b[0] == 'neg':
+        return []
+
+
+def keep_stored(a, b):
+    # the value stored is still on the stack
+    if a[0] == 'stv' and b == ('ldv',) + a[1:]:
+        return [('stk',) + a[1:]]
+
+
+def drop_free_before_end(a, b):
+    if a[0] == 'dlc' and b[0] == 'end':
+        return [b]
+
+
+def fold_constants(a, b, c):
+    if a[0] == b[0] == 'ldc' and is_int(a[1]) and is_int(b[1]) and c[0] in FOLD:
+        value = FOLD[c[0]](a[1], b[1])
+        if value is not None:
+            return [('ldc', value)]
+
+
+def fold_branch(a, b):
+    if a[0] == 'ldc' and type(a[1]) == bool and b[0] == 'jof':
+        return [] if a[1] else [('jmp', b[1])]
+
+
+def invert_comparison(a, b):
+    if a[0] in INVERSE and b[0] == 'not':
+        return [(INVERSE[a[0]],)]
+
+
+def drop_double_not(a, b, c):
+    if a[0] == b[0] == 'not' and c[0] == 'jof':
+        return [c]
+
+
+def invert_branch(a, b, c):
+    # jumps out of the loop when the condition holds instead of jumping over the jmp
+    if a[0] == 'jof' and b[0] == 'jmp' and c == ('lbl', a[1]):
+        return [('not',), ('jof', b[1]), c]
+
+
+RULES = [
+    (1, drop_empty_allocation),
+    (2, merge_allocations),
+    (2, drop_identity),
+    (2, drop_double_negation),
+    (2, drop_free_before_end),
+    (2, keep_stored),
+    (2, fold_branch),
+    (2, invert_comparison),
+    (3, fold_constants),
+    (3, drop_double_not),
+    (3, invert_branch),
+]
+
+
+def apply_rules(code):
+    out = []
+    i = 0
+    while i < len(code):
+        for size, rule in RULES:
+            window = code[i:i + size]
+            if len(window) == size and all(row[0] != 'lbl' for row in window[:-1]):
+                replacement = rule(*window)
+                if replacement is not None:
+                    # the replacement may start a new match with what precedes it
+                    code[i:i + size] = replacement
+                    back = min(len(out), 2)
+                    code[i:i] = out[len(out) - back:]
+                    del out[len(out) - back:]
+                    break
+        else:
+            out.append(code[i])
+            i += 1
+    return out
+
+
+def thread_jumps(code):
+    # first instruction after each label
+    target = {}
+    for i, row in enumerate(code):
+        if row[0] == 'lbl':
+            j = i
+            while j < len(code) and code[j][0] == 'lbl':
+                j += 1
+            target[row[1]] = code[j] if j < len(code) else None
+    out = []
+    for i, row in enumerate(code):
+        if row[0] in ('jmp', 'jof'):
+            seen = set([row[1]])
+            label = row[1]
+            while target.get(label) is not None and target[label][0] == 'jmp' and target[label][1] not in seen:
+                label = target[label][1]
+                seen.add(label)
+            row = (row[0], label)
+        if row[0] == 'jmp':
+            # jump to one of the labels that follow it
+            j = i + 1
+            while j < len(code) and code[j][0] == 'lbl' and code[j][1] != row[1]:
+                j += 1
+            if j < len(code) and code[j] == ('lbl', row[1]):
+                continue
+        out.append(row)
+    return out
+
+
+def drop_unreachable(code):
+    out = []
+    reachable = True
+    for row in code:
+        if row[0] == 'lbl':
+            reachable = True
+        if reachable:
+            out.append(row)
+        if row[0] in ('jmp', 'ret', 'end'):
+            reachable = False
+    return out
+
+
+def drop_unused_labels(code):
+    used = set(row[1] for row in code if row[0] in lya_bytecode.JUMPS)
+    return [row for row in code if row[0] != 'lbl' or row[1] in used]
+
+
+def optimize(text):
+    """Returns an optimized copy of a list of instruction tuples."""
+    code = list(text)
+    while True:
+        before = list(code)
+        code = apply_rules(code)
+        code = thread_jumps(code)
+        code = drop_unreachable(code)
+        code = drop_unused_labels(code)
+        if code == before:
+            return code
+
+
+def candidates(a, b=('',), c=('',), d=('',)):
+    """The CANDIDATES the instructions a, b, c, d start with, longest first."""
+    if (a[0] == 'ldv' and b[0] == 'ldc' and is_int(b[1]) and c[0] in ('add', 'sub') and
+            d == ('stv',) + a[1:]):
+        yield a[0], b[0], c[0], d[0]
+    if a[0] == 'ldv' and b[0] == 'ldv' and c[0] in lya_bytecode.BINARY:
+        yield a[0], b[0], c[0]
+    if a[0] == 'ldv' and b[0] == 'ldc' and is_int(b[1]) and c[0] in lya_bytecode.BINARY:
+        yield a[0], b[0], c[0]
+    if a[0] in COMPARE_JUMP and b[0] == 'jof':
+        yield a[0], b[0]
+
+
+def split_stores(text):
+    """Returns a copy of a list of instruction tuples with each 'stk' as the
+    'stv' and 'ldv' it replaces."""
+    out = []
+    for row in text:
+        if row[0] == 'stk':
+            out.extend([('stv',) + row[1:], ('ldv',) + row[1:]])
+        else:
+            out.append(row)
+    return out
+
+
+def fuse(text, fused=FUSED):
+    """Returns a copy of a list of instruction tuples using superinstructions
+    for the sequences of fused."""
+    # the sequences are found in the code without 'stk', such as the 'inc'
+    # of a variable read again, and the stores left are kept again after
+    text = split_stores(text)
+    printer = ListCodePrinter()
+    i = 0
+    while i < len(text):
+        a, b, c, d = (list(text[i:i + 4]) + [('',)] * 3)[:4]
+        sequence = next((s for s in candidates(a, b, c, d) if s in fused), None)
+        if sequence is None:
+            printer.emit(*a)
+        elif len(sequence) == 4:
+            printer.incrementValue(a[1], a[2], b[1] if c[0] == 'add' else -b[1])
+        elif len(sequence) == 2:
+            printer.compareAndJump(COMPARE_JUMP[a[0]], b[1])
+        elif b[0] == 'ldv':
+            printer.loadValuesOperation(c[0], a[1], a[2], b[1], b[2])
+        else:
+            printer.loadValueConstantOperation(c[0], a[1], a[2], b[1])
+        i += len(sequence) if sequence else 1
+    out = []
+    for row in printer.text:
+        kept = keep_stored(out[-1], row) if out else None
+        if kept is None:
+            out.append(row)
+        else:
+            out[-1:] = kept
+    return out
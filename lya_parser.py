@@ -1,16 +1,23 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
-import ply.yacc as yacc
 from lya_lex import LyaLexer
+import lya_tables
 from lya_ast import *
 
 
 class LyaParser:
-    def __init__(self):
-        self.tokens = LyaLexer.tokens
-        self.parser = yacc.yacc(optimize=1, debug=0, write_tables=True, module=self)
-        self.lexer = LyaLexer().lexer
+    tokens = LyaLexer.tokens
+
+    def __init__(self, tracking=False):
+        # the tables of lya_parsetab.py, see lya_tables
+        self.parser = lya_tables.load(self)
+        self.rules = LyaLexer()
+        self.lexer = self.rules.lexer
+        self.errors = 0
+        # the actions only need p.lineno, which both parsers give without
+        # tracking; tracking adds the spans of the symbols, p.lexspan and p.linespan
+        self.tracking = tracking
     
     precedence = (
             ('left', 'AND', 'OR', 'NOT'),
@@ -28,11 +35,12 @@ class LyaParser:
 
     def p_statement_list(self, p):
         '''statement_list : statement 
-                | statement statement_list'''
+                | statement_list statement'''
         if len(p) == 2:
             p[0] = Statement_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Statement_list(self.flat([p[1], p[2].statements]), lineno=p.lineno(1))
+            p[1].statements.append(p[2])
+            p[0] = p[1]
 
     def p_statement(self, p):
         '''statement : declaration_statement 
@@ -48,11 +56,12 @@ class LyaParser:
 
     def p_declaration_list(self, p):
         '''declaration_list : declaration 
-                | declaration COMMA declaration_list'''
+                | declaration_list COMMA declaration'''
         if len(p) == 2:
             p[0] = Declaration_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Declaration_list(self.flat([p[1], p[3].declarations]), lineno=p.lineno(1))
+            p[1].declarations.append(p[3])
+            p[0] = p[1]
 
     def p_declaration(self, p):
         '''declaration : identifier_list mode 
@@ -68,11 +77,12 @@ class LyaParser:
 
     def p_identifier_list(self, p):
         '''identifier_list : identifier 
-                | identifier COMMA identifier_list'''
+                | identifier_list COMMA identifier'''
         if len(p) == 2:
             p[0] = Identifier_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Identifier_list(self.flat([p[1], p[3].identifiers]), lineno=p.lineno(1))
+            p[1].identifiers.append(p[3])
+            p[0] = p[1]
 
     def p_identifier(self, p):
         '''identifier : ID'''
@@ -84,11 +94,12 @@ class LyaParser:
 
     def p_synonym_list(self, p):
         '''synonym_list : synonym_definition 
-                | synonym_definition COMMA synonym_list'''
+                | synonym_list COMMA synonym_definition'''
         if len(p) == 2:
             p[0] = Synonym_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Synonym_list(self.flat([p[1], p[3].synonym_definitions]), lineno=p.lineno(1))
+            p[1].synonym_definitions.append(p[3])
+            p[0] = p[1]
 
     def p_synonym_definition(self, p):
         '''synonym_definition : identifier_list ASSIGN constant_expression
@@ -108,11 +119,12 @@ class LyaParser:
 
     def p_newmode_list(self, p):
         '''newmode_list : mode_definition 
-                | mode_definition COMMA newmode_list'''
+                | newmode_list COMMA mode_definition'''
         if len(p) == 2:
             p[0] = Newmode_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Newmode_list(self.flat([p[1], p[3].mode_definitions]), lineno=p.lineno(1))
+            p[1].mode_definitions.append(p[3])
+            p[0] = p[1]
 
     def p_mode_definition(self, p):
         '''mode_definition : identifier_list ASSIGN mode'''
@@ -186,11 +198,12 @@ class LyaParser:
 
     def p_index_list(self, p):
         '''index_list : index_mode 
-                | index_mode COMMA index_list'''
+                | index_list COMMA index_mode'''
         if len(p) == 2:
             p[0] = Index_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Index_list(self.flat([p[1], p[3].index_modes]), lineno=p.lineno(1))
+            p[1].index_modes.append(p[3])
+            p[0] = p[1]
 
     def p_index_mode(self, p):
         '''index_mode : discrete_mode 
@@ -220,11 +233,12 @@ class LyaParser:
 
     def p_expression_list(self, p):
         '''expression_list : expression 
-                | expression COMMA expression_list'''
+                | expression_list COMMA expression'''
         if len(p) == 2:
             p[0] = Expression_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Expression_list(self.flat([p[1], p[3].expressions]), lineno=p.lineno(1))
+            p[1].expressions.append(p[3])
+            p[0] = p[1]
 
     def p_primitive_value(self, p):
         '''primitive_value : literal 
@@ -553,11 +567,12 @@ class LyaParser:
 
     def p_parameter_list(self, p):
         '''parameter_list : expression 
-                | expression COMMA parameter_list'''
+                | parameter_list COMMA expression'''
         if len(p) == 2:
             p[0] = Parameter_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Parameter_list(self.flat([p[1], p[3].expressions]), lineno=p.lineno(1))
+            p[1].expressions.append(p[3])
+            p[0] = p[1]
 
     def p_exit_action(self, p):
         '''exit_action : EXIT identifier'''
@@ -626,19 +641,21 @@ class LyaParser:
 
     def p_action_statement_list(self, p):
         '''action_statement_list : action_statement 
-                | action_statement action_statement_list'''
+                | action_statement_list action_statement'''
         if len(p) == 2:
             p[0] = Action_statement_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Action_statement_list(self.flat([p[1], p[2].action_statements]), lineno=p.lineno(1))
+            p[1].action_statements.append(p[2])
+            p[0] = p[1]
 
     def p_formal_parameter_list(self, p):
         '''formal_parameter_list : formal_parameter 
-                | formal_parameter COMMA formal_parameter_list'''
+                | formal_parameter_list COMMA formal_parameter'''
         if len(p) == 2:
             p[0] = Formal_parameter_list([p[1]], lineno=p.lineno(1))
         else:
-            p[0] = Formal_parameter_list(self.flat([p[1], p[3].formal_parameters]), lineno=p.lineno(1))
+            p[1].formal_parameters.append(p[3])
+            p[0] = p[1]
 
     def p_formal_parameter(self, p):
         '''formal_parameter : identifier_list parameter_spec'''
@@ -662,21 +679,16 @@ class LyaParser:
             p[0] = Result_spec(p[3], True, lineno=p.lineno(1))
 
     def p_error(self, p):
+        self.errors += 1
         print "Syntax error in input!", p
 
+    def reported(self):
+        """Number of the errors the lexer and the parser printed during the last parse."""
+        return self.errors + self.rules.errors
+
     def parseInput(self, s):
-        return self.parser.parse(s, tracking=True, debug=False)
-
-    def flat(self, l):
-        if type(l) != list:
-            return l
-        else:
-            acc = []
-            for i in l:
-                r = self.flat(i)
-                if type(r) == list:
-                    for x in r:
-                        acc.append(x)
-                else:
-                    acc.append(r)
-        return acc
+        # parse with our own lexer, PLY would use the last lexer built in the process
+        self.lexer.lineno = 1
+        self.errors = self.rules.errors = 0
+        return self.parser.parse(s, lexer=self.lexer, tracking=self.tracking, debug=False)
+
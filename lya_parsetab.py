@@ -0,0 +1,328 @@
+# lya_parsetab.py
+# Generated by lya_tables.py from the grammar of LyaParser. Do not edit.
+
+SIGNATURE = '21B023381FB849CEB762395F01DB7B8D'
+TERMINALS = ('$end', 'AND', 'ARRAY', 'ARROW', 'ASSIGN', 'BOOL', 'BY', 'CARET', 'CCONST', 'CHAR', 'CHARS', 'COLON', 'COMMA', 'DCL', 'DIVIDE', 'DO', 'DOWN', 'ELSE', 'ELSIF', 'END', 'EQUAL', 'EXIT', 'FALSE', 'FI', 'FOR', 'GREATER', 'GREATEREQUAL', 'ICONST', 'ID', 'IF', 'IN', 'INT', 'LBRACKET', 'LENGTH', 'LESS', 'LESSEQUAL', 'LOC', 'LOWER', 'LPAREN', 'MINUS', 'MODUS', 'NOT', 'NOTEQUAL', 'NULL', 'NUM', 'OD', 'OR', 'PLUS', 'PRED', 'PRINT', 'PROC', 'RBRACKET', 'READ', 'REF', 'RESULT', 'RETURN', 'RETURNS', 'RPAREN', 'SCONC', 'SCONST', 'SEMI', 'SQUOTE', 'SUCC', 'SYN', 'THEN', 'TIMES', 'TO', 'TRUE', 'TYPE', 'UPPER', 'WHILE', 'error')
+NONTERMINALS = ('action', 'action_statement', 'action_statement_list', 'arithmetic_additive_operator', 'arithmetic_multiplicative_operator', 'array_mode', 'array_primitive_value', 'assigning_operator', 'assignment_action', 'boolean_expression', 'boolean_literal', 'boolean_mode', 'bracketed_action', 'builtin_call', 'builtin_name', 'character_literal', 'character_mode', 'character_string_literal', 'closed_dyadic_operator', 'conditional_expression', 'constant_expression', 'control_part', 'declaration', 'declaration_list', 'declaration_statement', 'dereferenced_reference', 'discrete_mode', 'discrete_mode_name', 'discrete_range_mode', 'do_action', 'else_clause', 'else_expression', 'elsif_expression', 'empty_literal', 'end_value', 'exit_action', 'expression', 'expression_list', 'for_control', 'formal_parameter', 'formal_parameter_list', 'identifier', 'identifier_list', 'if_action', 'index_list', 'index_mode', 'initialization', 'integer_literal', 'integer_mode', 'iteration', 'literal', 'literal_range', 'location', 'membership_operator', 'mode', 'mode_definition', 'mode_name', 'monadic_operator', 'newmode_list', 'newmode_statement', 'operand0', 'operand1', 'operand2', 'operand3', 'operand4', 'operator1', 'operator2', 'parameter_list', 'parameter_spec', 'parenthesized_expression', 'primitive_value', 'procedure_call', 'procedure_definition', 'procedure_statement', 'program', 'range_enumeration', 'reference_mode', 'referenced_location', 'relational_operator', 'result_action', 'result_spec', 'return_action', 'slice', 'statement', 'statement_list', 'step_enumeration', 'step_value', 'string_concatenation_operator', 'string_element', 'string_length', 'string_mode', 'synonym_definition', 'synonym_list', 'synonym_statement', 'then_clause', 'then_expression', 'value_array_element', 'value_array_slice', 'while_control')
+PRODUCTIONS = (
+    ("S' -> program", "S'", 1, None),
+    ('program -> statement_list', 'program', 1, 'p_program'),
+    ('statement_list -> statement', 'statement_list', 1, 'p_statement_list'),
+    ('statement_list -> statement_list statement', 'statement_list', 2, 'p_statement_list'),
+    ('statement -> declaration_statement', 'statement', 1, 'p_statement'),
+    ('statement -> synonym_statement', 'statement', 1, 'p_statement'),
+    ('statement -> newmode_statement', 'statement', 1, 'p_statement'),
+    ('statement -> procedure_statement', 'statement', 1, 'p_statement'),
+    ('statement -> action_statement', 'statement', 1, 'p_statement'),
+    ('declaration_statement -> DCL declaration_list SEMI', 'declaration_statement', 3, 'p_declaration_statement'),
+    ('declaration_list -> declaration', 'declaration_list', 1, 'p_declaration_list'),
+    ('declaration_list -> declaration_list COMMA declaration', 'declaration_list', 3, 'p_declaration_list'),
+    ('declaration -> identifier_list mode', 'declaration', 2, 'p_declaration'),
+    ('declaration -> identifier_list mode initialization', 'declaration', 3, 'p_declaration'),
+    ('initialization -> ASSIGN expression', 'initialization', 2, 'p_initialization'),
+    ('identifier_list -> identifier', 'identifier_list', 1, 'p_identifier_list'),
+    ('identifier_list -> identifier_list COMMA identifier', 'identifier_list', 3, 'p_identifier_list'),
+    ('identifier -> ID', 'identifier', 1, 'p_identifier'),
+    ('synonym_statement -> SYN synonym_list SEMI', 'synonym_statement', 3, 'p_synonym_statement'),
+    ('synonym_list -> synonym_definition', 'synonym_list', 1, 'p_synonym_list'),
+    ('synonym_list -> synonym_list COMMA synonym_definition', 'synonym_list', 3, 'p_synonym_list'),
+    ('synonym_definition -> identifier_list ASSIGN constant_expression', 'synonym_definition', 3, 'p_synonym_definition'),
+    ('synonym_definition -> identifier_list mode ASSIGN constant_expression', 'synonym_definition', 4, 'p_synonym_definition'),
+    ('constant_expression -> expression', 'constant_expression', 1, 'p_constant_expression'),
+    ('newmode_statement -> TYPE newmode_list SEMI', 'newmode_statement', 3, 'p_newmode_statement'),
+    ('newmode_list -> mode_definition', 'newmode_list', 1, 'p_newmode_list'),
+    ('newmode_list -> newmode_list COMMA mode_definition', 'newmode_list', 3, 'p_newmode_list'),
+    ('mode_definition -> identifier_list ASSIGN mode', 'mode_definition', 3, 'p_mode_definition'),
+    ('mode -> mode_name', 'mode', 1, 'p_mode'),
+    ('mode -> discrete_mode', 'mode', 1, 'p_mode'),
+    ('mode -> reference_mode', 'mode', 1, 'p_mode'),
+    ('mode -> string_mode', 'mode', 1, 'p_mode'),
+    ('mode -> array_mode', 'mode', 1, 'p_mode'),
+    ('mode -> <empty>', 'mode', 0, 'p_mode'),
+    ('discrete_mode -> integer_mode', 'discrete_mode', 1, 'p_discrete_mode'),
+    ('discrete_mode -> boolean_mode', 'discrete_mode', 1, 'p_discrete_mode'),
+    ('discrete_mode -> character_mode', 'discrete_mode', 1, 'p_discrete_mode'),
+    ('discrete_mode -> discrete_range_mode', 'discrete_mode', 1, 'p_discrete_mode'),
+    ('integer_mode -> INT', 'integer_mode', 1, 'p_integer_mode'),
+    ('boolean_mode -> BOOL', 'boolean_mode', 1, 'p_boolean_mode'),
+    ('character_mode -> CHAR', 'character_mode', 1, 'p_character_mode'),
+    ('discrete_range_mode -> discrete_mode_name LPAREN literal_range RPAREN', 'discrete_range_mode', 4, 'p_discrete_range_mode'),
+    ('discrete_range_mode -> discrete_mode LPAREN literal_range RPAREN', 'discrete_range_mode', 4, 'p_discrete_range_mode'),
+    ('mode_name -> identifier', 'mode_name', 1, 'p_mode_name'),
+    ('discrete_mode_name -> identifier', 'discrete_mode_name', 1, 'p_discrete_mode_name'),
+    ('literal_range -> expression COLON expression', 'literal_range', 3, 'p_literal_range'),
+    ('reference_mode -> REF mode', 'reference_mode', 2, 'p_reference_mode'),
+    ('string_mode -> CHARS LBRACKET string_length RBRACKET', 'string_mode', 4, 'p_string_mode'),
+    ('string_length -> integer_literal', 'string_length', 1, 'p_string_length'),
+    ('array_mode -> ARRAY LBRACKET index_list RBRACKET mode', 'array_mode', 5, 'p_array_mode'),
+    ('index_list -> index_mode', 'index_list', 1, 'p_index_list'),
+    ('index_list -> index_list COMMA index_mode', 'index_list', 3, 'p_index_list'),
+    ('index_mode -> discrete_mode', 'index_mode', 1, 'p_index_mode'),
+    ('index_mode -> literal_range', 'index_mode', 1, 'p_index_mode'),
+    ('location -> identifier', 'location', 1, 'p_location'),
+    ('location -> dereferenced_reference', 'location', 1, 'p_location'),
+    ('location -> string_element', 'location', 1, 'p_location'),
+    ('location -> slice', 'location', 1, 'p_location'),
+    ('location -> procedure_call', 'location', 1, 'p_location'),
+    ('location -> builtin_call', 'location', 1, 'p_location'),
+    ('dereferenced_reference -> location ARROW', 'dereferenced_reference', 2, 'p_dereferenced_reference'),
+    ('string_element -> location LBRACKET expression_list RBRACKET', 'string_element', 4, 'p_string_element'),
+    ('slice -> location LBRACKET expression COLON expression RBRACKET', 'slice', 6, 'p_slice'),
+    ('expression_list -> expression', 'expression_list', 1, 'p_expression_list'),
+    ('expression_list -> expression_list COMMA expression', 'expression_list', 3, 'p_expression_list'),
+    ('primitive_value -> literal', 'primitive_value', 1, 'p_primitive_value'),
+    ('primitive_value -> value_array_element', 'primitive_value', 1, 'p_primitive_value'),
+    ('primitive_value -> value_array_slice', 'primitive_value', 1, 'p_primitive_value'),
+    ('primitive_value -> parenthesized_expression', 'primitive_value', 1, 'p_primitive_value'),
+    ('literal -> integer_literal', 'literal', 1, 'p_literal'),
+    ('literal -> boolean_literal', 'literal', 1, 'p_literal'),
+    ('literal -> character_literal', 'literal', 1, 'p_literal'),
+    ('literal -> empty_literal', 'literal', 1, 'p_literal'),
+    ('literal -> character_string_literal', 'literal', 1, 'p_literal'),
+    ('integer_literal -> ICONST', 'integer_literal', 1, 'p_integer_literal'),
+    ('boolean_literal -> FALSE', 'boolean_literal', 1, 'p_boolean_literal'),
+    ('boolean_literal -> TRUE', 'boolean_literal', 1, 'p_boolean_literal'),
+    ('character_literal -> CCONST', 'character_literal', 1, 'p_character_literal'),
+    ('character_literal -> SQUOTE CARET LPAREN ICONST RPAREN SQUOTE', 'character_literal', 6, 'p_character_literal'),
+    ('empty_literal -> NULL', 'empty_literal', 1, 'p_empty_literal'),
+    ('character_string_literal -> SCONST', 'character_string_literal', 1, 'p_character_string_literal'),
+    ('value_array_element -> array_primitive_value LBRACKET expression_list RBRACKET', 'value_array_element', 4, 'p_value_array_element'),
+    ('value_array_slice -> array_primitive_value LBRACKET expression COLON expression RBRACKET', 'value_array_slice', 6, 'p_value_array_slice'),
+    ('array_primitive_value -> primitive_value', 'array_primitive_value', 1, 'p_array_primitive_value'),
+    ('parenthesized_expression -> LPAREN expression RPAREN', 'parenthesized_expression', 3, 'p_parenthesized_expression'),
+    ('expression -> operand0', 'expression', 1, 'p_expression'),
+    ('expression -> conditional_expression', 'expression', 1, 'p_expression'),
+    ('conditional_expression -> IF boolean_expression then_expression else_expression FI', 'conditional_expression', 5, 'p_conditional_expression'),
+    ('conditional_expression -> IF boolean_expression then_expression elsif_expression else_expression FI', 'conditional_expression', 6, 'p_conditional_expression'),
+    ('boolean_expression -> expression', 'boolean_expression', 1, 'p_boolean_expression'),
+    ('then_expression -> THEN expression', 'then_expression', 2, 'p_then_expression'),
+    ('else_expression -> ELSE expression', 'else_expression', 2, 'p_else_expression'),
+    ('elsif_expression -> ELSIF boolean_expression then_expression', 'elsif_expression', 3, 'p_elsif_expression'),
+    ('elsif_expression -> elsif_expression ELSIF boolean_expression then_expression', 'elsif_expression', 4, 'p_elsif_expression'),
+    ('operand0 -> operand1', 'operand0', 1, 'p_operand0'),
+    ('operand0 -> operand0 operator1 operand1', 'operand0', 3, 'p_operand0'),
+    ('operator1 -> relational_operator', 'operator1', 1, 'p_operator1'),
+    ('operator1 -> membership_operator', 'operator1', 1, 'p_operator1'),
+    ('relational_operator -> AND', 'relational_operator', 1, 'p_relational_operator'),
+    ('relational_operator -> OR', 'relational_operator', 1, 'p_relational_operator'),
+    ('relational_operator -> EQUAL', 'relational_operator', 1, 'p_relational_operator'),
+    ('relational_operator -> NOTEQUAL', 'relational_operator', 1, 'p_relational_operator'),
+    ('relational_operator -> GREATER', 'relational_operator', 1, 'p_relational_operator'),
+    ('relational_operator -> GREATEREQUAL', 'relational_operator', 1, 'p_relational_operator'),
+    ('relational_operator -> LESS', 'relational_operator', 1, 'p_relational_operator'),
+    ('relational_operator -> LESSEQUAL', 'relational_operator', 1, 'p_relational_operator'),
+    ('membership_operator -> IN', 'membership_operator', 1, 'p_membership_operator'),
+    ('operand1 -> operand2', 'operand1', 1, 'p_operand1'),
+    ('operand1 -> operand1 operator2 operand2', 'operand1', 3, 'p_operand1'),
+    ('operator2 -> arithmetic_additive_operator', 'operator2', 1, 'p_operator2'),
+    ('operator2 -> string_concatenation_operator', 'operator2', 1, 'p_operator2'),
+    ('arithmetic_additive_operator -> PLUS', 'arithmetic_additive_operator', 1, 'p_arithmetic_additive_operator'),
+    ('arithmetic_additive_operator -> MINUS', 'arithmetic_additive_operator', 1, 'p_arithmetic_additive_operator'),
+    ('string_concatenation_operator -> SCONC', 'string_concatenation_operator', 1, 'p_string_concatenation_operator'),
+    ('operand2 -> operand3', 'operand2', 1, 'p_operand2'),
+    ('operand2 -> operand2 arithmetic_multiplicative_operator operand3', 'operand2', 3, 'p_operand2'),
+    ('arithmetic_multiplicative_operator -> TIMES', 'arithmetic_multiplicative_operator', 1, 'p_arithmetic_multiplicative_operator'),
+    ('arithmetic_multiplicative_operator -> DIVIDE', 'arithmetic_multiplicative_operator', 1, 'p_arithmetic_multiplicative_operator'),
+    ('arithmetic_multiplicative_operator -> MODUS', 'arithmetic_multiplicative_operator', 1, 'p_arithmetic_multiplicative_operator'),
+    ('operand3 -> operand4', 'operand3', 1, 'p_operand3'),
+    ('operand3 -> monadic_operator operand4', 'operand3', 2, 'p_operand3'),
+    ('monadic_operator -> MINUS', 'monadic_operator', 1, 'p_monadic_operator'),
+    ('monadic_operator -> NOT', 'monadic_operator', 1, 'p_monadic_operator'),
+    ('operand4 -> location', 'operand4', 1, 'p_operand4'),
+    ('operand4 -> referenced_location', 'operand4', 1, 'p_operand4'),
+    ('operand4 -> primitive_value', 'operand4', 1, 'p_operand4'),
+    ('referenced_location -> ARROW location', 'referenced_location', 2, 'p_referenced_location'),
+    ('action_statement -> identifier COLON action SEMI', 'action_statement', 4, 'p_action_statement'),
+    ('action_statement -> action SEMI', 'action_statement', 2, 'p_action_statement'),
+    ('action -> bracketed_action', 'action', 1, 'p_action'),
+    ('action -> assignment_action', 'action', 1, 'p_action'),
+    ('action -> procedure_call', 'action', 1, 'p_action'),
+    ('action -> builtin_call', 'action', 1, 'p_action'),
+    ('action -> exit_action', 'action', 1, 'p_action'),
+    ('action -> return_action', 'action', 1, 'p_action'),
+    ('action -> result_action', 'action', 1, 'p_action'),
+    ('bracketed_action -> if_action', 'bracketed_action', 1, 'p_bracketed_action'),
+    ('bracketed_action -> do_action', 'bracketed_action', 1, 'p_bracketed_action'),
+    ('assignment_action -> location assigning_operator expression', 'assignment_action', 3, 'p_assignment_action'),
+    ('assigning_operator -> ASSIGN', 'assigning_operator', 1, 'p_assigning_operator'),
+    ('assigning_operator -> closed_dyadic_operator ASSIGN', 'assigning_operator', 2, 'p_assigning_operator'),
+    ('closed_dyadic_operator -> arithmetic_additive_operator', 'closed_dyadic_operator', 1, 'p_closed_dyadic_operator'),
+    ('closed_dyadic_operator -> arithmetic_multiplicative_operator', 'closed_dyadic_operator', 1, 'p_closed_dyadic_operator'),
+    ('closed_dyadic_operator -> string_concatenation_operator', 'closed_dyadic_operator', 1, 'p_closed_dyadic_operator'),
+    ('if_action -> IF boolean_expression then_clause FI', 'if_action', 4, 'p_if_action'),
+    ('if_action -> IF boolean_expression then_clause else_clause FI', 'if_action', 5, 'p_if_action'),
+    ('then_clause -> THEN', 'then_clause', 1, 'p_then_clause'),
+    ('then_clause -> THEN action_statement_list', 'then_clause', 2, 'p_then_clause'),
+    ('else_clause -> ELSE', 'else_clause', 1, 'p_else_clause'),
+    ('else_clause -> ELSE action_statement_list', 'else_clause', 2, 'p_else_clause'),
+    ('else_clause -> ELSIF boolean_expression then_clause', 'else_clause', 3, 'p_else_clause'),
+    ('else_clause -> ELSIF boolean_expression then_clause else_clause', 'else_clause', 4, 'p_else_clause'),
+    ('do_action -> DO OD', 'do_action', 2, 'p_do_action'),
+    ('do_action -> DO action_statement_list OD', 'do_action', 3, 'p_do_action'),
+    ('do_action -> DO control_part SEMI OD', 'do_action', 4, 'p_do_action'),
+    ('do_action -> DO control_part SEMI action_statement_list OD', 'do_action', 5, 'p_do_action'),
+    ('control_part -> for_control', 'control_part', 1, 'p_control_part'),
+    ('control_part -> for_control while_control', 'control_part', 2, 'p_control_part'),
+    ('control_part -> while_control', 'control_part', 1, 'p_control_part'),
+    ('for_control -> FOR iteration', 'for_control', 2, 'p_for_control'),
+    ('iteration -> step_enumeration', 'iteration', 1, 'p_iteration'),
+    ('iteration -> range_enumeration', 'iteration', 1, 'p_iteration'),
+    ('step_enumeration -> identifier ASSIGN expression end_value', 'step_enumeration', 4, 'p_step_enumeration'),
+    ('step_enumeration -> identifier ASSIGN expression step_value end_value', 'step_enumeration', 5, 'p_step_enumeration'),
+    ('step_enumeration -> identifier ASSIGN expression DOWN end_value', 'step_enumeration', 5, 'p_step_enumeration'),
+    ('step_enumeration -> identifier ASSIGN expression step_value DOWN end_value', 'step_enumeration', 6, 'p_step_enumeration'),
+    ('step_value -> BY expression', 'step_value', 2, 'p_step_value'),
+    ('end_value -> TO expression', 'end_value', 2, 'p_end_value'),
+    ('range_enumeration -> identifier IN discrete_range_mode', 'range_enumeration', 3, 'p_range_enumeration'),
+    ('range_enumeration -> identifier DOWN IN discrete_range_mode', 'range_enumeration', 4, 'p_range_enumeration'),
+    ('while_control -> WHILE boolean_expression', 'while_control', 2, 'p_while_control'),
+    ('procedure_call -> identifier LPAREN RPAREN', 'procedure_call', 3, 'p_procedure_call'),
+    ('procedure_call -> identifier LPAREN parameter_list RPAREN', 'procedure_call', 4, 'p_procedure_call'),
+    ('parameter_list -> expression', 'parameter_list', 1, 'p_parameter_list'),
+    ('parameter_list -> parameter_list COMMA expression', 'parameter_list', 3, 'p_parameter_list'),
+    ('exit_action -> EXIT identifier', 'exit_action', 2, 'p_exit_action'),
+    ('return_action -> RETURN', 'return_action', 1, 'p_return_action'),
+    ('return_action -> RETURN expression', 'return_action', 2, 'p_return_action'),
+    ('result_action -> RESULT expression', 'result_action', 2, 'p_result_action'),
+    ('builtin_call -> builtin_name LPAREN RPAREN', 'builtin_call', 3, 'p_builtin_call'),
+    ('builtin_call -> builtin_name LPAREN parameter_list RPAREN', 'builtin_call', 4, 'p_builtin_call'),
+    ('builtin_name -> NUM', 'builtin_name', 1, 'p_builtin_name'),
+    ('builtin_name -> PRED', 'builtin_name', 1, 'p_builtin_name'),
+    ('builtin_name -> SUCC', 'builtin_name', 1, 'p_builtin_name'),
+    ('builtin_name -> UPPER', 'builtin_name', 1, 'p_builtin_name'),
+    ('builtin_name -> LOWER', 'builtin_name', 1, 'p_builtin_name'),
+    ('builtin_name -> LENGTH', 'builtin_name', 1, 'p_builtin_name'),
+    ('builtin_name -> READ', 'builtin_name', 1, 'p_builtin_name'),
+    ('builtin_name -> PRINT', 'builtin_name', 1, 'p_builtin_name'),
+    ('procedure_statement -> identifier COLON procedure_definition SEMI', 'procedure_statement', 4, 'p_procedure_statement'),
+    ('procedure_definition -> PROC LPAREN RPAREN SEMI END', 'procedure_definition', 5, 'p_procedure_definition'),
+    ('procedure_definition -> PROC LPAREN formal_parameter_list RPAREN SEMI END', 'procedure_definition', 6, 'p_procedure_definition'),
+    ('procedure_definition -> PROC LPAREN RPAREN result_spec SEMI END', 'procedure_definition', 6, 'p_procedure_definition'),
+    ('procedure_definition -> PROC LPAREN RPAREN SEMI statement_list END', 'procedure_definition', 6, 'p_procedure_definition'),
+    ('procedure_definition -> PROC LPAREN formal_parameter_list RPAREN result_spec SEMI END', 'procedure_definition', 7, 'p_procedure_definition'),
+    ('procedure_definition -> PROC LPAREN formal_parameter_list RPAREN SEMI statement_list END', 'procedure_definition', 7, 'p_procedure_definition'),
+    ('procedure_definition -> PROC LPAREN RPAREN result_spec SEMI statement_list END', 'procedure_definition', 7, 'p_procedure_definition'),
+    ('procedure_definition -> PROC LPAREN formal_parameter_list RPAREN result_spec SEMI statement_list END', 'procedure_definition', 8, 'p_procedure_definition'),
+    ('action_statement_list -> action_statement', 'action_statement_list', 1, 'p_action_statement_list'),
+    ('action_statement_list -> action_statement_list action_statement', 'action_statement_list', 2, 'p_action_statement_list'),
+    ('formal_parameter_list -> formal_parameter', 'formal_parameter_list', 1, 'p_formal_parameter_list'),
+    ('formal_parameter_list -> formal_parameter_list COMMA formal_parameter', 'formal_parameter_list', 3, 'p_formal_parameter_list'),
+    ('formal_parameter -> identifier_list parameter_spec', 'formal_parameter', 2, 'p_formal_parameter'),
+    ('parameter_spec -> mode', 'parameter_spec', 1, 'p_parameter_spec'),
+    ('parameter_spec -> mode LOC', 'parameter_spec', 2, 'p_parameter_spec'),
+    ('result_spec -> RETURNS LPAREN mode RPAREN', 'result_spec', 4, 'p_result_spec'),
+    ('result_spec -> RETURN LPAREN mode LOC RPAREN', 'result_spec', 5, 'p_result_spec'),
+)
+ACTION = (
+    'eNrdXWnQHFUV7Vj+kCqrUpZWaakBAXHBshARFVQMBhAiRpYAiggqEIwK7uACRDYXFgEFxd2E'
+    'RUVwA1ldQAzKvggIIgQBF3YiCm54/W7ud/vc9+7rbaa7p7/UrfvNueeed+bNdPfM9JvOhJZQ'
+    'QczOaMkTM9TrZbY7J1tzun7K9O26Qf9Z09XzsietQk+d+vvM7AmBZo1snbxeO1sroyWTi4Op'
+    'rDsvn9vckllukvfmZ3OyLdzzs3624RTeZio3yFLPD+LF2Xa0VbZGzr1kCk32+VlCo4zy+88O'
+    'Wd39Z2FWvf/Yaq1swVT9n8J5cke7Fitje/Y2ZgWJQ5GH7/UdH+vh3neZ6B7pYwsa1ny2Gdh8'
+    'msTHS+d+KV1KKbbaN9TEPmkHZg+iJvfSfRwwsG370cL5/IY45S84rRmhBy2qkLE+odJ7a5VS'
+    'NY05nb3W/Jo45S84rRmhBy2qkLE+odJ7a5VStRFbteD3LyrraNdiZWzPO4EVJA5FHr7XRmzZ'
+    'gmOWDfHVe69sn8S8dq8x1z0DzR7Z4qDeO+mwW8AuCqr/FT7H3NGuxcrYnncCK0gcijzi3nJa'
+    'npjX8hr7Q6iJfdIOzB5ITe6l+/hE0SxoiOeD/Z9/Tb16dn7+9YYW9oR/U1lHuxYrY3veCawg'
+    'cSjysPghQtiakVaCwcS9+BbOimL2oeDeoWoztm7F7zLilL/gtGaEHrSoQsb6hErvrVVK1Ua8'
+    'vgW//1JZR7sWK2N73gmsIHEo8vC9NmL+DD4f/Ejpq9/ldHnw2PbPhK32tZoDstgn7VCm+Wfh'
+    'fXJHuxYrY3veCawgcSjysPi8nLOIsSQwGOhjBtpY6b21ClUX5FqLGEsCg4E+ZqCNld5bq1D1'
+    'w1xrEWNJYDDQxwy0sdJ7axWqeH3hUgpXGmSdQhIYDFYmYgbaWOm9tQpVP8q1FjGWBAYDfcxA'
+    'Gyu9t1ah6uxcaxFjSWAw0McMtLHSe2vlVZ9OIB9W5UeEXMyGvlzFHlr9PGctYiwJDAb6mIE2'
+    'VnpvrULVZ3OtRYwlgcGEestAm1KmNaFqWa61SDEjxstyre3F6j2ykNfz02VmPsuIz0+tR+h3'
+    'YP7O9j0CUsyI8WGZKg7PDp4eccj07ZLsiODd8aDp6lMJZ8XwDzEt+VyutYixJDCYUG8ZaFPK'
+    'tCZUnZhrLWLM6wmMGJ+Ya6W2esssztI85mP9+HZR5lWjnA8qtueDyo1zPviTfFYWMZYEBgN9'
+    'zEAbK723VqHqwlxrEWNJYDDQxwy0sdJ7axWqfpFrLWIsCQwG+piBNlZ6b61C1RHE62OKJI4g'
+    'xpLAYFQl62OWgTZWem+tQtXhudYixpLAYEK9ZaBNKdOaUPXTXGsRY0lgMNDHDLSx0ntrFap4'
+    'vWw5hStnsu4mCQwGK20xA22s9N5ahaqzcq1FjCWBwUAfM9DGSu+tVUo1ahzZ+qrW+ZRCjCWB'
+    'wUAfM9DGSu+tVUo1+vdN9dcz44ivT5Dbc/NZWcRYEhgM9DEDbaz03lqlVBLHDODbjJ9RCjGW'
+    'BAYDfcxAGyu9t1YpFcfpBKSYkeVHe8x2nGD4h3j6k2UC+bAqPyLkYjb05Sr20OqcnLWIsSQw'
+    'GOhjBtpY6b21ClW8HnQ5hStDsq4kCQwGK0mW0fUo9K3Se2uVUvUdbyq878MohRhLAoOB/syI'
+    'gTZWem+tUqq614/V/77puMbXj03yVe/4gX2PvFdi2yyY4BzfObC183dRk/XwL01sPbw8NiXO'
+    'TQkYHcXxbdgPR8eaoqrP73NPyqq+z11JnCtJK6nLnznpQ7Wy8lmHfz19GF/t+Nj7WkP/Rzs+'
+    'Hsv8T5ua6wo6c3rG38lOn0KnZnU+z5/R4FEuDbQrSh/vsXQsKSpTeT1Y5hhLWtb7hhqt0T+K'
+    'jiJFxfNBD3qwzDGWtKz3DTVao38cHUeKiueDHvRgmWMsaVnvG2q0tooPDOz95EMDm88HBzOf'
+    'XxGn/AWnNSP0oEUVMtYnVHpvrbzqeDqeFJV8pkvowTLHWNKy3jfUaI3+0XQ0KSqeD3rQg2WO'
+    'saRlvW+o0dpcLUAeJa4pMCqOkFVO0rLeN9RobRVnDerz9ZF0JCkqU3k9WOYYS1rW+4YarRk9'
+    'Xnj/3NGuxcrYnncC+zjBocjD9/qOBQO9Nufsgey336bwtir+0vHz2dT/nI6fx3Mr/M+L+qcO'
+    '7Hz/ARqW//kdPz8XZOXnFxdm/Z5fDC22L9henyzcjtyR5ECtXcXxbdjHrR0Te/he++uHWE+4'
+    'KGu6ftjn+sbFWV/Xq9eLS2rc7xfIo3KVH8EcY0nLet9QozX6nyePfFiVH8EcY0nLet9Qo/V4'
+    '+0/q+pa2/r3DN8gjH1blRzDHWNKy3jfUaG1Ww8ijxJqZUfkRzDGWtKz3DTVao/9l8siHVfkR'
+    'zDGWtKz3DTVao38SeeTDqvwI5hhLWtb7hhqt0f8ieeTDqvwI5hhLWtb7hhqt0f8meeTDqvwI'
+    '5hhLWtb7hhqtzeoreZRYozUqP4I5xpKW9b6hRmv0v0Ie+bAqP4I5xpKW9b6hRmvz/Ql55MOq'
+    '/AjmGEta1vuGGq3R/zp55MOq/AjmGEta1vuGGq3R/xZ55MOq/AjmGEta1vuGGq0FfyZnLWIs'
+    'CQwm1FsG2pQyrQlVh+bX+x2ajzqUGEsCg1GVXO9nGWhjpffWKqWaVFzW4afCKwZ9RlMeO4+0'
+    'bTYhzk0IGB3F8W3YD0fHmuKq79hnpHsf5/zrqhl1/caeA1s/3IPqcX3FO6ge11e8ncq5awv2'
+    'pqtL9rJret8Du/73+Knj643EKX+1h5oRetCiChnrEyq9t1YpVRzXd7YtrhvJecfO9vVy58eo'
+    'rKNdi5WxPe8EVpA4FHn43m3RvG5r+PywvniM7Qiu8r+TyuuqqK8X5Z09vPbd0OIxcBeV13XG'
+    '35jVv6e7Gl7/s4Karc+vqJy/rs+Lskp/B5XXVVFfL8oq/R+pvK6K+npRVunvpvK6KurrRXl3'
+    'R8fXzR29r9xO5XWd8cVjbEdwlf/NVF5XPk9UNsZ2BFf530rldVWwvniM7Qi+taP955aO9p8/'
+    'UHldZ3zxGNsRXOX/eyqvq4L1xWNsR3CV/y1UXlduNyobYzuCq/xvjfaDv3f8eaDK/0Yqr6uC'
+    '9TdQXWVz/65j/6bHS6vH8W1jut2eXdzq89nU7cPkUbmKI2SVk7Ss9w01Wtc7X96P9iM9X96P'
+    'uj9frvz8lN2RK+/qfAXhr1TW0a7FytiedwIrSByKPEJ82qpHPd7n+abX2xT5P1h4v9zRrsXK'
+    '2J53AitIHIo8fO+eGby23kbcO7DHf1+j30NTttq333//1Szub2Ub7ESc8hec1ozQgxZVyFif'
+    'UOm9tUqp+ls/fKDC+QxKIcaSwGCgjxloY6X31ipUnZBrLWLMv//DiPEJuVZqq7fM4izNYz7W'
+    'j28XZaFqaa61SDEjxktzre3Favn9KPD6+1FLzXyWrvr9KOsR+h2Tay1iLAkMJtRbBtqUMq1J'
+    'qbr9vPrgmG4PTfjzalmszB4Z/HvtPyY0w3G+b3p0Rn2fu6iDd9HHOn1E+PxcR93883Pd2JY4'
+    '5S84rRmhBy2qkLE+odJ7a5VSuSOo4/WHKv/rqbyuivp6UZbpHybOh0krqctdpQ/Vw5XzgX+1'
+    'nq9/lv15bla8P/vr53l/HsLvvc/v/bXrEZqU/yXEKX/Bac0IPWhRhYz1CZXeW6uUqvj9a1/a'
+    'N1//2XfC6z/x++l7B7AeZePJs1bX9YT3Nzxe/tzx8dXU/08dz6ep//0dz6ep/30dz6ep/z0d'
+    'z6fI/5DC++WOJAdq7SqOb8M+bu2Y2AN4XuF8uKNdi5WxPe8Edh7BocjD95rG6P8f2eyK19SF'
+    'xCl/wWnNCD1oUYWM9QmV3lurUPWDXGsRY0lgMNDHDLSx0ntrlVKVXB1Epw3qu8WV2dMG+y76'
+    '9NXw/f0Zg3xMe/ewTza5ZuXNVI8bJ24c2DraDS0/vmcn9rQ5Pex9a9a4jx062992oGFt1bVG'
+    'eMafs9qe1/hYe6THeiW1ebxfOfY+s06rW2zdsd2ubvUoGN/tilbn08TN/vpx+B10+CvJ/rvx'
+    '+r+3PJnvu4vj2oG9Bj537P35bx0/oqb+F7U6n4sGtr3Wa+nVLF4/fM/A1g/bi/c13IL3drzF'
+    'm/o/v7NPHC8Y0GeZF8560fRs1m84q1d2tr2qnVPXHzb9va+m/55osrFBR/vMqQN7nd2w12Pj'
+    'uwSkmJHlx3VWDP8QTy426vy5brK+sQvV4/qK3akeF8fGA1lP6DNS8/kdlddVwfriMbYjOKW1'
+    '3E1R/6aG82F98Zib3D2ltJa7Lupf13A+9fWiLNb/kjjlLzitGaEHLaqQsT6h0ntrlVIVh/33'
+    'F+8e2PtXe5/HNuvhGJ/b6X3MznC+s/msbn7vYp28Xjtr/3xn3gxeddyi4dxf3tmRNJrzxg1H'
+    'bTmrLefvUwoxlgQGA33MQBsrvbdWKdWqMx0CUszI8qNtIztOMPxDXB2n0Cm9vir/mFKIsSQw'
+    'GOhjBtpY6b21Sqn6jrdRPS6OXXuY864DeJfejepxfcVbqB6n8dtW52rdRnO+qtX5NHe7hsrr'
+    'puOrlNe08ngXT2yPewUNzdl+Ptx6Rn4+bBLzZzVbz6yK0dczhxmvo3H2n2173X/a2F7VMe76'
+    's31+Fkz8+HpZZ68/4zqfTCevZqsIqXgr1eP6is3HOt63G8D7hZ3P9jPu/WvHGX5F1WsHc8wu'
+    'HOQzOXes42un1f7z2GsG9pq/2Vjba+fVeHvtMsjja6OB7T+vHth8XjWw+by0YD7/B3arodM='
+)
+ACTION_ROW = (
+    'eNodkGVYFkAQhN+l+6PjozttBVvs7u7uAltRUcAEE7u7u7u7uxULuxPsffwxezuze3N7C4IJ'
+    'pphhjgWWWGGNDbbYYY8DBhxxwhkXXHHDHQ888cKINz746umHv/YYCCBQYxDBhBCqehjhRBBJ'
+    'FNHEkIe85CM/BShIIQpThFjiKEoxilOCkpSitN4pQzxlKUd5KlCRSlRWrQpVqabO1alBTWpR'
+    'mzrUpR71aaDVhjSiMU1oqnkzmtOClrSiNW1oSzva04GOdKIzXehKN7rTg570ojcJJNKHvvSj'
+    'v2YDGMggBjOEJIYqH6Zuw0lmBCNJIZU0RjGaMYxlHONJJ4MJOtFEJjGZKUwlk2lMZ4ZqM5nF'
+    'bOYwl3nMZwELWcRilrCUZSxnhXasZJXG1frCGtayjvVsYCOb2MwWtrKN7ezQ2k52sZs97GWf'
+    'sv2KAwojBznEYY5w9D87pjiuOMFJTnGaM5zlHOdVucBFLnGZK5pfVVxTXOcGN9XvFre5w13u'
+    'cZ8HZPGQRzzmCU/J5hnPecFL3d0rXvOGt7zjPR/4yCd1+Kw7+cJXvvGdHOW5ih+KnzpTJr/4'
+    'zR/9218QERMxFTMxFwtJxlKsxFpsJBdbsRN7cRCDOIqTOIuLuIqbuIuHeIqXGMVbfMRX/MRf'
+    'AiRQgiRYQiRUwiRcIiRSoiRaYuQfI72L6A=='
+)
+GOTO = (
+    'eNrtXEloFEEU/d+YRBMTkmiiUQ85iKMYg8SYRBMNBjRKDHHBMCqCehL37eByES8qioIbKLig'
+    'gkjADby5gLgh3gQFL4K4HUU8uI/dPWPb093V09PVtZIHmamu6umuV/3f/7+qZpKAiZByADNH'
+    'BTASirNa0hgHdZnaYY7WUY7yBKNc5vlkdVbNWJ8rmyg16qtghN1aZJRKoAJqoDZTV263FRKu'
+    'oQdmZ9jVW+8dxrPoNEpzjL95Dt51rjGYZB0vsGu7He0zrHKb8dpu17ZapWnQBC3QDFPt+lnQ'
+    'Aw2Oz860yxWO2nLX3Ruhy6hJQB/0QhiLWgjZLLwWtch6XRrCokgodZ31z6LILEwsycu2lsOy'
+    'EOcnYYUgi10Na6w7r/S9/1ppdLSK0JOEhD7Ka1HrwGtRJB9Fo+71QtXtZbEBorDYKA2LeJCE'
+    'LcTrbrJaNisQr5KwnXkvt8I2xvfYIXikadS9UwJd7BI6fntC3323cEXtI/RgL7Fn+/Pu8wFt'
+    '8lyyLpzw18V/5NJFNg4yjhcdvhmIl4Ub3b7th0I96wbfs3LltH7P4rDisTvN4oiCLBJwNK+c'
+    'NmiWlAb/WZIeOMaA2SnXNU9EuMdxn8+cBFpPm1sXZ6h0cRriUvdFx9FZu9zvMwIX4DxcJY7M'
+    '9ayWK46ja0b5csgRPRdw3iVg9SxuSOZpo7G4BTdBp7keP9z26T97Xdxhpou7rhr6qHefKurd'
+    'A9qoJ87TPgAe6o4zM2+1Sw85+ygWLB5x97RsnkUq9ViyePEUngzEi4h4lmFg7sI8hzg9rYj5'
+    'hWzxgv0s6UWoK4jbS+KTgbzkkpnHg1eazYxfc+Nj+qg3yvsoGrzV+DsMQTti75jzZu+j3ivk'
+    'o3js632AaLOkjxCcDX7SYg3ks8L73V/hi8R+Kljd3w11fyP2/gdR3XxAY1E/tdDFLy1Y/Alk'
+    '8Rt0YJESwsJUd5pFP3hZADpjt5vFYLSyShyEJgtT3W1QgCqvHhRi/NcsQnY+qhh1UPcQLVgM'
+    'lYxFCaq4a98HpajTjDXIospQlcycHhVYjkmoxJRA0Ki7SgsfNRzVtahqobYTZFE1qMs3tHPP'
+    '9WpR1rleVIzmZFdjMKUhxivDqj7PnrJf4WxA8grnZIxrhTPto6bgwK9I+KIxRmU0SaUymgyk'
+    'GVW3qBZtnkWrFjntdAlZ0K+qGQyErKqxj3ptKOO+XruW2ZlhBWjuTlZqyi46OkKNiBq/jK6B'
+    'TnSrW5//3jA3RtvtEq4DVSxqfkiLYh8vujnEC/YsepixUMWiegMtShUWiwNZ/AWJgdO+'
+)
+GOTO_ROW = (
+    'eNptUodWAjEQHEQRbIiiiBWUJlZUBLuIFBXsBdT//w7nLWuM5N6+KZlssvfuDvBhgPATbg1a'
+    'fkg1gGF1QeEQRkRHTeeYx03jmCCHMek5J4Ipj3QaUfIMZk0SU50j4lbnvHN24d9qUXgJy7pe'
+    'MTuJvnNJYpVYM0nK2k2rZqwsq5pznmHd8nlsYJO6hW3yjtMb5hvquV0UyFHxe9gnHxBFHEpS'
+    'Qpl8hGPyCbtOcdZ307nwhfAlUcEVqrp3rVrz/Aq/VdfpPjSIprgb4tZ03KGFNu7pHohHPEn6'
+    'jBe8Ut+su96N+3DmdIiu/FGf+DJpAN+W/+Ne/QB3ihIZ'
+)
+DEFAULTED = (
+    'eNoFwTdqAgAYhuHvJygm6CAuQoYMggfQ0S4aKxZsa6LYcLCF2EBvIOIdsnsRIYM3yB0cXN48'
+    'j2nPkw44tcGlDM8q8KItbq3waI1X7/iUxa8dryrxpjwB5QiqSFlVGurS1IgPzfnUkq4WTFTh'
+    'S3WOanPSkLN6XPTNVQP+NOOuPg/dcNgvbpvisx+iNiZlafKWomwJKpakZjHqFqdpYVoWpW0R'
+    'OhbiH4/ySz0='
+)
@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Execution profile of an LVM program.
+#
+# The profiling loop of the Interpreter runs the linked code of the dispatch
+# engine and, after each instruction, adds one to its count, so the counts by
+# opcode are only summed up in the report. The 'cfu' and 'ret' instructions
+# also call event, which keeps the stack of the running procedures: for each
+# procedure, named by the label of its entry, the profile counts its calls,
+# the instructions run between its 'cfu' and its 'ret' and the wall time they
+# took, in total (as for cProfile, the recursive calls are counted once, by
+# the outermost one) and without the procedures it calls.
+
+from __future__ import print_function
+
+import sys
+from time import time
+
+
+class Profile(object):
+    def __init__(self, text, text_pc, code):
+        self.rows = [row for handler, row in code]
+        # pc in the program as loaded, with its labels, of each instruction
+        self.text_pc = text_pc
+        self.counts = [0] * len(code)
+        # pcs of the instructions that call event
+        self.calls = set(pc for pc, row in enumerate(self.rows) if row[0] in ('cfu', 'ret'))
+        self.executed = 0
+        self.seconds = 0.0
+        # [entry pc, start time, instructions executed before, instructions and
+        # seconds of the calls it made] of the running procedures
+        self.stack = []
+        # running calls of each entry pc
+        self.depth = [0] * len(code)
+        # [calls, instructions, seconds, own instructions, own seconds] by entry pc
+        self.procedures = {}
+        # label of the entry of each procedure
+        self.labels = {}
+        for pc, row in enumerate(self.rows):
+            if row[0] == 'cfu':
+                before = text[text_pc[row[1]] - 1]
+                self.labels[row[1]] = before[1] if before[0] == 'lbl' else None
+
+    def event(self, row, executed):
+        if row[0] == 'cfu':
+            self.stack.append([row[1], time(), executed, 0, 0.0])
+            self.depth[row[1]] += 1
+        elif self.stack:
+            entry, start, before, inner, inner_seconds = self.stack.pop()
+            self.depth[entry] -= 1
+            instructions = executed + 1 - before
+            seconds = time() - start
+            procedure = self.procedures.get(entry)
+            if procedure is None:
+                procedure = self.procedures[entry] = [0, 0, 0, 0, 0.0]
+            procedure[0] += 1
+            if not self.depth[entry]:
+                procedure[1] += instructions
+                procedure[2] += seconds
+            procedure[3] += instructions - inner
+            procedure[4] += seconds - inner_seconds
+            if self.stack:
+                self.stack[-1][3] += instructions
+                self.stack[-1][4] += seconds
+
+    def opcodes(self):
+        counts = {}
+        for row, count in zip(self.rows, self.counts):
+            counts[row[0]] = counts.get(row[0], 0) + count
+        return counts
+
+    def as_dict(self):
+        return {
+            'instructions': self.executed,
+            'seconds': self.seconds,
+            'opcodes': self.opcodes(),
+            'pcs': [{'pc': self.text_pc[pc], 'row': list(row), 'count': count}
+                    for pc, (row, count) in enumerate(zip(self.rows, self.counts))],
+            'procedures': [{'label': self.labels.get(entry), 'pc': self.text_pc[entry], 'calls': calls,
+                            'instructions': instructions, 'seconds': seconds,
+                            'own_instructions': own, 'own_seconds': own_seconds}
+                           for entry, (calls, instructions, seconds, own, own_seconds)
+                           in sorted(self.procedures.items())],
+        }
+
+    def report(self, out=None, top=20):
+        out = out or sys.stderr
+        total = max(self.executed, 1)
+        print("{} instructions in {:.3f}s".format(self.executed, self.seconds), file=out)
+        print("\n{:<8}{:>14}{:>8}".format("opcode", "count", "%"), file=out)
+        for name, count in sorted(self.opcodes().items(), key=lambda item: (-item[1], item[0])):
+            if count:
+                print("{:<8}{:>14}{:>7.1f}%".format(name, count, 100.0 * count / total), file=out)
+        print("\n{:<8}{:<24}{:>14}{:>8}".format("pc", "instruction", "count", "%"), file=out)
+        hot = sorted(range(len(self.rows)), key=lambda pc: (-self.counts[pc], pc))[:top]
+        for pc in hot:
+            if self.counts[pc]:
+                print("{:<8}{:<24}{:>14}{:>7.1f}%".format(self.text_pc[pc], str(self.rows[pc]), self.counts[pc],
+                                                          100.0 * self.counts[pc] / total), file=out)
+        if self.procedures:
+            line = "{:<16}{:>10}{:>14}{:>10}{:>14}{:>10}"
+            print("\n" + line.format("procedure", "calls", "instructions", "seconds", "own", "own s"), file=out)
+            rows = [("lbl {} (pc {})".format(self.labels.get(entry), self.text_pc[entry]),) + tuple(procedure)
+                    for entry, procedure in self.procedures.items()]
+            # what the procedures did not run
+            rows.append(("main", 1, self.executed, self.seconds,
+                         self.executed - sum(row[4] for row in rows), self.seconds - sum(row[5] for row in rows)))
+            line = "{:<16}{:>10}{:>14}{:>10.3f}{:>14}{:>10.3f}"
+            for row in sorted(rows, key=lambda row: -row[5]):
+                print(line.format(*row), file=out)
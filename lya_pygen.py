@@ -0,0 +1,793 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Python backend: lowers a checked lya AST into a Python ast.Module that is
+# compiled with compile() and runs without the LVM.
+#
+# The variables of a procedure are locals of a Python function, the ones of
+# the main program are locals of main() unless a procedure uses them, then
+# they are module globals. Arrays are lists indexed from 0, row after row as
+# in the LVM. Procedures are module level functions, the ones defined in a
+# procedure are defined at the start of its function. The code does what the
+# LVM code of lya_ast does:
+#
+#     do for i = 1 to n; ... od;        i = 1
+#                                       while True:
+#                                           ...
+#                                           i += 1
+#                                           if i > n: break
+#
+# (the body runs before the first test) and 'return' stores the result
+# without leaving the procedure.
+#
+# A chars[n] variable is a Python string. The arrays are given to the
+# procedures as the lists themselves, as the LVM gives their address, and
+# the array results are lists copied into their target. Loc parameters,
+# references and loc results are boxes, a one element list or an Element of
+# an array, read and written at [0]: the variables given to loc parameters,
+# referenced or used by the procedures defined in their procedure are kept in
+# a box from their declaration, generate() runs again when it finds one that
+# is not. Synonyms are folded as the LVM code folds them. Where the LVM code
+# is wrong the output differs: it reads a number into a string and does not
+# store the strings of the chars[n] variables.
+#
+# Not lowered, UnsupportedError: arrays of arrays and of strings, the LVM
+# code does not lay them out either.
+
+import ast
+
+from lya_ast import (INT_OPERATORS, Array_mode, Binary_Operator, Bool, Builtin_call, Char, Dereferenced_reference,
+                     Discrete_mode, Discrete_range_mode, Do_action, Expression, For_control, Identifier, Int,
+                     Literal_range, Location, Mode_name, Procedure_call, Reference_mode, Slice, Step_enumeration,
+                     StringArray_element, String, String_mode, Unary_Operator, While_control)
+from lya_errors import UnsupportedError
+from lya_io import BufferedOutput, open_input
+from interpreter import Interpreter
+
+
+FILENAME = '<lya python>'
+
+OPERATORS = {'+': ast.Add, '-': ast.Sub, '*': ast.Mult, '/': ast.FloorDiv, '%': ast.Mod,
+             # both operands are evaluated, as in the LVM
+             '&&': ast.BitAnd, '||': ast.BitOr}
+COMPARISONS = {'==': ast.Eq, '!=': ast.NotEq, '<': ast.Lt, '<=': ast.LtE, '>': ast.Gt, '>=': ast.GtE}
+
+
+def name(identifier, store=False):
+    return ast.Name(identifier, ast.Store() if store else ast.Load())
+
+
+def call(function, *args):
+    return ast.Call(name(function), list(args), [], None, None)
+
+
+def assign(target, value):
+    return ast.Assign([target], value)
+
+
+class Symbol(object):
+    def __init__(self, kind, pyname=None, level=0, indexes=None, size=0, result=None, mode=None, string=False,
+                 reference=False, parameters=None, value=None):
+        # 'scalar', 'array', 'proc', 'mode' or 'synonym'
+        self.kind = kind
+        self.pyname = pyname
+        self.level = level
+        # arrays: (lower, length) of each index, and the length of the strings
+        self.indexes = indexes
+        self.size = size
+        # scalars: a chars[size] string or a reference, kept in a box
+        self.string = string
+        self.reference = reference
+        self.boxed = False
+        # id of the Identifier of the declaration
+        self.key = None
+        # procedures: the symbol of the result, a reference for a loc result,
+        # and for each parameter (loc, kind)
+        self.result = result
+        self.parameters = parameters
+        # modes
+        self.mode = mode
+        # synonyms
+        self.value = value
+
+
+class Element(object):
+    """The box of an element of an array, given to a loc parameter."""
+    __slots__ = ('array', 'index')
+
+    def __init__(self, array, index):
+        self.array = array
+        self.index = index
+
+    def __getitem__(self, k):
+        return self.array[self.index]
+
+    def __setitem__(self, k, value):
+        self.array[self.index] = value
+
+
+class Function(object):
+    """A Python function being generated: main() or a procedure."""
+    def __init__(self, level, result=None):
+        self.level = level
+        # symbol of the result of the procedure
+        self.result = result
+        # main program variables it uses
+        self.shared = set()
+        # labels of the enclosing loops, None for the unlabeled ones
+        self.loops = []
+        # the procedures defined in the procedure
+        self.functions = []
+
+
+class PythonGenerator(object):
+    def __init__(self, boxed=frozenset()):
+        # keys of the variables to keep in a box
+        self.boxed = boxed
+        # keys of the variables given to loc parameters, referenced or used by a
+        # procedure defined in their procedure
+        self.referenced = set()
+        self.scopes = [{}]
+        self.function = Function(0)
+        # procedures, module level functions
+        self.functions = []
+        self.pynames = set()
+        # main program variables used by procedures
+        self.shared = set()
+
+    def generate(self, program):
+        body = self.statements(program.statement_list)
+        if self.shared:
+            body.insert(0, ast.Global(sorted(self.shared)))
+        main = ast.FunctionDef('main', ast.arguments([], None, None, []), body or [ast.Pass()], [])
+        return ast.fix_missing_locations(ast.Module(self.functions + [main]))
+
+    def unsupported(self, what, node):
+        raise UnsupportedError("Not supported by the Python backend.",
+                               "{0}. line={1}".format(what, getattr(node, 'lineno', None)))
+
+    # scopes
+
+    def declare(self, identifier, symbol):
+        symbol.level = len(self.scopes) - 1
+        self.scopes[-1][identifier] = symbol
+        return symbol
+
+    def unique(self, prefix, identifier):
+        pyname = prefix + identifier
+        n = 1
+        while pyname in self.pynames:
+            n += 1
+            pyname = "{0}{1}_{2}".format(prefix, identifier, n)
+        self.pynames.add(pyname)
+        return pyname
+
+    def find(self, identifier):
+        for scope in reversed(self.scopes):
+            if identifier in scope:
+                return scope[identifier]
+        return None
+
+    def lookup(self, identifier, node):
+        symbol = self.find(identifier)
+        if symbol is None:
+            self.unsupported("Unknown name " + identifier, node)
+        if symbol.kind in ('scalar', 'array') and symbol.level != self.function.level:
+            if symbol.level == 0:
+                self.function.shared.add(symbol.pyname)
+                self.shared.add(symbol.pyname)
+            elif symbol.kind == 'scalar' and not symbol.boxed:
+                # a variable of an enclosing procedure, a closure can not
+                # assign it: boxed when generate() runs again
+                self.referenced.add(symbol.key)
+        return symbol
+
+    def variable(self, mode):
+        """Returns the symbol, without its names, of a variable of mode."""
+        mode_type = mode.mode_type
+        if isinstance(mode_type, Mode_name):
+            symbol = self.lookup(mode_type.identifier.id, mode)
+            if symbol.kind != 'mode':
+                self.unsupported("Mode " + mode_type.identifier.id, mode)
+            return self.variable(symbol.mode)
+        if isinstance(mode_type, (Discrete_mode, Discrete_range_mode)):
+            return Symbol('scalar')
+        if isinstance(mode_type, String_mode):
+            return Symbol('scalar', size=self.constant(mode_type.string_length.length), string=True)
+        if isinstance(mode_type, Array_mode):
+            element = self.variable(mode_type.element_mode)
+            if element.kind != 'scalar' or element.string:
+                self.unsupported("Arrays of arrays and of strings", mode)
+            indexes = []
+            size = 1
+            for index_mode in mode_type.index_list.index_modes:
+                if not isinstance(index_mode, Literal_range):
+                    self.unsupported("Indexes of a whole mode", mode)
+                lower = self.constant(index_mode.expression1)
+                length = self.constant(index_mode.expression2) - lower + 1
+                indexes.append((lower, length))
+                size *= length
+            return Symbol('array', indexes=indexes, size=size)
+        if isinstance(mode_type, Reference_mode):
+            return Symbol('scalar', reference=True)
+        self.unsupported(type(mode_type).__name__, mode)
+
+    def default(self, symbol):
+        """The value of a variable that is not initialized."""
+        if symbol.kind == 'array':
+            return ast.BinOp(ast.List([ast.Num(0)], ast.Load()), ast.Mult(), ast.Num(symbol.size))
+        if symbol.reference:
+            return ast.Name('None', ast.Load())
+        return ast.Str("") if symbol.string else ast.Num(0)
+
+    def load(self, symbol):
+        if symbol.boxed:
+            return ast.Subscript(name(symbol.pyname), ast.Index(ast.Num(0)), ast.Load())
+        return name(symbol.pyname)
+
+    def store(self, symbol):
+        if symbol.boxed:
+            return ast.Subscript(name(symbol.pyname), ast.Index(ast.Num(0)), ast.Store())
+        return name(symbol.pyname, True)
+
+    def constant(self, expression):
+        value = self.fold(expression)
+        if type(value) is not int:
+            self.unsupported("Array bounds that are not constants", expression)
+        return value
+
+    def fold(self, expression):
+        """The value of a constant expression, folded as in the LVM code, None otherwise."""
+        while isinstance(expression, (Expression, Location)):
+            expression = expression.expr if isinstance(expression, Expression) else expression.location_type
+        if isinstance(expression, Identifier):
+            symbol = self.find(expression.id)
+            return symbol.value if symbol is not None and symbol.kind == 'synonym' else None
+        if isinstance(expression, (Int, Char, String)):
+            return expression.value
+        if isinstance(expression, Bool):
+            return expression.value in (True, 'true')
+        if isinstance(expression, Binary_Operator):
+            left = self.fold(expression.left_operand)
+            right = self.fold(expression.right_operand)
+            # only the operations of the ints are folded
+            if type(left) is not int or type(right) is not int or expression.operator not in INT_OPERATORS:
+                return None
+            if expression.operator in ('/', '%') and right == 0:
+                return None
+            return INT_OPERATORS[expression.operator](left, right)
+        if isinstance(expression, Unary_Operator):
+            value = self.fold(expression.operand)
+            if type(value) is not int:
+                return None
+            return -value if expression.operator == '-' else value
+        return None
+
+    def literal(self, value):
+        if type(value) is bool:
+            return ast.Name(str(value), ast.Load())
+        return ast.Num(value) if type(value) is int else ast.Str(value)
+
+    # statements
+
+    def statements(self, statement_list):
+        body = []
+        if statement_list is not None:
+            for statement in statement_list.statements:
+                body.extend(self.statement(statement))
+        return body
+
+    def actions(self, action_statement_list):
+        body = []
+        if action_statement_list is not None:
+            for statement in action_statement_list.action_statements:
+                body.extend(self.statement(statement))
+        return body or [ast.Pass()]
+
+    def statement(self, node):
+        nodes = getattr(self, 'stmt_' + type(node).__name__, self.stmt_unsupported)(node)
+        for n in nodes:
+            # Python tracebacks show the lya lines
+            if getattr(node, 'lineno', None) is not None:
+                n.lineno = node.lineno
+                n.col_offset = 0
+        return nodes
+
+    def stmt_unsupported(self, node):
+        self.unsupported(type(node).__name__, node)
+
+    def stmt_Declaration_statement(self, node):
+        body = []
+        for declaration in node.declaration_list.declarations:
+            for identifier in declaration.identifier_list.identifiers:
+                symbol = self.variable(declaration.mode)
+                if declaration.initialization is None:
+                    value = self.default(symbol)
+                elif symbol.kind == 'array':
+                    self.unsupported("Array initialization", declaration)
+                else:
+                    value = self.expression(declaration.initialization)
+                symbol.pyname = self.unique('v_', identifier.id) if self.function.level == 0 else 'v_' + identifier.id
+                symbol.key = id(identifier)
+                if symbol.key in self.boxed:
+                    symbol.boxed = True
+                    value = ast.List([value], ast.Load())
+                self.declare(identifier.id, symbol)
+                body.append(assign(name(symbol.pyname, True), value))
+        return body
+
+    def stmt_Synonym_list(self, node):
+        for definition in node.synonym_definitions:
+            value = self.fold(definition.constant_expression)
+            if value is None:
+                self.unsupported("Synonyms of values that are not constants", definition)
+            for identifier in definition.identifier_list.identifiers:
+                self.declare(identifier.id, Symbol('synonym', value=value))
+        return []
+
+    def stmt_Newmode_statement(self, node):
+        for definition in node.newmode_list.mode_definitions:
+            for identifier in definition.identifier_list.identifiers:
+                self.declare(identifier.id, Symbol('mode', mode=definition.mode))
+        return []
+
+    def stmt_Procedure_statement(self, node):
+        definition = node.procedure_definition
+        # (identifier, symbol) of the parameters
+        parameters = []
+        if definition.formal_parameter_list is not None:
+            for parameter in definition.formal_parameter_list.formal_parameters:
+                spec = parameter.parameter_spec
+                for identifier in parameter.identifier_list.identifiers:
+                    symbol = self.variable(spec.mode)
+                    symbol.pyname = 'v_' + identifier.id
+                    symbol.key = id(identifier)
+                    # the arrays are given as the lists, loc or not
+                    symbol.boxed = bool(spec.isReference) and symbol.kind == 'scalar'
+                    parameters.append((identifier, symbol))
+        result = None
+        if definition.result_spec is not None:
+            result = self.variable(definition.result_spec.mode)
+            if definition.result_spec.isReference:
+                if result.kind != 'scalar':
+                    self.unsupported("loc results of arrays", definition.result_spec)
+                # the box of the location
+                result.reference = True
+
+        pyname = self.unique('p_', node.identifier.id)
+        self.declare(node.identifier.id, Symbol('proc', pyname, result=result,
+                                                parameters=[(symbol.boxed, symbol.kind) for i, symbol in parameters]))
+        outer = self.function
+        self.function = Function(len(self.scopes), result)
+        self.scopes.append({})
+        body = []
+        for identifier, symbol in parameters:
+            self.declare(identifier.id, symbol)
+            if not symbol.boxed and symbol.key in self.boxed:
+                # given to a loc parameter in the procedure
+                symbol.boxed = True
+                body.append(assign(name(symbol.pyname, True), ast.List([name(symbol.pyname)], ast.Load())))
+        if result is not None:
+            body.append(assign(name('_result', True), self.default(result)))
+        body += self.statements(definition.statement_list)
+        if result is not None:
+            body.append(ast.Return(name('_result')))
+        body = self.function.functions + body
+        if self.function.shared:
+            body.insert(0, ast.Global(sorted(self.function.shared)))
+        self.scopes.pop()
+        self.function = outer
+
+        arguments = ast.arguments([ast.Name(symbol.pyname, ast.Param()) for i, symbol in parameters], None, None, [])
+        function = ast.FunctionDef(pyname, arguments, body or [ast.Pass()], [])
+        function.lineno = node.lineno
+        if outer.level == 0:
+            self.functions.append(function)
+        else:
+            # a closure, it uses the variables of the procedure
+            outer.functions.append(function)
+        return []
+
+    def stmt_Action_statement(self, node):
+        label = node.identifier.id if node.identifier is not None else None
+        if isinstance(node.action, Do_action):
+            self.function.loops.append(label)
+            try:
+                return self.statement(node.action)
+            finally:
+                self.function.loops.pop()
+        return self.statement(node.action)
+
+    def stmt_Assignment_action(self, node):
+        operator = node.assigning_operator.closed_dyadic_operator
+        if operator is not None and operator not in OPERATORS:
+            self.unsupported("Operator " + operator, node)
+        location = node.loc.location_type
+        if isinstance(location, Identifier):
+            symbol = self.lookup(location.id, node)
+            if symbol.kind == 'array':
+                # b = a copies the array
+                source = self.list_value(node.expression)
+                if operator is not None or source is None:
+                    self.unsupported("Array assignment of something else than an array", node)
+                target = ast.Subscript(name(symbol.pyname), ast.Slice(None, None, None), ast.Store())
+                return [assign(target, source)]
+            if symbol.kind != 'scalar':
+                self.unsupported("Assignment to " + location.id, node)
+            target = self.store(symbol)
+        elif isinstance(location, StringArray_element):
+            target = self.element(location, True)
+        elif isinstance(location, Slice):
+            source = self.list_value(node.expression)
+            if operator is not None or source is None:
+                self.unsupported("Slice assignment of something else than an array", node)
+            return [assign(self.slice(location, True), source)]
+        elif isinstance(location, Dereferenced_reference):
+            target = ast.Subscript(self.expression(location.loc), ast.Index(ast.Num(0)), ast.Store())
+        elif isinstance(location, Procedure_call):
+            result = self.lookup(location.identifier.id, node).result
+            if result is None or not result.reference:
+                self.unsupported("Assignment to a call that does not return a location", node)
+            target = ast.Subscript(self.procedure_call(location), ast.Index(ast.Num(0)), ast.Store())
+        else:
+            self.unsupported("Assignment to " + type(location).__name__, node)
+        value = self.expression(node.expression)
+        if operator is None:
+            return [assign(target, value)]
+        return [ast.AugAssign(target, OPERATORS[operator](), value)]
+
+    def stmt_If_action(self, node):
+        then = self.actions(node.then_clause.action_statement_list)
+        return [ast.If(self.expression(node.boolean_expression), then, self.else_clause(node.else_clause))]
+
+    def else_clause(self, node):
+        if node is None:
+            return []
+        if node.boolean_expression is None:
+            return self.actions(node.action_statement_list)
+        then = self.actions(node.then_clause.action_statement_list)
+        return [ast.If(self.expression(node.boolean_expression), then, self.else_clause(node.else_clause))]
+
+    def stmt_Do_action(self, node):
+        # labeled loops are pushed on Function.loops by their Action_statement
+        body = self.actions(node.action_statement_list)
+        test = ast.Name('True', ast.Load())
+        init = []
+        for control in node.control_part or []:
+            if isinstance(control, While_control):
+                test = self.expression(control.boolean_expression)
+            elif isinstance(control, For_control):
+                init, step = self.iteration(control.iteration)
+                body = [s for s in body if not isinstance(s, ast.Pass)] + step
+        return init + [ast.While(test, body, [])]
+
+    def iteration(self, node):
+        """Returns the statements before the loop and the ones that end each turn."""
+        counter = self.lookup(node.identifier.id, node)
+        if counter.kind != 'scalar':
+            self.unsupported("Loop counter " + node.identifier.id, node)
+        if isinstance(node, Step_enumeration):
+            start = self.expression(node.expression)
+            step = self.expression(node.step_value) if node.step_value is not None else ast.Num(1)
+            end = self.expression(node.end_value)
+            down = node.isDown
+        else:
+            # as the LVM code, 'down' is ignored for ranges
+            mode = node.discrete_mode_name
+            if not isinstance(mode, Discrete_range_mode):
+                self.unsupported("Ranges of a whole mode", node)
+            start = self.expression(mode.literal_range.expression1)
+            step = ast.Num(1)
+            end = self.expression(mode.literal_range.expression2)
+            down = False
+        increment = ast.AugAssign(self.store(counter), ast.Sub() if down else ast.Add(), step)
+        test = ast.Compare(self.load(counter), [ast.Lt() if down else ast.Gt()], [end])
+        return [assign(self.store(counter), start)], [increment, ast.If(test, [ast.Break()], [])]
+
+    def stmt_Exit_action(self, node):
+        # exit leaves the innermost loop only
+        if not self.function.loops or self.function.loops[-1] != node.identifier.id:
+            self.unsupported("exit of another action than the innermost loop", node)
+        return [ast.Break()]
+
+    def stmt_Return_action(self, node):
+        if self.function.level == 0:
+            self.unsupported("return outside of a procedure", node)
+        result = self.function.result
+        if node.expression is None:
+            return []
+        if result is None:
+            self.unsupported("return of a value from a procedure without result", node)
+        if result.reference:
+            return [assign(name('_result', True), self.reference(node.expression))]
+        if result.kind == 'array':
+            # copied, as the LVM copies the values
+            source = self.list_value(node.expression)
+            if source is None:
+                self.unsupported("Array result of something else than an array", node)
+            return [assign(ast.Subscript(name('_result'), ast.Slice(None, None, None), ast.Store()), source)]
+        return [assign(name('_result', True), self.expression(node.expression))]
+
+    def stmt_Result_action(self, node):
+        return self.stmt_Return_action(node)
+
+    def stmt_Procedure_call(self, node):
+        return [ast.Expr(self.procedure_call(node))]
+
+    def stmt_Builtin_call(self, node):
+        expressions = node.parameter_list.expressions if node.parameter_list is not None else []
+        body = []
+        if node.builtin_name == 'print':
+            for expression in expressions:
+                literal = expression.expr if isinstance(expression, Expression) else expression
+                if isinstance(literal, String):
+                    body.append(ast.Expr(call('_write', ast.Str(literal.value))))
+                else:
+                    body.append(ast.Expr(call('_print', self.expression(expression))))
+        elif node.builtin_name == 'read':
+            for expression in expressions:
+                location = expression.expr if isinstance(expression, Expression) else expression
+                location = location.location_type if isinstance(location, Location) else location
+                function = '_read'
+                if isinstance(location, StringArray_element):
+                    target = self.element(location, True)
+                elif isinstance(location, Identifier) and self.lookup(location.id, node).kind == 'scalar':
+                    symbol = self.lookup(location.id, node)
+                    target = self.store(symbol)
+                    if symbol.string:
+                        # a line, the LVM reads a number
+                        function = '_read_line'
+                else:
+                    self.unsupported("read of " + type(location).__name__, node)
+                body.append(assign(target, call(function)))
+        return body
+
+    # expressions
+
+    def expression(self, node):
+        return getattr(self, 'expr_' + type(node).__name__, self.expr_unsupported)(node)
+
+    def expr_unsupported(self, node):
+        self.unsupported(type(node).__name__, node)
+
+    def expr_Expression(self, node):
+        return self.expression(node.expr)
+
+    def expr_Int(self, node):
+        return ast.Num(node.value)
+
+    def expr_Bool(self, node):
+        return ast.Name('True' if node.value in (True, 'true') else 'False', ast.Load())
+
+    def expr_Char(self, node):
+        # '^(n)' is the integer n, as in the LVM code
+        return ast.Num(node.value) if isinstance(node.value, int) else ast.Str(node.value)
+
+    def expr_String(self, node):
+        return ast.Str(node.value)
+
+    def expr_Empty_literal(self, node):
+        return ast.Name('None', ast.Load())
+
+    def expr_Binary_Operator(self, node):
+        left = self.expression(node.left_operand)
+        right = self.expression(node.right_operand)
+        if node.operator in COMPARISONS:
+            return ast.Compare(left, [COMPARISONS[node.operator]()], [right])
+        if node.operator in OPERATORS:
+            return ast.BinOp(left, OPERATORS[node.operator](), right)
+        self.unsupported("Operator " + node.operator, node)
+
+    def expr_Unary_Operator(self, node):
+        return ast.UnaryOp(ast.USub() if node.operator == '-' else ast.Not(), self.expression(node.operand))
+
+    def expr_Conditional_expression(self, node):
+        # the elsifs are linked from the last one
+        elsifs = []
+        elsif = node.elsif_expression
+        while elsif is not None:
+            elsifs.insert(0, elsif)
+            elsif = elsif.elsif_expr
+        value = self.expression(node.else_expression)
+        for elsif in reversed(elsifs):
+            value = ast.IfExp(self.expression(elsif.boolean_expression), self.expression(elsif.then_expression), value)
+        return ast.IfExp(self.expression(node.boolean_expression), self.expression(node.then_expression), value)
+
+    def expr_Referenced_location(self, node):
+        return self.reference(node.loc)
+
+    def expr_Location(self, node):
+        location = node.location_type
+        if isinstance(location, Identifier):
+            symbol = self.lookup(location.id, node)
+            if symbol.kind == 'synonym':
+                return self.literal(symbol.value)
+            if symbol.kind != 'scalar':
+                self.unsupported("Values of " + location.id, node)
+            return self.load(symbol)
+        if isinstance(location, StringArray_element):
+            return self.element(location)
+        if isinstance(location, Slice):
+            return self.slice(location)
+        if isinstance(location, Dereferenced_reference):
+            return ast.Subscript(self.expression(location.loc), ast.Index(ast.Num(0)), ast.Load())
+        if isinstance(location, Procedure_call):
+            result = self.lookup(location.identifier.id, node).result
+            if result is not None and result.reference:
+                return ast.Subscript(self.procedure_call(location), ast.Index(ast.Num(0)), ast.Load())
+            return self.procedure_call(location)
+        if isinstance(location, Builtin_call):
+            return self.builtin_value(location)
+        self.unsupported(type(location).__name__, node)
+
+    def array_value(self, expression):
+        """Returns the symbol of an expression that is an array, None otherwise."""
+        while isinstance(expression, Expression):
+            expression = expression.expr
+        if isinstance(expression, Location) and isinstance(expression.location_type, Identifier):
+            symbol = self.lookup(expression.location_type.id, expression)
+            if symbol.kind == 'array':
+                return symbol
+        return None
+
+    def list_value(self, expression):
+        """Returns the list of an expression that is an array, a slice or an
+        array result, None otherwise."""
+        array = self.array_value(expression)
+        if array is not None:
+            return name(array.pyname)
+        location = expression
+        while isinstance(location, Expression):
+            location = location.expr
+        location = location.location_type if isinstance(location, Location) else None
+        if isinstance(location, Slice):
+            return self.slice(location)
+        if isinstance(location, Procedure_call):
+            result = self.lookup(location.identifier.id, expression).result
+            if result is not None and result.kind == 'array':
+                return self.procedure_call(location)
+        return None
+
+    def string_value(self, expression):
+        """Returns the symbol of an expression that is a string variable, None otherwise."""
+        while isinstance(expression, Expression):
+            expression = expression.expr
+        if isinstance(expression, Location) and isinstance(expression.location_type, Identifier):
+            symbol = self.lookup(expression.location_type.id, expression)
+            if symbol.kind == 'scalar' and symbol.string:
+                return symbol
+        return None
+
+    def index(self, node):
+        """Returns the array and the index in its list of an element."""
+        array = self.array_value(node.loc)
+        if array is None:
+            self.unsupported("Indexing something else than an array", node)
+        expressions = node.expression_list.expressions
+        if len(expressions) != len(array.indexes):
+            self.unsupported("Indexing with another number of indexes than the array", node)
+        index = None
+        for expression, (lower, length) in zip(expressions, array.indexes):
+            offset = self.offset(expression, lower)
+            if index is not None:
+                offset = ast.BinOp(ast.BinOp(index, ast.Mult(), ast.Num(length)), ast.Add(), offset)
+            index = offset
+        return array, index
+
+    def offset(self, expression, lower):
+        """The index in a list of the lya index expression of lower bound lower."""
+        value = self.fold(expression)
+        if type(value) is int:
+            return ast.Num(value - lower)
+        value = self.expression(expression)
+        if lower != 0:
+            value = ast.BinOp(value, ast.Sub(), ast.Num(lower))
+        return value
+
+    def element(self, node, store=False):
+        array, index = self.index(node)
+        return ast.Subscript(name(array.pyname), ast.Index(index), ast.Store() if store else ast.Load())
+
+    def slice(self, node, store=False):
+        # the elements from the first index, counted as in one index arrays
+        array = self.array_value(node.loc)
+        if array is None:
+            self.unsupported("Slices of something else than an array", node)
+        lower = array.indexes[0][0]
+        # the second bound is included
+        interval = ast.Slice(self.offset(node.expression1, lower), self.offset(node.expression2, lower - 1), None)
+        return ast.Subscript(name(array.pyname), interval, ast.Store() if store else ast.Load())
+
+    def reference(self, expression):
+        """Returns the box given to a loc parameter."""
+        location = expression
+        while isinstance(location, Expression):
+            location = location.expr
+        location = location.location_type if isinstance(location, Location) else location
+        if isinstance(location, Identifier):
+            symbol = self.lookup(location.id, expression)
+            if symbol.kind == 'scalar':
+                if not symbol.boxed:
+                    # boxed when generate() runs again
+                    self.referenced.add(symbol.key)
+                return name(symbol.pyname)
+        elif isinstance(location, StringArray_element):
+            array, index = self.index(location)
+            return call('_Element', name(array.pyname), index)
+        elif isinstance(location, Dereferenced_reference):
+            # the box the reference holds
+            return self.expression(location.loc)
+        elif isinstance(location, Procedure_call):
+            result = self.lookup(location.identifier.id, expression).result
+            if result is not None and result.reference:
+                return self.procedure_call(location)
+        # a value that is not a variable, in a box of its own
+        return ast.List([self.expression(expression)], ast.Load())
+
+    def procedure_call(self, node):
+        symbol = self.lookup(node.identifier.id, node)
+        if symbol.kind != 'proc':
+            self.unsupported("Call of " + node.identifier.id, node)
+        expressions = node.parameter_list.expressions if node.parameter_list is not None else []
+        if len(expressions) != len(symbol.parameters):
+            self.unsupported("Call of " + node.identifier.id + " with another number of arguments", node)
+        arguments = []
+        for expression, (loc, kind) in zip(expressions, symbol.parameters):
+            if kind == 'array':
+                array = self.array_value(expression)
+                if array is None:
+                    self.unsupported("Array arguments that are not arrays", node)
+                arguments.append(name(array.pyname))
+            elif loc:
+                arguments.append(self.reference(expression))
+            else:
+                arguments.append(self.expression(expression))
+        return call(symbol.pyname, *arguments)
+
+    def builtin_value(self, node):
+        expressions = node.parameter_list.expressions if node.parameter_list is not None else []
+        string = self.string_value(expressions[0]) if len(expressions) == 1 else None
+        if node.builtin_name == 'length' and string is not None:
+            return ast.Num(string.size)
+        value = self.fold(expressions[0]) if len(expressions) == 1 else None
+        if node.builtin_name == 'length' and type(value) is str:
+            # a string synonym
+            return ast.Num(len(value))
+        array = self.array_value(expressions[0]) if len(expressions) == 1 else None
+        if node.builtin_name not in ('lower', 'upper', 'length') or array is None:
+            self.unsupported("Builtin " + node.builtin_name, node)
+        # the bounds of the first index, as the LVM code
+        lower, length = array.indexes[0]
+        return ast.Num({'lower': lower, 'upper': lower + length - 1, 'length': array.size}[node.builtin_name])
+
+
+def generate(program):
+    """Returns the Python ast.Module of a checked lya Program node."""
+    boxed = frozenset()
+    while True:
+        generator = PythonGenerator(boxed)
+        module = generator.generate(program)
+        if generator.referenced <= boxed:
+            return module
+        boxed = boxed | generator.referenced
+
+
+class PythonProgram(object):
+    """A lya program compiled into Python code."""
+    def __init__(self, module):
+        self.code = compile(module, FILENAME, 'exec')
+
+    def run(self, stdin=None, stdout=None, **options):
+        # the options of the LVM (engine, memory) do not apply
+        output = BufferedOutput(stdout, options.get('output_buffer', Interpreter.OUTPUT_BUFFER))
+        source = open_input(stdin, output)
+
+        def print_value(value):
+            output.write(str(value) + "\n")
+        namespace = {'_read': source.value, '_read_line': source.line, '_write': output.write,
+                     '_print': print_value, '_Element': Element}
+        exec self.code in namespace
+        try:
+            namespace['main']()
+        finally:
+            output.flush()
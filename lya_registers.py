@@ -0,0 +1,328 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Translation of linked LVM code into three-address register code.
+#
+# The stack code moves every operand through M[sp]: ('ldv', 0, 1),
+# ('ldv', 0, 2), ('add',), ('stv', 0, 0) writes four cells and moves sp four
+# times. Inside a basic block (see lya_blocks.block_starts) the translator
+# keeps the values pushed by 'ldc', 'ldv' and 'ldr' as operands of the
+# instructions that consume them, and the result of an operation stored by
+# 'stv' goes straight to the variable, so that sequence becomes
+#
+#     ('add', v(0, 0), v(0, 1), v(0, 2))
+#
+# The virtual registers are the memory cells an operation would use:
+#     c(x)      the constant x
+#     v(i, j)   the variable M[D[i] + j]
+#     r(i, j)   the address D[i] + j
+#     t(k)      the stack cell M[sp + k], sp being the one at the start of the
+#               block, where the stack code would have left the value
+# and sp is only updated at the end of the blocks, by the jumps and before the
+# instructions that run through the handlers of the dispatch engine.
+#
+# Every instruction reads its operands before it changes anything, so one that
+# fails with an IndexError runs again once the memory has grown.
+
+import lya_blocks
+from lya_optimizer import COMPARE_JUMP
+
+
+OPERATORS = lya_blocks.OPERATORS
+COMPARISONS = lya_blocks.COMPARISONS
+
+# number of row fields of each kind of operand
+FIELDS = {'c': 1, 'v': 2, 'r': 2, 't': 1}
+
+
+class RegisterTranslator(object):
+    def __init__(self):
+        # (name, fields...) with the operands as tuples and the jump targets
+        # as pcs of the linked code
+        self.rows = []
+        # pc of the linked code each row comes from
+        self.origin = []
+
+    def translate(self, code):
+        starts = lya_blocks.block_starts(code)
+        first_row = {}
+        for n, first in enumerate(starts):
+            last = starts[n + 1] if n + 1 < len(starts) else len(code)
+            first_row[first] = len(self.rows)
+            self.block(code, first, last)
+        # a jump past the end stays past the end
+        first_row[len(code)] = len(self.rows)
+        # jump targets are pcs of the register code
+        for n, row in enumerate(self.rows):
+            if row[0] in ('jmp', 'jf', 'cfu') or row[0] in COMPARISONS:
+                self.rows[n] = (row[0], first_row[row[1]]) + row[2:]
+        return self.rows
+
+    def emit(self, row, pc):
+        self.rows.append(row)
+        self.origin.append(pc)
+
+    def block(self, code, first, last):
+        # the stack is sp + k, stack holds the operands of its top cells,
+        # the cells below them are in memory
+        self.k = 0
+        self.stack = []
+        # row that computed the t operand on top of the stack
+        self.result = None
+        for pc in range(first, last):
+            if not self.instruction(pc, code[pc][1]):
+                return
+        self.materialize(last - 1)
+        if self.k != 0:
+            self.emit(('sp', self.k), last - 1)
+
+    def push(self, operand):
+        self.k += 1
+        self.stack.append(operand)
+
+    def pop(self):
+        self.k -= 1
+        if self.stack:
+            return self.stack.pop()
+        return ('t', self.k + 1)
+
+    def materialize(self, pc, kinds='cvr'):
+        # writes the operands of the given kinds to their stack cells
+        base = self.k - len(self.stack)
+        for n, operand in enumerate(self.stack):
+            if operand[0] in kinds:
+                cell = ('t', base + n + 1)
+                self.emit(('mov', cell, operand), pc)
+                self.stack[n] = cell
+
+    def sync(self, pc):
+        # the stack code instructions see the real sp
+        self.materialize(pc)
+        if self.k != 0:
+            self.emit(('sp', self.k), pc)
+        self.k = 0
+        self.stack = []
+
+    def operation(self, pc, name, *operands):
+        cell = ('t', self.k + 1)
+        self.emit((name, cell) + operands, pc)
+        self.push(cell)
+        self.result = len(self.rows) - 1
+
+    def computed(self, operand):
+        # the last row computed this operand, nothing used it since
+        return operand[0] == 't' and self.result == len(self.rows) - 1 and self.rows[-1][1] == operand
+
+    def instruction(self, pc, row):
+        """Translates one instruction, returns False after the end of the block."""
+        op = row[0]
+        if op == 'ldc':
+            self.push(('c', row[1]))
+        elif op == 'ldv':
+            self.push(('v', row[1], row[2]))
+        elif op == 'ldr':
+            self.push(('r', row[1], row[2]))
+        elif op in OPERATORS:
+            b = self.pop()
+            a = self.pop()
+            self.operation(pc, op, a, b)
+        elif op in ('neg', 'not', 'grc'):
+            self.operation(pc, op, self.pop())
+        elif op == 'idx':
+            b = self.pop()
+            a = self.pop()
+            self.operation(pc, 'idx', a, b, ('c', row[1]))
+        elif op[:3] == 'vv_':
+            self.operation(pc, op[3:], ('v', row[1], row[2]), ('v', row[3], row[4]))
+        elif op[:3] == 'vc_':
+            self.operation(pc, op[3:], ('v', row[1], row[2]), ('c', row[3]))
+        elif op == 'dlc':
+            for n in range(row[1]):
+                self.pop()
+        elif op == 'stv':
+            a = self.pop()
+            target = ('v', row[1], row[2])
+            if self.computed(a) and not any(operand[0] == 'v' for operand in self.stack):
+                # the operation writes the variable instead of the stack cell
+                self.rows[-1] = (self.rows[-1][0], target) + self.rows[-1][2:]
+            else:
+                # the pending reads of variables see the value before the store
+                self.materialize(pc, 'v')
+                self.emit(('mov', target, a), pc)
+        elif op == 'stk':
+            # the value stored is read back from the variable
+            self.instruction(pc, ('stv',) + row[1:])
+            self.instruction(pc, ('ldv',) + row[1:])
+        elif op == 'smv' and row[1] == 1:
+            b = self.pop()
+            a = self.pop()
+            self.materialize(pc, 'v')
+            self.emit(('sto', a, b), pc)
+        elif op == 'inc':
+            self.materialize(pc, 'v')
+            self.emit(('add', ('v', row[1], row[2]), ('v', row[1], row[2]), ('c', row[3])), pc)
+        elif op in ('jmp', 'jof', 'cfu', 'ret') or op in COMPARISONS:
+            self.terminator(pc, row)
+            return False
+        else:
+            # the other instructions run through the handlers of the dispatch engine
+            self.sync(pc)
+            self.emit(('stack', pc), pc)
+            self.result = None
+        return True
+
+    def terminator(self, pc, row):
+        op = row[0]
+        if op == 'jmp':
+            self.materialize(pc)
+            self.emit(('jmp', row[1], self.k), pc)
+        elif op == 'jof':
+            a = self.pop()
+            if self.computed(a) and self.rows[-1][0] in COMPARE_JUMP:
+                # jumps when the comparison does not hold, without storing it
+                compare = self.rows.pop()
+                self.origin.pop()
+                self.materialize(pc)
+                self.emit((COMPARE_JUMP[compare[0]], row[1], self.k) + compare[2:], pc)
+            else:
+                self.materialize(pc)
+                self.emit(('jf', row[1], self.k, a), pc)
+        elif op in COMPARISONS:
+            b = self.pop()
+            a = self.pop()
+            self.materialize(pc)
+            self.emit((op, row[1], self.k, a, b), pc)
+        elif op == 'cfu':
+            self.materialize(pc)
+            self.emit(('cfu', row[1], self.k), pc)
+        elif op == 'ret':
+            self.materialize(pc)
+            self.emit(('ret', self.k, row[1], row[2]), pc)
+
+
+def read(operand, n):
+    """Source of the value of an operand whose fields start at row[n]."""
+    kind = operand[0]
+    if kind == 'c':
+        return "row[%d]" % n
+    if kind == 'v':
+        return "M[D[row[%d]] + row[%d]]" % (n, n + 1)
+    if kind == 'r':
+        return "(D[row[%d]] + row[%d])" % (n, n + 1)
+    return "M[sp + row[%d]]" % n
+
+
+def cells(shape, row, sp, M, D):
+    """Cells of the memory a flat row of the given shape may access, the
+    'stack' rows run an instruction of the linked code instead."""
+    name, kinds = shape.rsplit('_', 1)
+    n = len(row) - sum(FIELDS[kind] for kind in kinds)
+    result = []
+    values = []
+    for kind in kinds:
+        if kind == 'c':
+            values.append(row[n])
+        elif kind == 'r':
+            values.append(D[row[n]] + row[n + 1])
+        else:
+            cell = D[row[n]] + row[n + 1] if kind == 'v' else sp + row[n]
+            result.append(cell)
+            values.append(M[cell] if cell < len(M) else None)
+        n += FIELDS[kind]
+    if name == 'cfu':
+        result.append(sp + row[2] + 1)
+    elif name == 'ret':
+        result.append(sp + row[1])
+    # the cell of a reference, once it is read
+    elif name == 'grc' and values[1] is not None:
+        result.append(values[1])
+    elif name == 'sto' and values[0] is not None:
+        result.append(values[0])
+    return result
+
+
+def shape(row):
+    """Name of the handler of a row: the instruction and the kinds of its operands."""
+    return row[0] + "_" + "".join(f[0] for f in row[1:] if type(f) == tuple)
+
+
+def flatten(row):
+    fields = [row[0]]
+    for f in row[1:]:
+        if type(f) == tuple:
+            fields.extend(f[1:])
+        else:
+            fields.append(f)
+    return tuple(fields)
+
+
+def handler_source(row):
+    """Source of the handler of the rows of the same shape as row."""
+    name = row[0]
+    operands = []
+    n = 1
+    for f in row[1:]:
+        if type(f) == tuple:
+            operands.append(read(f, n))
+            n += FIELDS[f[0]]
+        else:
+            operands.append("row[%d]" % n)
+            n += 1
+    lines = ["def h(row):", "    sp = S._sp"]
+    if name in ('mov', 'sto', 'neg', 'not', 'grc') or name in OPERATORS or name == 'idx':
+        if name == 'mov':
+            value = operands[1]
+        elif name == 'sto':
+            lines.append("    M[%s] = %s" % (operands[0], operands[1]))
+            value = None
+        elif name in OPERATORS:
+            value = "(%s) %s (%s)" % (operands[1], OPERATORS[name], operands[2])
+        elif name == 'idx':
+            value = "(%s) + (%s) * %s" % (operands[1], operands[2], operands[3])
+        else:
+            value = {'neg': "-(%s)", 'not': "not (%s)", 'grc': "M[%s]"}[name] % operands[1]
+        if value is not None:
+            lines.append("    %s = %s" % (operands[0], value))
+    elif name == 'sp':
+        lines.append("    S._sp = sp + row[1]")
+    elif name == 'jmp':
+        lines.append("    S._sp = sp + row[2]; S._pc = row[1] - 1")
+    elif name == 'jf' or name in COMPARISONS:
+        condition = ("not (%s)" % operands[2] if name == 'jf' else
+                     "(%s) %s (%s)" % (operands[2], COMPARISONS[name], operands[3]))
+        lines.append("    if %s: S._pc = row[1] - 1" % condition)
+        lines.append("    S._sp = sp + row[2]")
+    elif name == 'cfu':
+        lines.append("    M[sp + row[2] + 1] = S._pc + 1; S._sp = sp + row[2] + 1; S._pc = row[1] - 1")
+    elif name == 'ret':
+        lines.append("    sp += row[1]; D[row[2]] = M[sp]; S._pc = M[sp - 1] - 1; S._sp = sp - row[3] - 2")
+    elif name == 'stack':
+        lines.append("    C[row[1]][0](C[row[1]][1])")
+    if "sp" not in "".join(lines[2:]):
+        del lines[1]
+    return "\n".join(lines)
+
+
+def translate(code):
+    """Returns (rows, origin, make) for the linked code of an Interpreter: the
+    flat register rows, the linked pc of each of them and make(S, M, D, C),
+    which returns the handlers by shape."""
+    translator = RegisterTranslator()
+    rows = translator.translate(code)
+    shapes = {}
+    for row in rows:
+        shapes.setdefault(shape(row), row)
+    source = ["def make(S, M, D, C):", "    handlers = {}"]
+    for name, row in sorted(shapes.items()):
+        source.extend("    " + line for line in handler_source(row).split("\n"))
+        source.append("    handlers[%r] = h" % name)
+    source.append("    return handlers")
+    namespace = {}
+    exec compile("\n".join(source) + "\n", '<lya registers>', 'exec') in namespace
+    return [(shape(row), flatten(row)) for row in rows], translator.origin, namespace['make']
+
+
+def make_code(make, rows, interpreter, M, D, code):
+    """Returns the (handler, row) pairs run by the register engine."""
+    handlers = make(interpreter, M, D, code)
+    return [(handlers[name], row) for name, row in rows]
@@ -0,0 +1,438 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Precompiled LALR tables of the lya parser.
+#
+# yacc.yacc() reflects over the parser (its p_ methods and their docstrings)
+# at every start, even when it then reads parsetab.py, which is looked up on
+# sys.path and written to the current directory. Instead, running
+#
+#     python lya_tables.py
+#
+# builds the tables once from the grammar of LyaParser and writes them to
+# lya_parsetab.py, next to this file, as flat arrays of 16-bit integers:
+#     ACTION      the action of each row for each terminal of TERMINALS: j > 0
+#                 shifts to state j, j < 0 reduces by production -j, 0
+#                 accepts and ERROR is a syntax error
+#     ACTION_ROW  the row of ACTION of each state, the states with the same
+#                 actions share a row
+#     GOTO        the state after each nonterminal of NONTERMINALS, or -1,
+#     GOTO_ROW    for the rows of GOTO as for ACTION_ROW
+#     DEFAULTED   state, production: the states that reduce whatever the next
+#                 token is, which yacc.LRParser finds by reading every row
+# compressed with zlib and encoded in base64. load() only reads them and
+# binds the productions to the methods of the parser named in PRODUCTIONS,
+# the rows of a state become the dicts yacc.LRParser reads when it gets
+# there. The tests check that SIGNATURE is still the one of the grammar.
+#
+# It also writes lya_lalr.py, the parser of lya that load() returns instead
+# of the generic loop of yacc.LRParser: it reads the tables as lists indexed
+# by state and terminal, keeps the values and the first tokens of the
+# symbols in plain lists, whose lines are only found for p.lineno, and does
+# not call the actions that are only p[0] = p[1], which leave the value of
+# their single symbol on the stack.
+
+import ast
+import base64
+import inspect
+import os
+import sys
+import textwrap
+import zlib
+from array import array
+
+import ply.yacc as yacc
+
+
+ERROR = 32767
+FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lya_parsetab.py')
+PARSER_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lya_lalr.py')
+
+
+def reflect(parser):
+    pdict = dict((name, getattr(parser, name)) for name in dir(parser))
+    pdict['__file__'] = sys.modules[parser.__module__].__file__
+    info = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    info.get_all()
+    if info.error or info.validate_all():
+        raise yacc.YaccError('Unable to build parser')
+    return info
+
+
+def signature(parser):
+    """Signature of the grammar of parser, as yacc computes it."""
+    return reflect(parser).signature()
+
+
+def build(parser):
+    """Returns the tables of the grammar of parser (the class or an instance),
+    as a dict of the names of lya_parsetab.py."""
+    info = reflect(parser)
+    grammar = yacc.Grammar(info.tokens)
+    for term, assoc, level in info.preclist:
+        grammar.set_precedence(term, assoc, level)
+    for name, (file, line, production, symbols) in info.grammar:
+        grammar.add_production(production, symbols, name, file, line)
+    grammar.set_start(info.start)
+    lr = yacc.LRGeneratedTable(grammar, 'LALR', yacc.NullLogger())
+
+    terminals = ['$end'] + sorted(grammar.Terminals)
+    nonterminals = sorted(grammar.Nonterminals)
+    states = sorted(lr.lr_action)
+
+    def rows(table, symbols, empty):
+        flat = array('h')
+        row_of_state = array('h')
+        unique = {}
+        for state in states:
+            row = tuple(table.get(state, {}).get(s, empty) for s in symbols)
+            if row not in unique:
+                unique[row] = len(unique)
+                flat.extend(row)
+            row_of_state.append(unique[row])
+        return flat, row_of_state
+
+    action, action_row = rows(lr.lr_action, terminals, ERROR)
+    goto, goto_row = rows(lr.lr_goto, nonterminals, -1)
+    defaulted = array('h')
+    for state in states:
+        actions = list(lr.lr_action[state].values())
+        if len(actions) == 1 and actions[0] < 0:
+            defaulted.extend((state, actions[0]))
+    return {
+        'SIGNATURE': info.signature(),
+        'TERMINALS': tuple(terminals),
+        'NONTERMINALS': tuple(nonterminals),
+        'PRODUCTIONS': tuple((p.str, p.name, p.len, p.func) for p in lr.lr_productions),
+        'ACTION': action, 'ACTION_ROW': action_row,
+        'GOTO': goto, 'GOTO_ROW': goto_row,
+        'DEFAULTED': defaulted,
+    }
+
+
+def encode(values):
+    if sys.byteorder == 'big':
+        values = array('h', values)
+        values.byteswap()
+    return base64.b64encode(zlib.compress(values.tostring(), 9))
+
+
+def decode(data):
+    values = array('h', zlib.decompress(base64.b64decode(data)))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def dumps(tables):
+    """Source of lya_parsetab.py."""
+    lines = ["# lya_parsetab.py", "# Generated by lya_tables.py from the grammar of LyaParser. Do not edit.", ""]
+    for name in ('SIGNATURE', 'TERMINALS', 'NONTERMINALS'):
+        lines.append("%s = %r" % (name, tables[name]))
+    lines.append("PRODUCTIONS = (")
+    lines.extend("    %r," % (p,) for p in tables['PRODUCTIONS'])
+    lines.append(")")
+    for name in ('ACTION', 'ACTION_ROW', 'GOTO', 'GOTO_ROW', 'DEFAULTED'):
+        data = encode(tables[name])
+        lines.append("%s = (" % name)
+        lines.extend("    %r" % data[k: k + 72] for k in range(0, len(data), 72))
+        lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def passes_through(function):
+    """Whether the action is only p[0] = p[1]."""
+    body = ast.parse(textwrap.dedent(inspect.getsource(function))).body[0].body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Str):
+        body = body[1:]
+    return len(body) == 1 and ast.dump(body[0]) == ast.dump(ast.parse("p[0] = p[1]").body[0])
+
+
+PARSER = '''# lya_lalr.py
+# Generated by lya_tables.py from the grammar of LyaParser. Do not edit.
+
+import lya_tables
+
+SIGNATURE = %(signature)r
+# number of symbols of each production
+LENGTHS = %(lengths)r
+# column of GOTO of the left-hand side of each production
+LEFT = %(left)r
+# method of each production, None when it only does p[0] = p[1] of its only symbol
+ACTIONS = %(actions)r
+
+
+class Production(list):
+    """The p of the actions, p[0] being the value of the left-hand side."""
+    def lineno(self, n):
+        return self.starts[self.base + n].lineno
+
+    def lexpos(self, n):
+        return self.starts[self.base + n].lexpos
+
+    # the last tokens of the symbols are only kept with tracking, without it
+    # the spans end where they start as in yacc.LRParser
+    def linespan(self, n):
+        return self.starts[self.base + n].lineno, self.ends[self.base + n].lineno
+
+    def lexspan(self, n):
+        return self.starts[self.base + n].lexpos, self.ends[self.base + n].lexpos
+
+
+class Position(object):
+    """The start of a symbol without tokens."""
+    def __init__(self, lineno, lexpos):
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class End(object):
+    type = '$end'
+    value = None
+    lineno = 0
+
+
+END = End()
+
+
+class LALRParser(object):
+    def __init__(self, parser, tables):
+        if tables['SIGNATURE'] != SIGNATURE:
+            raise ValueError("lya_lalr.py is not made for the tables of lya_parsetab.py.")
+        self.errorfunc = parser.p_error
+        self.actions = [getattr(parser, name) if name else None for name in ACTIONS]
+        # the rows of ACTION with a last column of errors, for the unknown tokens
+        terminals = tables['TERMINALS']
+        width = len(terminals)
+        self.index = dict((name, column) for column, name in enumerate(terminals))
+        self.unknown = width
+        self.action = []
+        flat = tables['ACTION']
+        for start in range(0, len(flat), width):
+            self.action.extend(flat[start: start + width])
+            self.action.append(lya_tables.ERROR)
+        self.action_base = [row * (width + 1) for row in tables['ACTION_ROW']]
+        self.goto = list(tables['GOTO'])
+        self.goto_base = [row * len(tables['NONTERMINALS']) for row in tables['GOTO_ROW']]
+        # the production reduced in each state whatever the next token is, or 0
+        self.default = [0] * len(self.action_base)
+        defaulted = tables['DEFAULTED']
+        for n in range(0, len(defaulted), 2):
+            self.default[defaulted[n]] = defaulted[n + 1]
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=True):
+        """Parses as yacc.LRParser.parse, except that the line numbers of the
+        symbols are given without tracking: tracking keeps their last tokens
+        for the spans. debug is only accepted for the calls of
+        yacc.LRParser.parse."""
+        if input is not None:
+            lexer.input(input)
+        get_token = lexer.token
+        action = self.action
+        action_base = self.action_base
+        goto = self.goto
+        goto_base = self.goto_base
+        default = self.default
+        index = self.index
+        unknown = self.unknown
+        actions = self.actions
+        lengths = LENGTHS
+        left = LEFT
+        ERROR = lya_tables.ERROR
+
+        states = [0]
+        values = [None]
+        # the first token of each symbol, its line is only read by p.lineno
+        starts = [Position(0, 0)]
+        ends = [starts[0]] if tracking else starts
+        p = Production()
+        p.starts = starts
+        p.ends = ends
+        state = 0
+        lookahead = None
+        column = unknown
+        errorcount = 0
+        while True:
+            t = default[state]
+            if not t:
+                if lookahead is None:
+                    lookahead = get_token() or END
+                    column = index.get(lookahead.type, unknown)
+                t = action[action_base[state] + column]
+            if t < 0:
+                rule = -t
+                f = actions[rule]
+                if f is None:
+                    # p[0] = p[1]
+                    state = goto[goto_base[states[-2]] + left[rule]]
+                    states[-1] = state
+                    continue
+                n = lengths[rule]
+                if n:
+                    p[:] = values[-n - 1:]
+                    p[0] = None
+                    p.base = len(starts) - n - 1
+                    f(p)
+                    start = starts[-n]
+                    del values[-n:]
+                    del starts[-n:]
+                    del states[-n:]
+                    if tracking:
+                        end = ends[-1]
+                        del ends[-n:]
+                else:
+                    p[:] = [None]
+                    p.base = len(starts) - 1
+                    f(p)
+                    start = end = Position(lexer.lineno, lexer.lexpos)
+                values.append(p[0])
+                starts.append(start)
+                if tracking:
+                    ends.append(end)
+                state = goto[goto_base[states[-1]] + left[rule]]
+                states.append(state)
+                continue
+            if t != ERROR:
+                if t == 0:
+                    return values[-1]
+                states.append(t)
+                state = t
+                values.append(lookahead.value)
+                starts.append(lookahead)
+                if tracking:
+                    ends.append(lookahead)
+                lookahead = None
+                if errorcount:
+                    errorcount -= 1
+                continue
+            # a syntax error, reported unless there was another one in the last 3 tokens
+            if errorcount == 0:
+                errtoken = lookahead if lookahead.type != '$end' else None
+                if errtoken is not None and not hasattr(errtoken, 'lexer'):
+                    errtoken.lexer = lexer
+                self.errorfunc(errtoken)
+            errorcount = 3
+            if lookahead.type == '$end':
+                return None
+            # there are no error rules, the parser starts again after the token
+            del states[1:]
+            del values[1:]
+            del starts[1:]
+            if tracking:
+                del ends[1:]
+            state = 0
+            lookahead = None
+'''
+
+
+def generate(parser, tables):
+    """Source of lya_lalr.py."""
+    nonterminals = tables['NONTERMINALS']
+    productions = tables['PRODUCTIONS']
+    actions = []
+    for text, name, length, func in productions:
+        if func is None or (length == 1 and passes_through(getattr(parser, func))):
+            actions.append(None)
+        else:
+            actions.append(func)
+    return PARSER % {
+        'signature': tables['SIGNATURE'],
+        'lengths': tuple(length for text, name, length, func in productions),
+        'left': tuple(nonterminals.index(name) if name in nonterminals else -1
+                      for text, name, length, func in productions),
+        'actions': tuple(actions),
+    }
+
+
+def write(parser, file_name=FILENAME, parser_file_name=PARSER_FILENAME):
+    tables = build(parser)
+    with open(file_name, 'w') as f:
+        f.write(dumps(tables))
+    with open(parser_file_name, 'w') as f:
+        f.write(generate(parser, tables))
+
+
+def read():
+    """The tables of lya_parsetab.py, or None when there are none."""
+    try:
+        import lya_parsetab
+    except ImportError:
+        return None
+    names = ('SIGNATURE', 'TERMINALS', 'NONTERMINALS', 'PRODUCTIONS')
+    arrays = ('ACTION', 'ACTION_ROW', 'GOTO', 'GOTO_ROW', 'DEFAULTED')
+    if not all(hasattr(lya_parsetab, name) for name in names + arrays):
+        return None
+    tables = dict((name, getattr(lya_parsetab, name)) for name in names)
+    for name in arrays:
+        tables[name] = decode(getattr(lya_parsetab, name))
+    return tables
+
+
+def load(parser):
+    """Returns the parser of lya_lalr.py, or the yacc.LRParser of the tables
+    when it is missing or made for other tables."""
+    tables = read() or build(parser)
+    try:
+        import lya_lalr
+        return lya_lalr.LALRParser(parser, tables)
+    except (ImportError, ValueError):
+        return load_yacc(parser, tables)
+
+
+def load_yacc(parser, tables=None):
+    """Returns the yacc.LRParser of parser from its tables, built from its
+    grammar when lya_parsetab.py is missing. The symbols get their lines
+    without tracking too."""
+    if tables is None:
+        tables = read() or build(parser)
+    lr = yacc.LRTable()
+    lr.lr_method = 'LALR'
+    lr.lr_action = Table(tables['ACTION'], tables['ACTION_ROW'], tables['TERMINALS'], ERROR)
+    lr.lr_goto = Table(tables['GOTO'], tables['GOTO_ROW'], tables['NONTERMINALS'], -1)
+    lr.lr_productions = [yacc.MiniProduction(text, name, length, func, None, None)
+                         for text, name, length, func in tables['PRODUCTIONS']]
+    lr.bind_callables(dict((p.func, with_line(getattr(parser, p.func))) for p in lr.lr_productions if p.func))
+    result = yacc.LRParser(lr, parser.p_error)
+    defaulted = tables['DEFAULTED']
+    result.defaulted_states = dict(zip(defaulted[::2], defaulted[1::2]))
+    return result
+
+
+def with_line(action):
+    """action, giving its left-hand side the line of its first symbol, which
+    yacc.LRParser only does with tracking."""
+    def action_with_line(p):
+        p.slice[0].lineno = p.lineno(1) if len(p) > 1 else p.lexer.lineno
+        action(p)
+    return action_with_line
+
+
+class Table(dict):
+    """The {symbol: value} dict of each state that yacc.LRParser reads, made
+    from its row the first time it is read and shared by the states with the
+    same row."""
+    def __init__(self, flat, row_of_state, symbols, empty):
+        super(Table, self).__init__()
+        self.flat = flat
+        self.row_of_state = row_of_state
+        self.symbols = symbols
+        self.empty = empty
+        self.rows = {}
+
+    def __missing__(self, state):
+        if not 0 <= state < len(self.row_of_state):
+            raise KeyError(state)
+        row = self.row_of_state[state]
+        values = self.rows.get(row)
+        if values is None:
+            width = len(self.symbols)
+            values = self.rows[row] = dict((s, v) for s, v in zip(self.symbols, self.flat[row * width: (row + 1) * width])
+                                           if v != self.empty)
+        self[state] = values
+        return values
+
+
+if __name__ == "__main__":
+    from lya_parser import LyaParser
+    write(LyaParser)
+    print("Wrote " + FILENAME + " and " + PARSER_FILENAME)
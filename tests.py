@@ -1,11 +1,25 @@
 #!/usr/bin/python
 
 from interpreter import Interpreter
-from compiler import LyaCompiler
+from compiler import LyaCompiler, compile_python, compile_source, get_parser, run_source, compile_batch
 from lya_errors import *
+import lya_bytecode
+import lya_io
+import lya_tables
+import lya_cache
+from lya_cache import CompileCache
+from lya_lex import LyaLexer
+from lya_parser import LyaParser
+from lya_optimizer import CANDIDATES, fuse, optimize
+import lya_fusion
 import unittest
 import os
 import sys
+import shutil
+import tempfile
+import threading
+import time
+from StringIO import StringIO
 
 
 def fit(text, size=80, filler='#'):
@@ -22,7 +36,7 @@ class Examples(unittest.TestCase):
         files = os.listdir(folder)
         for i in files:
             if "example" in i and ".lya" in i and not '.o' in i:
-                sys.argv = ['./compiler.py', '-ast-walker', folder + i]
+                sys.argv = ['./compiler.py', '-no-cache', '-ast-walker', folder + i]
                 print fit(i)
                 m = LyaCompiler()
                 m.run()
@@ -35,7 +49,7 @@ class ErrorTests(unittest.TestCase):
         files = os.listdir(folder)
         for i in files:
             print fit(i)
-            sys.argv = ['./compiler.py', '-ast-walker', folder + i]
+            sys.argv = ['./compiler.py', '-no-cache', '-ast-walker', folder + i]
             m = LyaCompiler()
 
             if "invalid" in i:
@@ -57,32 +71,699 @@ class InterpreterTests(unittest.TestCase):
         i.load_program()
 """
 
+def run_captured(file_name, engine):
+    stdout = sys.stdout
+    sys.stdout = StringIO()
+    try:
+        i = Interpreter(engine=engine, files=[])
+        i.load_program(file_name)
+        return sys.stdout.getvalue()
+    finally:
+        sys.stdout = stdout
+
+
+def compile_examples(output_dir, prefix="email"):
+    folder = "./examples/"
+    compiled = []
+    for i in sorted(os.listdir(folder)):
+        if prefix in i and i.endswith(".lya"):
+            # programs that read from the input can not run unattended
+            if "read" in open(folder + i).read():
+                continue
+            output_file = os.path.join(output_dir, i + ".o")
+            sys.argv = ['./compiler.py', '-no-cache', folder + i, '-o', output_file]
+            LyaCompiler().run()
+            compiled.append(output_file)
+    return compiled
+
+
+class InterpreterEngines(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def test_engines_agree(self):
+        for output_file in compile_examples(self.output_dir):
+            print fit("running: " + output_file)
+            expected = run_captured(output_file, 'classic')
+            for engine in Interpreter.ENGINES:
+                self.assertEqual(expected, run_captured(output_file, engine))
+            print fit("")
+
+
+class Memory(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def test_growth(self):
+        for output_file in compile_examples(self.output_dir):
+            expected = run_captured(output_file, 'dispatch')
+            for engine in Interpreter.ENGINES:
+                stdout = StringIO()
+                i = Interpreter(engine=engine, files=[], stdout=stdout, memory_size=1)
+                i.load_file(output_file)
+                i.run()
+                self.assertEqual(expected, stdout.getvalue())
+
+    def test_typed(self):
+        for output_file in compile_examples(self.output_dir):
+            expected = run_captured(output_file, 'dispatch')
+            stdout = StringIO()
+            i = Interpreter(files=[], stdout=stdout, memory='typed', memory_size=1)
+            i.load_file(output_file)
+            i.run()
+            self.assertEqual(expected, stdout.getvalue())
+
+    def test_limit(self):
+        source = "dcl a array[1:100] int;\ndcl i int;\ndo for i = 1 to 100;\n  a[i] = i;\nod;\nprint(a[100]);\n"
+        program = compile_source(source)
+        for engine, memory in (('classic', 'list'), ('dispatch', 'list'), ('dispatch', 'typed'), ('blocks', 'list'),
+                               ('registers', 'list')):
+            i = Interpreter(engine=engine, files=[], stdout=StringIO(), memory_size=8, memory_limit=64,
+                            memory=memory)
+            i.load_code(program.H, program.text)
+            with self.assertRaises(StackOverflowError) as cm:
+                i.run()
+            # the pc of the 'alc' of the variables
+            self.assertEqual('alc', program.text[cm.exception.pc][0])
+
+    def test_end_after_growth(self):
+        # the program ends in the instructions run after the memory grew
+        program = compile_source("dcl a array[1:50] int;\na[50] = 7;\nprint(a[50]);\n")
+        sizes = []
+        for engine in Interpreter.ENGINES:
+            stdout = StringIO()
+            i = Interpreter(engine=engine, files=[], stdout=stdout, memory_size=8, memory_limit=64)
+            i.load_code(program.H, program.text)
+            i.run()
+            self.assertEqual("7\n", stdout.getvalue())
+            sizes.append(len(i._M))
+        self.assertEqual([sizes[0]] * len(sizes), sizes)
+
+    def test_other_index_errors(self):
+        # only the accesses past the end of the memory grow it
+        past_end = [('stp',), ('ldc', 1), ('jmp', 1), ('end',), ('lbl', 1)]
+        no_string = [('stp',), ('prc', 3), ('end',)]
+        for text, message in ((past_end, "Execution past the end of the program."), (no_string, "Index out of range.")):
+            for engine in Interpreter.ENGINES:
+                i = Interpreter(engine=engine, files=[], stdout=StringIO(), memory_size=8, memory_limit=64)
+                i.load_code([], text)
+                with self.assertRaises(InterpreterError) as cm:
+                    i.run()
+                self.assertNotIsInstance(cm.exception, (StackOverflowError, OutOfMemoryError))
+                self.assertIn(message, str(cm.exception))
+                self.assertEqual(8, len(i._M))
+
+
+class Blocks(unittest.TestCase):
+    def test_translation(self):
+        program = compile_source("dcl i, s int = 0;\ndo for i = 1 to 5;\n  s = s + i * 2;\nod;\nprint(s);\n")
+        stdout = StringIO()
+        i = Interpreter(engine='blocks', files=[], stdout=stdout)
+        i.load_code(program.H, program.text)
+        i.run()
+        # the blocks start at the jump targets and after the jumps
+        starts = [pc for pc, block in enumerate(i._blocks) if block is not None]
+        self.assertEqual(0, starts[0])
+        for handler, row in i._code:
+            if row[0] in lya_bytecode.JUMPS:
+                self.assertIn(row[1], starts)
+        self.assertEqual("30\n", stdout.getvalue())
+
+    def test_growth_inside_block(self):
+        # the arguments are stored one by one, the memory grows between them
+        source = ("f: proc (a int, b int, c int, d int) returns (int);\n  return a * b + c * d;\nend;\n"
+                  "dcl s int = 2;\nprint(f(s, s + 1, s + 2, s + 3));\n")
+        program = compile_source(source)
+        stdout = StringIO()
+        i = Interpreter(engine='blocks', files=[], stdout=stdout, memory_size=2)
+        i.load_code(program.H, program.text)
+        i.run()
+        self.assertEqual("26\n", stdout.getvalue())
+        self.assertTrue(len(i._M) > 2)
+
+
+class Registers(unittest.TestCase):
+    def test_translation(self):
+        program = compile_source("dcl a, b int = 2, c int = 3;\na = b + c;\nprint(a);\n")
+        stdout = StringIO()
+        i = Interpreter(engine='registers', files=[], stdout=stdout)
+        i.load_code(program.H, program.text)
+        i.run()
+        self.assertEqual("5\n", stdout.getvalue())
+        # ldv, ldv, add, stv is one instruction writing the variable
+        self.assertIn(('add_vvv', ('add', 0, 0, 0, 1, 0, 2)), i._registers_rows)
+        self.assertTrue(len(i._registers_rows) < len(i._code))
+
+    def test_calls(self):
+        source = ("f: proc (n int) returns (int);\n  if n < 2 then result 1; else result n * f(n - 1); fi;\nend;\n"
+                  "dcl a array[1:3] int, i int;\ndo for i = 1 to 3;\n  a[i] = f(i + 2);\nod;\nprint(a[1], a[3]);\n")
+        for optimized in (False, True):
+            program = compile_source(source, optimized=optimized)
+            stdout = StringIO()
+            program.run(stdout=stdout, engine='registers', memory_size=4)
+            self.assertEqual("6\n120\n", stdout.getvalue())
+
+
+class PythonBackend(unittest.TestCase):
+    def test_same_output(self):
+        # the examples that read get the same input, the 0 ends the loops of reads
+        stdin = "5 3 7 2 9 1 4 5 6 7 8 9 1 2 0\n" * 3
+        for name in sorted(os.listdir("examples")):
+            if not name.endswith(".lya"):
+                continue
+            print name
+            source = open("./examples/" + name).read()
+            try:
+                program = compile_source(source)
+            except Exception as e:
+                # the examples that do not compile
+                self.assertRaises(type(e), compile_python, source)
+                continue
+            expected = StringIO()
+            program.run(StringIO(stdin), expected)
+            stdout = StringIO()
+            compile_python(source).run(StringIO(stdin), stdout)
+            self.assertEqual(expected.getvalue(), stdout.getvalue())
+
+    def test_procedures(self):
+        source = ("dcl n int = 3, v array [1:3] int;\n"
+                  "f: proc (k int) returns (int);\n  if k < 2 then result 1; else result k * f(k - 1); fi;\nend;\n"
+                  "v[2] = f(n) / 4;\nprint(v[2], lower(v), length(v));\n")
+        stdout = StringIO()
+        compile_python(source).run(stdout=stdout)
+        self.assertEqual("1\n1\n3\n", stdout.getvalue())
+
+    def test_loc_and_arrays(self):
+        source = ("dcl a array[1:3] int, n int = 0, s chars[8] = \"ab\";\n"
+                  "inc: proc (k int loc, v array[1:3] int);\n  k += 1;\n  v[k] = k * 10;\nend;\n"
+                  "twice: proc (k int loc);\n  inc(k, a);\n  inc(k, a);\nend;\n"
+                  "add: proc (k int loc, d int);\n  k += d;\nend;\n"
+                  "inc(n, a);\ntwice(n);\nadd(a[1], 5);\nprint(n, a[1], a[2], a[3]);\n"
+                  "s = s + \"cd\";\nread(s);\nread(n);\nprint(n, length(s));\n")
+        stdout = StringIO()
+        compile_python(source).run(StringIO("hello world\n7\n"), stdout)
+        self.assertEqual("3\n15\n20\n30\n7\n8\n", stdout.getvalue())
+
+    def test_lowered(self):
+        # references, loc and array results, slices, synonyms, arrays of many
+        # indexes, variables of an enclosing procedure, conditional
+        # expressions and do without a control part
+        source = ("syn lo = 1, hi = lo + 2, greeting = \"hi\";\n"
+                  "type vector = array[lo:hi] int;\n"
+                  "dcl m array[lo:2, 0:hi] int, v vector, r ref int, z int = 1;\n"
+                  "pick: proc (b bool) return (int loc);\n  if b then result m[2, 3]; else result z; fi;\nend;\n"
+                  "twice: proc (w vector) returns (vector);\n  dcl k int;\n"
+                  "  do\n    for k = lo to hi;\n      w[k] *= 2;\n  od;\n  result w;\nend;\n"
+                  "sum: proc (n int) returns (int);\n  dcl s int = 0;\n"
+                  "  add: proc (k int);\n    s += k * z;\n  end;\n"
+                  "  l: do\n    add(n);\n    n -= 1;\n    if n == 0 then exit l; fi;\n  od;\n  result s;\nend;\n"
+                  "m[2, 3] = 4;\npick(true) += 3;\npick(false) = 2;\nr = -> v[2];\nr-> = m[2, 3];\n"
+                  "v = twice(v);\nv[1:2] = v[2:3];\n"
+                  "print(m[2, 3], z, v[lo:2], sum(3), if z > 1 then greeting else \"no\" fi, length(m));\n")
+        expected = "7\n2\n[14, 0]\n12\nhi\n8\n"
+        for program in (compile_source(source), compile_python(source)):
+            stdout = StringIO()
+            program.run(stdout=stdout)
+            self.assertEqual(expected, stdout.getvalue())
+
+    def test_unsupported(self):
+        source = "dcl m array[1:2] array[1:3] int;\n"
+        self.assertRaises(UnsupportedError, compile_python, source)
+
+
+class BufferedOutput(unittest.TestCase):
+    def test_flushes(self):
+        source = 'dcl n int;\nprint("n: ");\nread(n);\nprint(n * 2);\nread(n);\n'
+        stdout = StringIO()
+
+        class Input(object):
+            # what the program printed when it waits for each line
+            def __init__(self, lines):
+                self.lines = lines
+                self.prompts = []
+
+            def readline(self):
+                self.prompts.append(stdout.getvalue())
+                return self.lines.pop(0) if self.lines else ""
+
+        for program in (compile_source(source), compile_python(source)):
+            stdout.truncate(0)
+            stdin = Input(["21\n"])
+            # the second read fails, the output is written before the error
+            self.assertRaises(EOFError, program.run, stdin, stdout)
+            self.assertEqual(["n: ", "n: 42\n"], stdin.prompts)
+            self.assertEqual("n: 42\n", stdout.getvalue())
+
+
+class StreamingInput(unittest.TestCase):
+    def test_sources(self):
+        source = "dcl a, b, c int;\nread(a, b);\nread(c);\nprint(a + b + c);\n"
+        lines = ["1 2", "3"]
+        name = tempfile.mktemp()
+        with open(name, 'w') as f:
+            f.write("\n".join(lines))
+        for stdin in (lambda: StringIO("\n".join(lines)), lambda: lines, lambda: name):
+            for program in (compile_source(source), compile_python(source)):
+                stdout = StringIO()
+                program.run(stdin(), stdout)
+                self.assertEqual("6\n", stdout.getvalue())
+        os.remove(name)
+
+    def test_chunks(self):
+        # lines across the chunks, the last one without its end
+        stdin = lya_io.StreamInput(StringIO("12 345\n\n6 7\n8"), size=4)
+        self.assertEqual([12, 345], [stdin.value(), stdin.value()])
+        self.assertEqual(["", "6 7", "8"], [stdin.line(), stdin.line(), stdin.line()])
+        self.assertRaises(EOFError, stdin.token)
+        self.assertRaises(InterpreterError, lya_io.ListInput(["a"]).value)
+
+
+class Profiler(unittest.TestCase):
+    def test_counts(self):
+        source = ("f: proc (n int) returns (int);\n  if n < 2 then result 1; else result n * f(n - 1); fi;\nend;\n"
+                  "dcl i int;\ndo for i = 1 to 3;\n  print(f(4));\nod;\n")
+        program = compile_source(source)
+        for engine in ('classic', 'registers'):
+            stdout = StringIO()
+            i = Interpreter(engine=engine, files=[], stdout=stdout, profile=True)
+            i.load_code(program.H, program.text)
+            i.run()
+            self.assertEqual("24\n" * 3, stdout.getvalue())
+            profile = i.profile.as_dict()
+            self.assertEqual(profile['instructions'], sum(profile['opcodes'].values()))
+            self.assertEqual(profile['instructions'], sum(pc['count'] for pc in profile['pcs']))
+            self.assertEqual(12, profile['opcodes']['cfu'])
+            [f] = profile['procedures']
+            self.assertEqual(12, f['calls'])
+            # the recursive calls are counted by the outermost one
+            self.assertEqual(f['own_instructions'], f['instructions'])
+
+
+class Bytecode(unittest.TestCase):
+    def test_round_trip(self):
+        H = ["true and false", "What\xe2\x80\x99s your name?", ""]
+        text = [('stp', None), ('alc', 3), ('ldc', 'true'), ('ldc', False), ('ldc', 'a'),
+                ('ldc', -7), ('ldv', 1, -3), ('jof', 2), ('ret', 1, 2), ('prc', 0),
+                ('lbl', 2), ('end', None)]
+        expected = [('stp', None), ('alc', 3), ('ldc', True), ('ldc', False), ('ldc', 'a'),
+                    ('ldc', -7), ('ldv', 1, -3), ('jof', 2), ('ret', 1, 2), ('prc', 0),
+                    ('lbl', 2), ('end', None)]
+        self.assertEqual((H, expected), lya_bytecode.loads(lya_bytecode.dumps(H, text)))
+
+    def test_unresolved_operand(self):
+        text = [('stp', None), ('alc', 1), ('ldv', 0, None), ('end', None)]
+        with self.assertRaises(UnexpectedError) as cm:
+            lya_bytecode.dumps([], text)
+        self.assertIn("Operand is not an integer.", str(cm.exception))
+        self.assertIn("at pc = 2", str(cm.exception))
+
+    def test_same_program_as_text(self):
+        folder = "./examples/"
+        output_dir = tempfile.mkdtemp()
+        try:
+            for i in sorted(os.listdir(folder)):
+                if "email" in i and i.endswith(".lya"):
+                    output_file = os.path.join(output_dir, i)
+                    sys.argv = ['./compiler.py', '-no-cache', folder + i, '-o', output_file + ".o"]
+                    LyaCompiler().run()
+                    sys.argv = ['./compiler.py', '-no-cache', folder + i, '-text', '-o', output_file + ".txt.o"]
+                    LyaCompiler().run()
+                    binary = Interpreter(files=[])
+                    binary.load_file(output_file + ".o")
+                    text = Interpreter(files=[])
+                    text.load_file(output_file + ".txt.o")
+                    self.assertEqual(text._text, binary._text)
+        finally:
+            shutil.rmtree(output_dir)
+
+
+class Lexer(unittest.TestCase):
+    def test_clones(self):
+        first, second = LyaLexer(), LyaLexer()
+        self.assertEqual("1: Unterminated string", second.to_token('"abc\nabc"'))
+        self.assertFalse(first.error)
+        tokens = first.to_token("x\ny ^")
+        self.assertEqual(["ID", "ID", "CARET"], [t.type for t in tokens])
+        # every input starts at line 1
+        self.assertEqual(2, first.to_token("x\ny")[-1].lineno)
+
+    def test_scanner(self):
+        scanner, ply = LyaLexer(), LyaLexer(ply=True)
+        self.assertNotEqual(type(scanner.lexer), type(ply.lexer))
+        sources = [open(os.path.join("examples", i)).read()
+                   for i in sorted(os.listdir("examples")) if i.endswith(".lya")]
+        sources += ["x  \t", "a\r\nb", "x\n\n  \n y // z\n w", "c = ''';", "'\n'", '"abc\nabc"', "x /* abc\n\n"]
+        for source in sources:
+            # the tokens or the message of the first error
+            tokens = ply.to_token(source)
+            if isinstance(tokens, list):
+                tokens = [(t.type, t.value, t.lineno, t.lexpos) for t in tokens]
+                self.assertEqual(tokens, [(t.type, t.value, t.lineno, t.lexpos) for t in scanner.to_token(source)])
+            else:
+                self.assertEqual(tokens, scanner.to_token(source))
+        tokens = scanner.to_token("dcl x int;\n  x = 1;")
+        self.assertEqual([3, 5, 7], [scanner.lexer.column(t) for t in tokens[4:7]])
+        # the lines are found when asked for, in any order
+        tokens = scanner.to_token("a /* b\n\n */ c\n// d\ne")
+        self.assertNotIn('lineno', vars(tokens[0]))
+        self.assertEqual([5, 3, 1], [t.lineno for t in reversed(tokens)])
+
+
+class Parser(unittest.TestCase):
+    def test_lists(self):
+        source = "dcl " + ", ".join("x%d" % k for k in range(300)) + " int;\n" + \
+                 "".join("x%d = %d;\n" % (k, k) for k in range(2000))
+        program = get_parser().parseInput(source)
+        statements = program.statement_list.statements
+        self.assertEqual(2001, len(statements))
+        identifiers = statements[0].declaration_list.declarations[0].identifier_list.identifiers
+        self.assertEqual(["x%d" % k for k in range(300)], [i.id for i in identifiers])
+        self.assertEqual(16, statements[15].lineno)
+
+    def test_tables(self):
+        # lya_parsetab.py is rebuilt by lya_tables.py when the grammar changes
+        tables = lya_tables.read()
+        self.assertEqual(lya_tables.build(LyaParser), tables)
+        with open(lya_tables.PARSER_FILENAME) as f:
+            self.assertEqual(lya_tables.generate(LyaParser, tables), f.read())
+
+    def dump(self, node):
+        if isinstance(node, list):
+            return [self.dump(n) for n in node]
+        if hasattr(node, '__dict__'):
+            return type(node).__name__, dict((k, self.dump(v)) for k, v in vars(node).items())
+        return node
+
+    def test_generated(self):
+        parser = get_parser()
+        generic = LyaParser()
+        generic.parser = lya_tables.load_yacc(generic)
+        self.assertNotEqual(type(generic.parser), type(parser.parser))
+        files = [os.path.join("examples", i) for i in sorted(os.listdir("examples")) if i.endswith(".lya")]
+        for file_name in files + [None]:
+            source = open(file_name).read() if file_name else "dcl x int;\nx = ;\nprint(x);\n"
+            self.assertEqual(self.dump(generic.parseInput(source)), self.dump(parser.parseInput(source)))
+
+    def test_locations(self):
+        source = "dcl x int;\n\nx = 1 + 2;\n"
+        for tracking in (False, True):
+            generic = LyaParser(tracking)
+            generic.parser = lya_tables.load_yacc(generic)
+            for parser in (LyaParser(tracking), generic):
+                statement = parser.parseInput(source).statement_list.statements[1]
+                # the lines of the nonterminals, from their first token
+                self.assertEqual(3, statement.lineno)
+                self.assertEqual(3, statement.action.lineno)
+                self.assertEqual(3, statement.action.loc.location_type.lineno)
+                # the location is made when asked for
+                self.assertNotIn('location', vars(statement))
+                self.assertEqual("(at line: 3)", statement.location)
+
+    def test_tracking(self):
+        class Spans(LyaParser):
+            # the actions are found by name, the tables stay those of LyaParser
+            def p_declaration_statement(self, p):
+                LyaParser.p_declaration_statement(self, p)
+                self.spans.append((p.lineno(2), p.linespan(2), p.lexspan(2)))
+
+        source = "dcl x int;\n\ndcl y,\n  z int;\n"
+        for tracking, expected in ((False, [(1, (1, 1)), (3, (3, 3))]),
+                                   (True, [(1, (1, 1), (4, 6)), (3, (3, 4), (16, 23))])):
+            generic = Spans(tracking)
+            generic.parser = lya_tables.load_yacc(generic)
+            for parser in (Spans(tracking), generic):
+                parser.spans = []
+                parser.parseInput(source)
+                # without tracking the spans end where they start, and yacc.LRParser leaves
+                # the lexpos of the nonterminals at 0, so only the lines are compared
+                self.assertEqual(expected, [span[:len(expected[0])] for span in parser.spans])
+
+
+class CompilerAPI(unittest.TestCase):
+    source = "dcl i int;\nread(i);\nprint(i * 2);\n"
+
+    def test_run_source(self):
+        for engine in Interpreter.ENGINES:
+            stdout = StringIO()
+            run_source(self.source, stdin=StringIO("21\n"), stdout=stdout, engine=engine)
+            self.assertEqual("42\n", stdout.getvalue())
+
+    def test_repeated_compilations(self):
+        program = compile_source(self.source)
+        for i in range(20):
+            self.assertEqual(program.text, compile_source(self.source).text)
+        for i in range(3):
+            stdout = StringIO()
+            program.run(stdin=StringIO(str(i) + "\n"), stdout=stdout)
+            self.assertEqual(str(i * 2) + "\n", stdout.getvalue())
+
+    def test_arguments(self):
+        m = LyaCompiler(['./examples/email4.lya', '-run'])
+        self.assertTrue(m.args.run)
+        self.assertEqual(['./examples/email4.lya'], m.args.files)
+
+    def test_inputs(self):
+        stderr = sys.stderr
+        sys.stderr = StringIO()
+        try:
+            # an empty expansion, several programs to run or to save
+            for argv in (['./examples/*.none'], ['./examples/email[12].lya', '-run'],
+                         ['./examples/email[12].lya', '-o', 'out.o']):
+                self.assertRaises(SystemExit, LyaCompiler, argv)
+        finally:
+            sys.stderr = stderr
+        m = LyaCompiler(['./examples/email[12].lya', '-batch', '-o', 'out'])
+        self.assertEqual(['./examples/email1.lya', './examples/email2.lya'], m.args.files)
+
+
+class PeepholeOptimizer(unittest.TestCase):
+    def test_rules(self):
+        text = [('stp',), ('alc', 1), ('alc', 0), ('ldc', 2), ('ldc', 3), ('mul',), ('ldc', 0), ('add',),
+                ('stv', 0, 0), ('lbl', 1), ('ldv', 0, 0), ('ldc', 10), ('leq',), ('jof', 2), ('jmp', 1),
+                ('lbl', 2), ('jmp', 3), ('ldc', 5), ('lbl', 3), ('ldc', True), ('jof', 4), ('lbl', 4),
+                ('ldv', 0, 0), ('ldc', 1), ('add',), ('stv', 0, 0), ('ldv', 0, 0), ('prv',), ('dlc', 1), ('end',)]
+        expected = [('stp',), ('alc', 1), ('ldc', 6), ('stv', 0, 0), ('lbl', 1), ('ldv', 0, 0),
+                    ('ldc', 10), ('grt',), ('jof', 1), ('ldv', 0, 0), ('ldc', 1), ('add',), ('stk', 0, 0),
+                    ('prv',), ('end',)]
+        self.assertEqual(expected, optimize(text))
+
+    def test_store_and_keep(self):
+        program = compile_source("dcl x, y int;\nx = 3;\nprint(x);\ny = x * 2;\nprint(y);\n", optimized=True)
+        self.assertIn(('stk', 0, 0), program.text)
+        self.assertIn(('stk', 0, 1), program.text)
+        for engine, memory in (('classic', 'list'), ('dispatch', 'list'), ('dispatch', 'typed'), ('blocks', 'list'),
+                               ('registers', 'list')):
+            stdout = StringIO()
+            i = Interpreter(engine=engine, files=[], stdout=stdout, memory=memory, memory_size=1)
+            i.load_code(program.H, program.text)
+            i.run()
+            self.assertEqual("3\n6\n", stdout.getvalue())
+
+    def test_same_output(self):
+        folder = "./examples/"
+        for i in sorted(os.listdir(folder)):
+            if "email" not in i or not i.endswith(".lya"):
+                continue
+            source = open(folder + i).read()
+            if "read" not in source:
+                outputs = []
+                for optimized in (False, True):
+                    stdout = StringIO()
+                    compile_source(source, optimized=optimized).run(stdout=stdout)
+                    outputs.append(stdout.getvalue())
+                self.assertEqual(outputs[0], outputs[1])
+
+    def test_fuse(self):
+        text = [('stp',), ('alc', 2), ('ldv', 0, 0), ('ldc', 1), ('add',), ('stv', 0, 0), ('lbl', 1),
+                ('ldv', 0, 0), ('ldv', 0, 1), ('mul',), ('ldv', 0, 1), ('ldc', 3), ('sub',), ('les',),
+                ('jof', 1), ('end',)]
+        expected = [('stp',), ('alc', 2), ('inc', 0, 0, 1), ('lbl', 1), ('vv_mul', 0, 0, 0, 1),
+                    ('vc_sub', 0, 1, 3), ('jge', 1), ('end',)]
+        fused = fuse(text, CANDIDATES)
+        self.assertEqual(expected, fused)
+        H, loaded = lya_bytecode.loads(lya_bytecode.dumps([], fused))
+        self.assertEqual([row if len(row) > 1 else row + (None,) for row in expected], loaded)
+        # the sequences left out of the table stay as they are
+        self.assertEqual(expected[:5] + text[10:], fuse(text, [('ldv', 'ldc', 'add', 'stv'), ('ldv', 'ldv', 'mul')]))
+
+    def test_fusetab(self):
+        # lya_fusetab.py is rebuilt by lya_fusion.py when the code generator or the examples change
+        with open(lya_fusion.FILENAME) as f:
+            self.assertEqual(lya_fusion.dumps(*lya_fusion.profile()), f.read())
+
+    def test_superinstructions(self):
+        folder = "./examples/"
+        for i in sorted(os.listdir(folder)):
+            if "email" not in i or not i.endswith(".lya"):
+                continue
+            source = open(folder + i).read()
+            if "read" not in source:
+                stdout = StringIO()
+                compile_source(source).run(stdout=stdout)
+                program = compile_source(source, optimized=True)
+                for engine, memory in (('classic', 'list'), ('dispatch', 'list'), ('dispatch', 'typed'),
+                                       ('blocks', 'list'), ('registers', 'list')):
+                    fused = StringIO()
+                    program.run(stdout=fused, engine=engine, memory=memory)
+                    self.assertEqual(stdout.getvalue(), fused.getvalue())
+
+
+class ConcurrentCompilation(unittest.TestCase):
+    def test_threads(self):
+        folder = "./examples/"
+        sources = [open(folder + i).read() for i in sorted(os.listdir(folder))
+                   if "email" in i and i.endswith(".lya")]
+        expected = [compile_source(source).text for source in sources]
+        errors = []
+
+        def compile_all():
+            try:
+                for n in range(10):
+                    for source, text in zip(sources, expected):
+                        if compile_source(source).text != text:
+                            errors.append("different code for:\n" + source)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=compile_all) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual([], errors)
+
+
+class BatchCompilation(unittest.TestCase):
+    def test_pool(self):
+        folder = "./examples/"
+        files = [folder + i for i in sorted(os.listdir(folder)) if "email" in i and i.endswith(".lya")]
+        output_dir = tempfile.mkdtemp()
+        try:
+            results = compile_batch(files, output_dir, jobs=2, timeout=60, cache_dir=False)
+            self.assertEqual(files, [r[0] for r in results])
+            for source_file, seconds, error, size, hit in results:
+                self.assertEqual(None, error)
+                with open(source_file) as f:
+                    program = compile_source(f.read())
+                with open(os.path.join(output_dir, os.path.basename(source_file) + ".o"), "rb") as f:
+                    self.assertEqual(lya_bytecode.dumps(program.H, program.text), f.read())
+        finally:
+            shutil.rmtree(output_dir)
+
+
+class CompilationCache(unittest.TestCase):
+    source = "dcl x int = 2;\nprint(x * 3);\n"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hit(self):
+        cache = CompileCache(self.directory)
+        program = compile_source(self.source, cache)
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+        cached = compile_source(self.source, cache)
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        self.assertEqual(program.text, cached.text)
+        compile_source(self.source + "print(x);\n", cache)
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+    def test_error(self):
+        cache = CompileCache(self.directory)
+        source = "dcl x int;\nx = y;\n"
+        with self.assertRaises(DefinitionError) as first:
+            compile_source(source, cache)
+        with self.assertRaises(DefinitionError) as second:
+            compile_source(source, cache)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(str(first.exception), str(second.exception))
+
+    def test_syntax_error(self):
+        # the errors printed by the parser are not cached, the source is parsed again
+        cache = CompileCache(self.directory)
+        source = "dcl x int;\nx = ;\nprint(x);\n"
+        for n in range(2):
+            stdout = sys.stdout
+            sys.stdout = StringIO()
+            try:
+                with self.assertRaises(CompilerException):
+                    compile_source(source, cache)
+                printed = sys.stdout.getvalue()
+            finally:
+                sys.stdout = stdout
+            self.assertIn("Syntax error in input!", printed)
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_write_without_scan(self):
+        cache = CompileCache(self.directory)
+        evicted = []
+        cache.evict = lambda: evicted.append(1)
+        for n in range(3):
+            compile_source("print(%d);\n" % n, cache)
+        self.assertEqual([], evicted)
+        size = sum(os.path.getsize(os.path.join(self.directory, name)) for name in os.listdir(self.directory))
+        self.assertEqual(size, cache._size)
+        cache.max_size = size
+        compile_source("print(3);\n", cache)
+        self.assertEqual([1], evicted)
+
+    def test_eviction(self):
+        sources = ["print(%d);\n" % n for n in range(3)]
+        cache = CompileCache(self.directory)
+        compile_source(sources[0], cache)
+        cache.max_size = 2 * os.path.getsize(os.path.join(self.directory, os.listdir(self.directory)[0]))
+        compile_source(sources[1], cache)
+        time.sleep(0.01)
+        # the first one becomes the most recently used
+        compile_source(sources[0], cache)
+        time.sleep(0.01)
+        compile_source(sources[2], cache)
+        self.assertEqual(2, len(os.listdir(self.directory)))
+        hits = cache.hits
+        compile_source(sources[0], cache)
+        compile_source(sources[2], cache)
+        self.assertEqual(hits + 2, cache.hits)
+        compile_source(sources[1], cache)
+        self.assertEqual(hits + 2, cache.hits)
+
+    def test_compiler_modules(self):
+        # the generated tables change the AST and the superinstructions too
+        for name in ('lya_tables', 'lya_parsetab', 'lya_lalr', 'lya_errors', 'lya_fusetab'):
+            self.assertIn(name, lya_cache.COMPILER_MODULES)
+
+
 class CodeGeneration(unittest.TestCase):
     def test_all(self):
         diff_set = set()
 
         folder = "./examples/"
         resps_folder = "./examples/resps/"
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
         files = os.listdir(folder)
         for i in files:
             if "email" in i and ".lya" in i and not ".o" in i:
-                sys.argv = ['./compiler.py', folder + i, '-o', folder + i + ".o"]
+                sys.argv = ['./compiler.py', '-no-cache', folder + i, '-text', '-o', os.path.join(output_dir, i + ".o")]
                 print fit("running: " + i)
                 m = LyaCompiler()
                 m.run()
                 print fit("")
 
-        from lya_ast import cp
-        from lya_codeprinter import CodePrinter
-        global cp
-        cp = CodePrinter()
-
 
         for i in files:
             if "email" in i and ".lya" in i and not ".o" in i:
                 import ast
                 import re
-                output_file = folder + i + ".o"
+                output_file = os.path.join(output_dir, i + ".o")
                 resp_file = resps_folder + i.replace(".lya", ".out")
 
                 print fit("comparing: " + i)
@@ -128,5 +809,127 @@ class CodeGeneration(unittest.TestCase):
         print "the files with problems are:", ", ".join(list(diff_set))
         print fit("")
 
+    def test_parameter_addresses(self):
+        # the loc and array parameters hold the address of their location,
+        # they give it to the procedures they call
+        source = ("type vector = array[1:3] int;\ndcl a vector, n int = 1;\n"
+                  "set: proc (k int loc, v vector);\n  v[k] = 7;\n  k = k + 1;\nend;\n"
+                  "pass: proc (k int loc, v vector);\n  set(k, v);\n  v[k] = v[1] + 1;\nend;\n"
+                  "pass(n, a);\nprint(n, a[1], a[2]);\n")
+        stdout = StringIO()
+        compile_source(source).run(stdout=stdout)
+        self.assertEqual("2\n7\n8\n", stdout.getvalue())
+        stdout = StringIO()
+        compile_source(open("./examples/email9.lya").read()).run(StringIO("5 3 7 2 9 1 4 5 6 7\n"), stdout)
+        self.assertEqual("42\n", stdout.getvalue())
+
+    def test_division(self):
+        # '/' was compiled as a subtraction
+        program = compile_source("dcl a int = 17;\nprint(a / 5, a % 5);\n")
+        self.assertIn(('div',), program.text)
+        self.assertNotIn(('sub',), program.text)
+        stdout = StringIO()
+        program.run(stdout=stdout)
+        self.assertEqual("3\n2\n", stdout.getvalue())
+
+    def test_synonyms(self):
+        # the synonyms are constants, also in the bounds of the arrays
+        source = ("syn a = 42, b char = 'b', c = \"hello\", d = true, n = -a / 5 + 2 * 6;\n"
+                  "dcl v array[2:n] int;\nprint(a, b, d, n, length(v), upper(v));\n")
+        program = compile_source(source)
+        self.assertNotIn(('ldv', 0, None), program.text)
+        stdout = StringIO()
+        program.run(stdout=stdout)
+        self.assertEqual("42\nb\nTrue\n3\n2\n3\n", stdout.getvalue())
+        stdout = StringIO()
+        compile_source(open("./examples/example12.lya").read()).run(StringIO("5 7\n"), stdout)
+        self.assertEqual("12\n", stdout.getvalue())
+
+    def test_many_indexes(self):
+        # the values are stored by rows
+        source = ("dcl a array[1:3, 0:4] int, i, j int;\n"
+                  "do\n  for i = 1 to 3;\n    do\n      for j = 0 to 4;\n        a[i, j] = i * 10 + j;\n    od;\nod;\n"
+                  "a[2, 3] += 100;\nprint(a[1, 0], a[2, 3], a[3, 4], length(a), i, j);\n")
+        program = compile_source(source)
+        self.assertEqual(('alc', 17), program.text[1])
+        stdout = StringIO()
+        program.run(stdout=stdout)
+        self.assertEqual("10\n123\n34\n15\n4\n5\n", stdout.getvalue())
+
+    def test_slices(self):
+        source = ("dcl a, b array[2:9] int, i int;\ndo\n  for i = 2 to 9;\n    a[i] = i * i;\nod;\n"
+                  "b = a;\nb[2:5] = a[6:9];\nprint(a[3:6], b[2:5], b[6], length(b));\n")
+        stdout = StringIO()
+        compile_source(source).run(stdout=stdout)
+        self.assertEqual("[9, 16, 25, 36]\n[36, 49, 64, 81]\n36\n8\n", stdout.getvalue())
+
+    def test_loc_results(self):
+        # the procedures that return a loc return its address
+        source = ("dcl a int = 5, x, y int;\n"
+                  "p: proc (b bool) return (int loc);\n  if b then\n    result x;\n  else\n    result y;\n  fi;\nend;\n"
+                  "p(true) = 7;\np(false) = a + 1;\np(true) += 3;\na = p(false) * 2;\nprint(a, x, y, p(true));\n")
+        stdout = StringIO()
+        compile_source(source).run(stdout=stdout)
+        self.assertEqual("12\n10\n6\n10\n", stdout.getvalue())
+        stdout = StringIO()
+        compile_source(open("./examples/email12.lya").read()).run(stdout=stdout)
+        self.assertEqual("10\n20\n", stdout.getvalue())
+
+    def test_conditional_expressions(self):
+        source = ("dcl a, b int;\ndo\n  for a = 1 to 3;\n"
+                  "    b = 1 + (if a > 2 then 10 elsif a > 1 then 20 else 30 fi);\n"
+                  "    print(b, if a == 1 then a * 5 else 0 fi);\nod;\n")
+        for optimized in (False, True):
+            program = compile_source(source, optimized=optimized)
+            for engine in Interpreter.ENGINES:
+                stdout = StringIO()
+                program.run(stdout=stdout, engine=engine)
+                self.assertEqual("31\n5\n21\n0\n11\n0\n", stdout.getvalue())
+
+    def test_do_without_control(self):
+        # jumped to a label that was never placed
+        source = "dcl a int = 3;\nl: do\n  a -= 1;\n  if a < 0 then exit l; fi;\n  print(a);\nod;\nprint(9);\n"
+        for optimized in (False, True):
+            program = compile_source(source, optimized=optimized)
+            for engine in Interpreter.ENGINES:
+                stdout = StringIO()
+                program.run(stdout=stdout, engine=engine)
+                self.assertEqual("2\n1\n0\n9\n", stdout.getvalue())
+
+    def test_references(self):
+        source = ("dcl i, j int, r ref int;\nset: proc (y ref int, v int);\n  y-> = v;\nend;\n"
+                  "inc: proc (k int loc);\n  k += 1;\nend;\n"
+                  "r = -> i;\nr-> = 5;\nj = r-> + 1;\nr-> += 10;\nset(-> j, j * 2);\ninc(r->);\nprint(i, j, r->);\n")
+        stdout = StringIO()
+        compile_source(source).run(stdout=stdout)
+        self.assertEqual("16\n12\n16\n", stdout.getvalue())
+
+    def test_array_results(self):
+        source = ("type vector = array[1:3] int;\ndcl a, b vector, i int;\n"
+                  "scale: proc (v vector, k int) returns (vector);\n  dcl w vector, i int;\n"
+                  "  do\n    for i = 1 to 3;\n      w[i] = v[i] * k;\n  od;\n  result w;\nend;\n"
+                  "do\n  for i = 1 to 3;\n    a[i] = i;\nod;\nb = scale(a, 10);\nprint(b[1], b[3], scale(b, 2));\n")
+        stdout = StringIO()
+        compile_source(source).run(stdout=stdout)
+        self.assertEqual("10\n30\n[20, 40, 60]\n", stdout.getvalue())
+
+    def test_array_parameter_copies(self):
+        # an array parameter holds the address, the copies are of the whole array
+        source = ("type vector = array[1:3] int;\ndcl a, b vector;\n"
+                  "copy: proc (w vector) returns (vector);\n  b = w;\n  result w;\nend;\n"
+                  "a[1] = 4;\na[3] = 6;\nprint(copy(a), b[3]);\n")
+        stdout = StringIO()
+        compile_source(source).run(stdout=stdout)
+        self.assertEqual("[4, 0, 6]\n6\n", stdout.getvalue())
+
+    def test_array_mode_parameters(self):
+        # given by address as the parameters of a mode name
+        source = ("dcl a, b array[1:3] int;\n"
+                  "copy: proc (w array[1:3] int);\n  b = w;\n  w[1] = w[2] + 1;\nend;\n"
+                  "a[2] = 5;\ncopy(a);\nprint(a[1], b[2]);\n")
+        stdout = StringIO()
+        compile_source(source).run(stdout=stdout)
+        self.assertEqual("6\n5\n", stdout.getvalue())
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file